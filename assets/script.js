@@ -24,6 +24,12 @@ function clearCharacter() {
   localStorage.removeItem('characterName');
 }
 
+// Who sees what: character -> clue type / ghost -> access level.
+// Edit data/access_levels.json and run scripts/access_levels.py, not this block.
+// BEGIN GENERATED ACCESS TABLE (scripts/access_levels.py, source: data/access_levels.json)
+const ACCESS_TABLE = {"default":"LIMITED","clues":{"artcollector":{"artifacts":"FULL","rumors":"PARTIAL"},"baker":{"botanical":"PARTIAL","rumors":"PARTIAL"},"clockmaker":{"rumors":"PARTIAL"},"doctor":{"medical":"FULL","rumors":"PARTIAL"},"dressmaker":{"rumors":"PARTIAL"},"explorer":{"artifacts":"PARTIAL","botanical":"PARTIAL","rumors":"PARTIAL"},"fiduciary":{"botanical":"PARTIAL","documents":"FULL","rumors":"PARTIAL"},"heiress":{"artifacts":"PARTIAL","rumors":"FULL"},"influencer":{"rumors":"FULL"},"mortician":{"documents":"PARTIAL","medical":"PARTIAL","rumors":"PARTIAL"},"professor":{"botanical":"FULL","medical":"PARTIAL","rumors":"PARTIAL"},"psychic":{"rumors":"PARTIAL"}},"visions":{"baker":{"alice":"PARTIAL","cordelia":"PARTIAL","sebastian":"PARTIAL"},"clockmaker":{"alice":"GOD_HELMET","cordelia":"GOD_HELMET","sebastian":"GOD_HELMET"},"doctor":{"sebastian":"FULL"},"dressmaker":{"cordelia":"FULL"},"explorer":{"alice":"FULL"},"psychic":{"alice":"FULL","cordelia":"FULL","sebastian":"FULL"}}};
+// END GENERATED ACCESS TABLE
+
 /**
  * Get the access level for a character viewing a vision
  * @param {string} characterName - The character name
@@ -31,37 +37,7 @@ function clearCharacter() {
  * @returns {string} 'FULL', 'PARTIAL', 'GOD_HELMET', or 'LIMITED'
  */
 function getVisionAccessLevel(characterName, visionName) {
-  // Define access levels for each vision
-  const accessLevels = {
-    alice: {
-      FULL: ['psychic', 'explorer'],
-      PARTIAL: ['baker'],
-      GOD_HELMET: ['clockmaker']
-    },
-    cordelia: {
-      FULL: ['psychic', 'dressmaker'],
-      PARTIAL: ['baker'],
-      GOD_HELMET: ['clockmaker']
-    },
-    sebastian: {
-      FULL: ['psychic', 'doctor'],
-      PARTIAL: ['baker'],
-      GOD_HELMET: ['clockmaker']
-    }
-  };
-
-  const visionAccess = accessLevels[visionName] || {};
-  
-  if (visionAccess.FULL && visionAccess.FULL.includes(characterName)) {
-    return 'FULL';
-  }
-  if (visionAccess.PARTIAL && visionAccess.PARTIAL.includes(characterName)) {
-    return 'PARTIAL';
-  }
-  if (visionAccess.GOD_HELMET && visionAccess.GOD_HELMET.includes(characterName)) {
-    return 'GOD_HELMET';
-  }
-  return 'LIMITED';
+  return (ACCESS_TABLE.visions[characterName] || {})[visionName] || ACCESS_TABLE.default;
 }
 
 /**
@@ -71,39 +47,7 @@ function getVisionAccessLevel(characterName, visionName) {
  * @returns {string} 'FULL', 'PARTIAL', or 'LIMITED'
  */
 function getClueAccessLevel(characterName, clueType) {
-  // Define access levels for each clue type
-  const accessLevels = {
-    rumors: {
-      FULL: ['heiress', 'influencer'],
-      PARTIAL: ['psychic', 'baker', 'clockmaker', 'dressmaker', 'explorer', 'fiduciary', 'mortician', 'professor', 'doctor', 'artcollector']
-    },
-    botanical: {
-      FULL: ['professor'],
-      PARTIAL: ['fiduciary', 'explorer', 'baker']
-    },
-    medical: {
-      FULL: ['doctor'],
-      PARTIAL: ['mortician', 'professor']
-    },
-    documents: {
-      FULL: ['fiduciary'],
-      PARTIAL: ['mortician']
-    },
-    artifacts: {
-      FULL: ['artcollector'],
-      PARTIAL: ['explorer', 'heiress']
-    }
-  };
-
-  const clueAccess = accessLevels[clueType] || {};
-  
-  if (clueAccess.FULL && clueAccess.FULL.includes(characterName)) {
-    return 'FULL';
-  }
-  if (clueAccess.PARTIAL && clueAccess.PARTIAL.includes(characterName)) {
-    return 'PARTIAL';
-  }
-  return 'LIMITED';
+  return (ACCESS_TABLE.clues[characterName] || {})[clueType] || ACCESS_TABLE.default;
 }
 
 /**
@@ -192,3 +136,166 @@ function formatEntryDate(dateString) {
   
   return dateString;
 }
+
+// Full-text search over data/search/ (built by scripts/build_search_index.py).
+// searchTokenize and searchStem must match tokenize() and stem() in that script.
+
+const SEARCH_SUFFIX_RULES = [
+  ['sses', 'ss'], ['ies', 'y'], ['ingly', ''], ['edly', ''],
+  ['ing', ''], ['ed', ''], ['ly', ''], ['s', '']
+];
+
+let searchIndex = null;
+const searchShards = {};
+
+/**
+ * Reduce a word to its search stem (light English suffix stripping)
+ * @param {string} word - A lowercase word
+ * @returns {string} The stem
+ */
+function searchStem(word) {
+  for (const [suffix, replacement] of SEARCH_SUFFIX_RULES) {
+    if (word.endsWith(suffix) && word.length - suffix.length + replacement.length >= 3) {
+      if (suffix === 's' && /(ss|us|is)$/.test(word)) break;
+      word = word.slice(0, word.length - suffix.length) + replacement;
+      break;
+    }
+  }
+  if (word.length > 3 && word.endsWith('e')) {
+    word = word.slice(0, -1);
+  }
+  const last = word[word.length - 1];
+  if (word.length > 3 && last === word[word.length - 2] && !'aeiouslz'.includes(last)) {
+    word = word.slice(0, -1);
+  }
+  return word;
+}
+
+/**
+ * Split text into search terms with their word positions
+ * @param {string} text - Text to tokenize
+ * @param {Set<string>} stopwords - Words that take a position but are not searched
+ * @returns {Array<{position: number, term: string}>} The terms
+ */
+function searchTokenize(text, stopwords) {
+  const words = text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g, '').match(/[a-z0-9]+/g) || [];
+  const tokens = [];
+  words.forEach((word, position) => {
+    if (word.length > 1 && !stopwords.has(word)) {
+      tokens.push({ position, term: searchStem(word) });
+    }
+  });
+  return tokens;
+}
+
+/**
+ * Which index shard holds a term (djb2 hash)
+ * @param {string} term - A stemmed term
+ * @param {number} shards - Number of shards
+ * @returns {number} The shard number
+ */
+function searchShardOf(term, shards) {
+  let value = 5381;
+  for (let i = 0; i < term.length; i++) {
+    value = (value * 33 + term.charCodeAt(i)) >>> 0;
+  }
+  return value % shards;
+}
+
+/**
+ * Load the search document list (cached after the first call)
+ * @param {string} baseUrl - Path from the current page to the site root (e.g. '../../')
+ * @returns {Promise<Object>} The index metadata
+ */
+async function loadSearchIndex(baseUrl = '') {
+  if (!searchIndex) {
+    const response = await fetch(baseUrl + 'data/search/index.json');
+    searchIndex = await response.json();
+    searchIndex.stopwordSet = new Set(searchIndex.stopwords);
+  }
+  return searchIndex;
+}
+
+/**
+ * Load one term shard and decode its postings (cached)
+ * @returns {Promise<Object>} term -> Map of doc number -> positions
+ */
+async function loadSearchShard(baseUrl, shard) {
+  if (!searchShards[shard]) {
+    searchShards[shard] = fetch(baseUrl + `data/search/terms_${shard}.json`)
+      .then(response => response.json())
+      .then(terms => {
+        const decoded = {};
+        for (const [term, flat] of Object.entries(terms)) {
+          const postings = new Map();
+          let i = 0;
+          while (i < flat.length) {
+            const doc = flat[i];
+            const count = flat[i + 1];
+            const positions = [flat[i + 2]];
+            for (let k = 1; k < count; k++) {
+              positions.push(positions[k - 1] + flat[i + 2 + k]);
+            }
+            postings.set(doc, positions);
+            i += 2 + count;
+          }
+          decoded[term] = postings;
+        }
+        return decoded;
+      });
+  }
+  return searchShards[shard];
+}
+
+/**
+ * Search the book and clues. All words must match; words in "double quotes"
+ * must appear together as a phrase.
+ * @param {string} query - What the player typed (e.g. 'foxglove "heart failure"')
+ * @param {Object} [options]
+ * @param {string} [options.baseUrl] - Path from the current page to the site root
+ * @param {number} [options.limit] - Maximum number of results (default 20)
+ * @returns {Promise<Array<{url: string, title: string, excerpt: string, score: number}>>} Best matches first
+ */
+async function searchClues(query, options = {}) {
+  const baseUrl = options.baseUrl || '';
+  const limit = options.limit || 20;
+  const index = await loadSearchIndex(baseUrl);
+
+  // Quoted phrases keep their word offsets; everything else is a single word
+  const groups = [];
+  query.replace(/"([^"]*)"|([^\s"]+)/g, (match, phrase, word) => {
+    const tokens = searchTokenize(phrase !== undefined ? phrase : word, index.stopwordSet);
+    if (tokens.length > 0) groups.push(tokens);
+    return match;
+  });
+  if (groups.length === 0) return [];
+
+  const terms = [...new Set(groups.flat().map(token => token.term))];
+  const shards = await Promise.all(terms.map(term => loadSearchShard(baseUrl, searchShardOf(term, index.shards))));
+  const postings = {};
+  terms.forEach((term, i) => { postings[term] = shards[i][term] || new Map(); });
+
+  // Documents containing every term, rarest term first
+  const ordered = [...terms].sort((a, b) => postings[a].size - postings[b].size);
+  let candidates = [...postings[ordered[0]].keys()];
+  for (const term of ordered.slice(1)) {
+    candidates = candidates.filter(doc => postings[term].has(doc));
+  }
+
+  const results = [];
+  for (const doc of candidates) {
+    const isMatch = groups.every(tokens => tokens.length === 1 || postings[tokens[0].term].get(doc).some(start =>
+      tokens.every(token => postings[token.term].get(doc).includes(start + token.position - tokens[0].position))
+    ));
+    if (!isMatch) continue;
+
+    let score = 0;
+    for (const term of terms) {
+      score += postings[term].get(doc).length * Math.log(1 + index.docs.length / postings[term].size);
+    }
+    const [url, title, excerpt] = index.docs[doc];
+    results.push({ url: baseUrl + url, title, excerpt, score });
+  }
+
+  return results.sort((a, b) => b.score - a.score).slice(0, limit);
+}
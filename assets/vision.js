@@ -0,0 +1,83 @@
+// The Lost Souls of Kennebec Avenue Investigation System
+// Shared vision page logic (clue/vision/*.html)
+// Requires script.js to be loaded first
+
+/**
+ * Load a ghost's visions and show the next one for the current character
+ * @param {Object} config - Page settings
+ * @param {string} config.ghost - The ghost key in visions.json (e.g., 'alice')
+ * @param {string} config.fullTitle - Title shown to characters with FULL access
+ * @param {string} config.fullSubtitle - Subtitle shown to characters with FULL access
+ * @param {string} config.blockedMessage - Text shown to characters with LIMITED access
+ * @param {string} [config.dataUrl] - Path to visions.json
+ * @param {string} [config.indexUrl] - Where to send players without a character
+ */
+async function loadGhostVision(config) {
+  const dataUrl = config.dataUrl || '../../data/visions.json';
+  const indexUrl = config.indexUrl || '../../index.html';
+  const contentDiv = document.getElementById('visionContent');
+
+  try {
+    const response = await fetch(dataUrl + '?t=' + new Date().getTime());
+    const data = response.ok ? await response.json() : null;
+
+    if (!data) {
+      contentDiv.innerText = 'Error loading visions.';
+      return;
+    }
+
+    const ghostData = data.visions.find(ghost => ghost.ghost === config.ghost);
+
+    if (!ghostData) {
+      contentDiv.innerText = 'Vision data not found.';
+      return;
+    }
+
+    // Get current character
+    if (!checkCharacterSelected(indexUrl)) {
+      return;
+    }
+
+    const character = getCharacter();
+    const accessLevel = getVisionAccessLevel(character, config.ghost);
+
+    // Update title based on access level; otherwise keep the page's default
+    if (accessLevel === 'FULL') {
+      document.getElementById('ghostTitle').textContent = config.fullTitle;
+      document.getElementById('ghostSubtitle').textContent = config.fullSubtitle;
+    }
+
+    let visionText = '';
+    let visionNumber = 1;
+    const totalVisions = ghostData.full.length;
+
+    // Check for character-specific vision first
+    if (ghostData.character_specific && ghostData.character_specific[character]) {
+      visionText = ghostData.character_specific[character];
+      visionNumber = null; // Don't show vision number for character-specific
+    } else if (accessLevel === 'FULL') {
+      visionNumber = getNextVisionNumber(config.ghost, totalVisions);
+      visionText = ghostData.full[visionNumber - 1];
+    } else if (accessLevel === 'GOD_HELMET') {
+      visionNumber = getNextVisionNumber(config.ghost, totalVisions);
+      visionText = ghostData.mechanical[visionNumber - 1];
+    } else if (accessLevel === 'PARTIAL') {
+      visionNumber = getNextVisionNumber(config.ghost, totalVisions);
+      visionText = ghostData.partial[visionNumber - 1];
+    } else {
+      visionText = config.blockedMessage;
+    }
+
+    contentDiv.innerHTML = `<p>${visionText}</p>`;
+
+    if (accessLevel !== 'LIMITED' && visionNumber !== null) {
+      const visionNumberDiv = document.createElement('div');
+      visionNumberDiv.className = 'vision-number';
+      visionNumberDiv.textContent = `Vision ${visionNumber} of ${totalVisions}`;
+      contentDiv.appendChild(visionNumberDiv);
+    }
+  } catch (error) {
+    console.error(`Error loading ${config.ghost} visions:`, error);
+    contentDiv.innerHTML = '<p style="color: #ff6b6b;">Error loading visions. Check console.</p>';
+  }
+}
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Access Level Table for Murder Mystery Game
+The role matrix (who sees FULL / PARTIAL / GOD_HELMET content for each
+clue type and ghost) lives in data/access_levels.json. This script compiles
+it into a flat character -> clue type -> level table and writes it to the
+generated block at the top of assets/script.js; only the site reads it.
+Run it after editing data/access_levels.json.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+SOURCE_FILE = 'data/access_levels.json'
+SCRIPT_FILE = 'assets/script.js'
+
+# Levels in precedence order; a role listed twice gets the first match
+LEVEL_ORDER = ['FULL', 'PARTIAL', 'GOD_HELMET']
+
+BEGIN_MARKER = '// BEGIN GENERATED ACCESS TABLE'
+END_MARKER = '// END GENERATED ACCESS TABLE'
+GENERATED_BLOCK = re.compile(re.escape(BEGIN_MARKER) + r'.*?' + re.escape(END_MARKER), re.DOTALL)
+
+def compile_section(section):
+    """
+    Flatten {clue_type: {level: [characters]}} into {character: {clue_type: level}}
+    LIMITED entries are left out; a missing entry means the default level
+    """
+    flat = {}
+    for clue_type, levels in section.items():
+        for level in LEVEL_ORDER:
+            for character in levels.get(level, []):
+                flat.setdefault(character, {}).setdefault(clue_type, level)
+    return {character: dict(sorted(types.items())) for character, types in sorted(flat.items())}
+
+def compile_table(source):
+    """Compile the source matrix into the flat lookup table"""
+    return {
+        'default': source.get('default', 'LIMITED'),
+        'clues': compile_section(source.get('clues', {})),
+        'visions': compile_section(source.get('visions', {})),
+    }
+
+def render_js_block(table):
+    """The generated block that script.js embeds"""
+    return (
+        f"{BEGIN_MARKER} (scripts/access_levels.py, source: {SOURCE_FILE})\n"
+        f"const ACCESS_TABLE = {json.dumps(table, separators=(',', ':'))};\n"
+        f"{END_MARKER}"
+    )
+
+def load_table():
+    """Compile the source matrix"""
+    with open(SOURCE_FILE, 'r') as f:
+        return compile_table(json.load(f))
+
+def build(check=False):
+    """
+    Compile the table and update the generated block in script.js
+
+    Returns:
+        list of files that were (or, with check=True, would be) changed
+    """
+    table = load_table()
+    changed = []
+
+    script_path = Path(SCRIPT_FILE)
+    script = script_path.read_text(encoding='utf-8')
+    if not GENERATED_BLOCK.search(script):
+        raise ValueError(f"{SCRIPT_FILE} has no '{BEGIN_MARKER}' block")
+    updated = GENERATED_BLOCK.sub(lambda _: render_js_block(table), script)
+    if updated != script:
+        changed.append(SCRIPT_FILE)
+        if not check:
+            script_path.write_text(updated, encoding='utf-8')
+
+    return changed
+
+def print_role(character):
+    """Print everything one role can see"""
+    table = load_table()
+    print(f"\n🎭 {character}")
+    for section, title in (('clues', 'Clues'), ('visions', 'Visions')):
+        print(f"   {title}:")
+        levels = table[section].get(character, {})
+        for name in sorted({n for names in table[section].values() for n in names}):
+            print(f"     {name:<12} {levels.get(name, table['default'])}")
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Compile data/access_levels.json into the flat access table"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that the generated files are up to date (exit 1 if not)"
+    )
+    parser.add_argument(
+        "--role",
+        help="Print the access levels of one character (e.g. baker)"
+    )
+
+    args = parser.parse_args()
+
+    if args.role:
+        print_role(args.role)
+        return
+
+    changed = build(check=args.check)
+    if args.check:
+        if changed:
+            print(f"❌ Out of date: {', '.join(changed)} (run scripts/access_levels.py)")
+            sys.exit(1)
+        print("✅ Access table is up to date")
+        return
+
+    if changed:
+        for path in changed:
+            print(f"✓ Updated: {path}")
+    else:
+        print("✅ Access table already up to date")
+
+if __name__ == "__main__":
+    main()
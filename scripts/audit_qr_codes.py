@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+QR Code Reachability Audit for Murder Mystery Game
+Checks every qr_codes/*.png before a print run:
+- decodes the payload (with pyzbar/OpenCV if installed, in a process pool;
+  otherwise reads it from qr_codes/manifest.json)
+- flags codes whose payload differs from the manifest, points at another
+  base URL, or maps to a page that does not exist locally
+- lists pages that players should scan but that have no code
+Exits with status 1 if any code is dead or mismatched.
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from qr_decode import decode_file, decoder_name
+from qr_manifest import BASE_URL, infer_page_path, load_manifest, url_to_page_path
+from short_links import resolve_path
+
+# Directories whose pages are reached by scanning a code
+CODED_DIRS = ['character', 'clue/artifacts', 'clue/botanicals', 'clue/documents', 'clue/journals', 'clue/vision']
+
+# Pages in those directories that are reached by links, not codes
+UNCODED_PAGES = {'character/characters.html'}
+
+def decode_code(path):
+    """
+    Decode one PNG (runs in a worker process)
+
+    Returns:
+        (filename stem, list of payloads, error message or None)
+    """
+    try:
+        return Path(path).stem, decode_file(path), None
+    except Exception as e:
+        return Path(path).stem, [], str(e)
+
+def audit_codes(root: Path, qr_dir: Path, base_url, decode=True, jobs=None):
+    """
+    Audit every code in qr_dir
+
+    Returns:
+        list of dicts: name, url, path, source ('decoded'/'manifest'/'filename'), problem (None if fine)
+    """
+    manifest = load_manifest(str(qr_dir))['codes']
+    pngs = sorted(qr_dir.glob('*.png'))
+
+    decoded = {}
+    if decode:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for name, payloads, error in executor.map(decode_code, [str(png) for png in pngs], chunksize=4):
+                decoded[name] = (payloads, error)
+
+    results = []
+    for png in pngs:
+        name = png.stem
+        recorded = manifest.get(name, {}).get('url')
+        problem = None
+
+        if decode:
+            payloads, error = decoded[name]
+            if error or not payloads:
+                # The page still counts as coded: the problem is the PNG, reported once
+                recorded_path = manifest.get(name, {}).get('path')
+                results.append({'name': name, 'url': recorded, 'source': 'decoded',
+                                'path': resolve_path(root, recorded_path) if recorded_path else None,
+                                'problem': f"does not decode{': ' + error if error else ''}"})
+                continue
+            url, source = payloads[0], 'decoded'
+            if recorded and url != recorded:
+                problem = f"payload differs from manifest ({recorded})"
+        elif recorded:
+            url, source = recorded, 'manifest'
+        else:
+            path = infer_page_path(name)
+            url = f"{base_url.rstrip('/')}/{path}" if path else None
+            source = 'filename'
+            if url is None:
+                results.append({'name': name, 'url': None, 'path': None, 'source': source,
+                                'problem': "not in manifest and target cannot be inferred"})
+                continue
+
+        path = url_to_page_path(url, base_url)
+        # Short links (q/<id>.html) are checked through to the page they open
+        target = resolve_path(root, path) if path else None
+        if path is None:
+            problem = problem or f"points outside {base_url}"
+        elif target is None:
+            problem = problem or "short link is not in data/short_links.json"
+        elif target != path and not (root / path).is_file():
+            problem = problem or "redirect stub does not exist"
+        elif not (root / target.split('#')[0].split('?')[0]).is_file():
+            problem = problem or "page does not exist"
+        path = target
+        results.append({'name': name, 'url': url, 'path': path, 'source': source, 'problem': problem})
+    return results
+
+def pages_without_codes(root: Path, results):
+    """Scannable pages that no code points at"""
+    coded = {result['path'].split('#')[0] for result in results if result['path']}
+    missing = []
+    for directory in CODED_DIRS:
+        for page in sorted((root / directory).rglob('*.html')):
+            relative = page.relative_to(root).as_posix()
+            if relative not in coded and relative not in UNCODED_PAGES and page.name != 'template.html':
+                missing.append(relative)
+    return missing
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Check that every QR code resolves to an existing page"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--qr-dir",
+        default="qr_codes",
+        help="Directory containing QR code PNG files (default: qr_codes)"
+    )
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help=f"Base URL the codes should point at (default: {BASE_URL})"
+    )
+    parser.add_argument(
+        "--manifest-only",
+        action="store_true",
+        help="Do not decode the PNGs; trust qr_codes/manifest.json"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for decoding (default: one per CPU)"
+    )
+
+    args = parser.parse_args()
+    root = Path(args.root).resolve()
+    qr_dir = root / args.qr_dir
+
+    decoder = None if args.manifest_only else decoder_name()
+    if not args.manifest_only and decoder is None:
+        print("⚠️  No QR decoder installed (pip install pyzbar or opencv-python-headless);")
+        print("   checking the payloads recorded in the manifest instead\n")
+
+    results = audit_codes(root, qr_dir, args.base_url, decode=decoder is not None, jobs=args.jobs)
+    problems = [result for result in results if result['problem']]
+    uncoded = pages_without_codes(root, results)
+
+    print("="*70)
+    print("📱 QR Code Reachability Audit")
+    print("="*70)
+    print(f"🔗 Base URL: {args.base_url}")
+    print(f"🔍 Payloads: {'decoded with ' + decoder if decoder else 'read from manifest'}")
+    print(f"📦 Codes checked: {len(results)}")
+
+    if problems:
+        print(f"\n❌ DEAD OR MISMATCHED CODES ({len(problems)}):")
+        for result in problems:
+            print(f"   {result['name']}: {result['problem']}")
+            if result['url']:
+                print(f"      {result['url']}")
+    if uncoded:
+        print(f"\n⚠️  PAGES WITHOUT A CODE ({len(uncoded)}):")
+        for page in uncoded:
+            print(f"   {page}")
+
+    print("\n" + "="*70)
+    if problems:
+        print(f"❌ {len(problems)} of {len(results)} codes will not open a page")
+    else:
+        print(f"✅ All {len(results)} codes open an existing page")
+    print("="*70)
+
+    sys.exit(1 if problems else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Asset Build for the Murder Mystery site
+Writes a deployable copy of the site to dist/ with:
+- assets/*.js minified, and pages that load script.js + vision.js pointed
+  at one bundled file so a scan costs a single cached request
+- assets/style.css minified; each page gets the rules it actually uses
+  inlined as critical CSS, with the full stylesheet loaded without blocking
+  (pages that need most of the sheet just link it)
+- inline <script>/<style> blocks minified, data JSON compacted
+Serve the result with: python scripts/serve_local.py --root dist
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+
+# Directories that are never served to players
+SKIP_DIRS = {'.git', 'scripts', 'to_print', '__pycache__', 'node_modules', 'dist', 'logs'}
+
+# Files in the tree that are not part of the site
+SKIP_SUFFIXES = {'.md', '.py', '.pyc', '.jsonl', '.gz', '.br'}
+
+# Script sequences served as one bundle: (sources in load order) -> bundle name
+BUNDLES = {
+    ('script.js', 'vision.js'): 'vision.bundle.min.js',
+}
+
+# Selectors that apply to every page
+ALWAYS_CRITICAL = {'*', 'html', 'body', ':root'}
+
+# Above this share of the stylesheet, inlining costs more than the request
+# it saves (the full sheet is loaded as well), so the page just links it
+MAX_CRITICAL_FRACTION = 0.25
+
+IDENTIFIER_CHARS = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$')
+
+# After these characters a '/' starts a regex literal, not a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^') | {''}
+
+SCRIPT_TAG = re.compile(r'<script src="([^"]*?)assets/([\w.-]+\.js)"></script>')
+STYLESHEET_TAG = re.compile(r'<link rel="stylesheet" href="([^"]*?)assets/style\.css">')
+INLINE_SCRIPT = re.compile(r'(<script>)(.*?)(</script>)', re.DOTALL)
+INLINE_STYLE = re.compile(r'(<style>)(.*?)(</style>)', re.DOTALL)
+HTML_COMMENT = re.compile(r'<!--(?!\[).*?-->', re.DOTALL)
+
+# class="..." / id="..." in markup, and in HTML strings inside scripts (class=\"...\")
+CLASS_ATTRIBUTE = re.compile(r'''\bclass\s*=\s*\\?["']([^"'\\]*)''')
+ID_ATTRIBUTE = re.compile(r'''\bid\s*=\s*\\?["']([^"'\\]*)''')
+# element.className = '...' and element.classList.add('...', ...)
+CLASS_NAME_ASSIGNMENT = re.compile(r'''\.className\s*\+?=\s*["']([^"']*)''')
+CLASS_LIST_CALL = re.compile(r'''\.classList\.(?:add|toggle|replace)\(([^)]*)\)''')
+
+def minify_js(source):
+    """
+    Conservative JavaScript minifier: strips comments and indentation,
+    collapses whitespace, and keeps line breaks wherever automatic
+    semicolon insertion might depend on them. Strings, template literals
+    and regex literals are copied verbatim.
+    """
+    out = []
+    i = 0
+    n = len(source)
+    pending_space = False
+    pending_newline = False
+
+    def last_char():
+        return out[-1][-1] if out else ''
+
+    def flush_whitespace(next_char):
+        nonlocal pending_space, pending_newline
+        prev = last_char()
+        if pending_newline and prev and prev not in '{(,;[' and next_char not in '})],;.:?':
+            out.append('\n')
+        elif pending_space and prev in IDENTIFIER_CHARS and next_char in IDENTIFIER_CHARS:
+            out.append(' ')
+        elif pending_space and prev in '+-' and next_char == prev:
+            # a + +b, a - -b
+            out.append(' ')
+        pending_space = pending_newline = False
+
+    while i < n:
+        char = source[i]
+
+        if char in ' \t\r\n':
+            if char == '\n':
+                pending_newline = True
+            pending_space = True
+            i += 1
+            continue
+
+        if source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end == -1 else end
+            continue
+
+        if source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            pending_space = True
+            continue
+
+        flush_whitespace(char)
+
+        if char in '\'"`':
+            # String or template literal
+            j = i + 1
+            while j < n and source[j] != char:
+                j += 2 if source[j] == '\\' else 1
+            out.append(source[i:j + 1])
+            i = j + 1
+            continue
+
+        if char == '/' and (last_char() in REGEX_PRECEDERS or ''.join(out[-6:]).endswith(('return', 'typeof'))):
+            # Regex literal
+            j = i + 1
+            in_class = False
+            while j < n:
+                if source[j] == '\\':
+                    j += 2
+                    continue
+                if source[j] == '[':
+                    in_class = True
+                elif source[j] == ']':
+                    in_class = False
+                elif source[j] == '/' and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < n and source[j] in IDENTIFIER_CHARS:
+                j += 1  # flags
+            out.append(source[i:j])
+            i = j
+            continue
+
+        out.append(char)
+        i += 1
+
+    return ''.join(out).strip()
+
+def minify_css(source):
+    """Strip comments and whitespace from a stylesheet"""
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.DOTALL)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    source = source.replace(';}', '}')
+    return source.strip()
+
+def split_css_rules(css):
+    """
+    Split minified CSS into top-level (selector, block) pairs;
+    at-rules keep their whole nested block
+    """
+    rules = []
+    depth = 0
+    start = 0
+    selector_end = None
+    for index, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                selector_end = index
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                rules.append((css[start:selector_end], css[selector_end:index + 1]))
+                start = index + 1
+    return rules
+
+def selector_matches(selector, html_text, class_names, id_names):
+    """True if every tag/class/id a selector needs appears in the page"""
+    selector = selector.strip()
+    if selector in ALWAYS_CRITICAL:
+        return True
+    # Pseudo-classes/elements do not change whether the element exists
+    selector = re.sub(r'::?[\w-]+(\([^)]*\))?', '', selector)
+    for class_name in re.findall(r'\.([\w-]+)', selector):
+        if class_name not in class_names:
+            return False
+    for id_name in re.findall(r'#([\w-]+)', selector):
+        if id_name not in id_names:
+            return False
+    for tag in re.findall(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)', selector):
+        if f'<{tag.lower()}' not in html_text:
+            return False
+    return True
+
+def page_names(html_text):
+    """
+    Class names and ids a page can give its elements
+
+    Returns:
+        (set of class names, set of ids)
+    """
+    classes = set()
+    for value in CLASS_ATTRIBUTE.findall(html_text) + CLASS_NAME_ASSIGNMENT.findall(html_text):
+        classes.update(value.split())
+    for arguments in CLASS_LIST_CALL.findall(html_text):
+        classes.update(re.findall(r'''["']([\w-]+)["']''', arguments))
+    ids = {value.strip() for value in ID_ATTRIBUTE.findall(html_text)}
+    return classes, ids
+
+def critical_css(css, html_text):
+    """Rules of css that can apply to elements in html_text"""
+    class_names, id_names = page_names(html_text)
+    kept = []
+    for selector, block in split_css_rules(css):
+        if selector.startswith('@'):
+            kept.append(selector + block)
+            continue
+        matching = [s for s in selector.split(',') if selector_matches(s, html_text, class_names, id_names)]
+        if matching:
+            kept.append(','.join(matching) + block)
+    return ''.join(kept)
+
+def is_served(path: Path, root: Path):
+    relative = path.relative_to(root)
+    if any(part in SKIP_DIRS or part.startswith('.') for part in relative.parts[:-1]):
+        return False
+    return not relative.name.startswith('.') and path.suffix.lower() not in SKIP_SUFFIXES
+
+def build_bundles(root: Path, dist: Path):
+    """Minify every assets/*.js and write the bundles; returns sizes"""
+    assets = root / 'assets'
+    out_assets = dist / 'assets'
+    out_assets.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    minified = {}
+    for script in sorted(assets.glob('*.js')):
+        minified[script.name] = minify_js(script.read_text(encoding='utf-8'))
+        target = out_assets / script.name.replace('.js', '.min.js')
+        target.write_text(minified[script.name] + '\n', encoding='utf-8')
+        sizes[script.name] = (script.stat().st_size, target.stat().st_size)
+    for sources, bundle_name in BUNDLES.items():
+        bundle = ';\n'.join(minified[name] for name in sources)
+        target = out_assets / bundle_name
+        target.write_text(bundle + '\n', encoding='utf-8')
+        original = sum((assets / name).stat().st_size for name in sources)
+        sizes[bundle_name] = (original, target.stat().st_size)
+
+    css = minify_css((assets / 'style.css').read_text(encoding='utf-8'))
+    (out_assets / 'style.min.css').write_text(css + '\n', encoding='utf-8')
+    sizes['style.css'] = ((assets / 'style.css').stat().st_size, len(css) + 1)
+    return css, sizes
+
+def rewrite_scripts(html_text):
+    """Point <script src> tags at minified files, merging bundled sequences"""
+    tags = list(SCRIPT_TAG.finditer(html_text))
+    names = tuple(match.group(2) for match in tags)
+    for sources, bundle_name in BUNDLES.items():
+        for start in range(len(names) - len(sources) + 1):
+            if names[start:start + len(sources)] == sources:
+                first, last = tags[start], tags[start + len(sources) - 1]
+                replacement = f'<script src="{first.group(1)}assets/{bundle_name}"></script>'
+                return html_text[:first.start()] + replacement + rewrite_scripts(html_text[last.end():])
+    return SCRIPT_TAG.sub(
+        lambda m: f'<script src="{m.group(1)}assets/{m.group(2).replace(".js", ".min.js")}"></script>',
+        html_text,
+    )
+
+def rewrite_stylesheet(html_text, css):
+    """
+    Inline the critical rules and load the full stylesheet without
+    blocking rendering; if most of the sheet is critical, just link it
+    """
+    def replace(match):
+        href = f'{match.group(1)}assets/style.min.css'
+        critical = critical_css(css, html_text)
+        if len(critical) > MAX_CRITICAL_FRACTION * len(css):
+            return f'<link rel="stylesheet" href="{href}">'
+        return (
+            f'<style>{critical}</style>'
+            f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>'
+        )
+    return STYLESHEET_TAG.sub(replace, html_text)
+
+def build_page(html_text, css):
+    """Rewrite one HTML page for dist/"""
+    html_text = HTML_COMMENT.sub('', html_text)
+    html_text = INLINE_SCRIPT.sub(lambda m: m.group(1) + minify_js(m.group(2)) + m.group(3), html_text)
+    html_text = INLINE_STYLE.sub(lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), html_text)
+    html_text = rewrite_scripts(html_text)
+    return rewrite_stylesheet(html_text, css)
+
+def build_site(root=".", dist="dist"):
+    """Build the minified site into dist/ and print a size summary"""
+    root = Path(root).resolve()
+    dist = Path(dist).resolve()
+
+    print("="*70)
+    print("📦 Building minified site")
+    print(f"   {root} -> {dist}")
+    print("="*70 + "\n")
+
+    if dist.exists():
+        shutil.rmtree(dist)
+    css, asset_sizes = build_bundles(root, dist)
+
+    html_before = html_after = json_before = json_after = 0
+    pages = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.')]
+        for filename in filenames:
+            source = Path(dirpath) / filename
+            if not is_served(source, root):
+                continue
+            relative = source.relative_to(root)
+            target = dist / relative
+            if relative.parts[0] == 'assets' and source.suffix in ('.js', '.css'):
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if source.suffix == '.html':
+                text = source.read_text(encoding='utf-8')
+                built = build_page(text, css)
+                target.write_text(built, encoding='utf-8')
+                html_before += len(text.encode('utf-8'))
+                html_after += len(built.encode('utf-8'))
+                pages += 1
+            elif source.suffix == '.json':
+                text = source.read_text(encoding='utf-8')
+                try:
+                    built = json.dumps(json.loads(text), ensure_ascii=False, separators=(',', ':'))
+                except json.JSONDecodeError:
+                    built = text
+                target.write_text(built, encoding='utf-8')
+                json_before += len(text.encode('utf-8'))
+                json_after += len(built.encode('utf-8'))
+            else:
+                shutil.copy2(source, target)
+
+    for name, (before, after) in asset_sizes.items():
+        print(f"  assets/{name:<28} {before:>8} B -> {after:>8} B")
+    print(f"  {pages} HTML pages{'':<20} {html_before:>8} B -> {html_after:>8} B (critical CSS inlined where small)")
+    print(f"  data JSON{'':<24} {json_before:>8} B -> {json_after:>8} B")
+
+    print("\n" + "="*70)
+    print(f"✅ Site built in {dist}")
+    print("   Next: python scripts/precompress_assets.py --root dist")
+    print("="*70)
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Build a minified, bundled copy of the site into dist/"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--output",
+        default="dist",
+        help="Output directory (default: dist)"
+    )
+
+    args = parser.parse_args()
+    build_site(args.root, args.output)
+
+if __name__ == "__main__":
+    main()
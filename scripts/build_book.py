@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Book Chapter Builder for Murder Mystery Game
+Renders every chapter of the online book, in every language, from
+data/book*/ JSON and book/_chapter_template.html into fully static pages
+(book/, book_ru/, ...). The entries are in the HTML, so readers get the
+chapter without a runtime fetch.
+Chapters and languages are listed in data/book_languages.json: adding a
+language is one entry there plus its data directory, then one build.
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+CONFIG_FILE = 'data/book_languages.json'
+TEMPLATE_FILE = 'book/_chapter_template.html'
+
+PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
+
+# Paragraphs are separated by blank lines, as in the JSON content
+PARAGRAPH_BREAK = re.compile(r'\n\n+')
+
+# All entries are in the page but only one is shown at a time; lazy images
+# in hidden entries are not fetched until the reader pages to them
+IMAGE_TAG = re.compile(r'<img(?![^>]*\bloading=)', re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def compile_template(template_file, mtime):
+    """
+    Split a template into literal text and placeholder names, once per process
+    (mtime is part of the cache key so an edited template is recompiled)
+
+    Returns:
+        tuple alternating literal, name, literal, ..., literal
+    """
+    with open(template_file, 'r', encoding='utf-8') as f:
+        return tuple(PLACEHOLDER.split(f.read()))
+
+def render_template(template_file, values):
+    """Fill a template's {{NAME}} placeholders from values"""
+    parts = compile_template(template_file, os.path.getmtime(template_file))
+    out = []
+    for index, part in enumerate(parts):
+        if index % 2 == 0:
+            out.append(part)
+        elif part in values:
+            out.append(values[part])
+        else:
+            raise KeyError(f"{template_file}: no value for {{{{{part}}}}}")
+    return ''.join(out)
+
+def format_date(date_text, language):
+    """'1925-03-05' -> 'March 5, 1925' (or the language's format); other text unchanged"""
+    parts = (date_text or '').split('-')
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return date_text or ''
+    year, month, day = (int(part) for part in parts)
+    return language['date_format'].format(
+        year=year,
+        month=language['months'][month - 1],
+        day=day,
+    )
+
+def format_content(content, is_italic=False):
+    """
+    Entry text -> HTML: one <p> per blank-line-separated paragraph;
+    paragraphs that already contain markup are kept as written
+    """
+    formatted = ''
+    for paragraph in PARAGRAPH_BREAK.split(content or ''):
+        if not paragraph.strip():
+            continue
+        if '<' in paragraph:
+            formatted += '<p>' + paragraph + '</p>'
+        else:
+            formatted += '<p>' + paragraph.replace('\n', ' ') + '</p>'
+    if is_italic:
+        formatted = '<em>' + formatted + '</em>'
+    return IMAGE_TAG.sub('<img loading="lazy"', formatted)
+
+def render_entries(entries, language):
+    """The pre-rendered entry blocks of one chapter"""
+    blocks = []
+    for number, entry in enumerate(entries, 1):
+        header = format_date(entry.get('date'), language) + ' - ' + (entry.get('location') or '')
+        blocks.append(
+            f'    <div class="diary-entry" id="entry-{number}" data-entry>\n'
+            f'      <div class="diary-header">{html.escape(header)}</div>\n'
+            f'      <div class="diary-text">{format_content(entry.get("content"), entry.get("is_italic"))}</div>\n'
+            f'    </div>'
+        )
+    return '\n'.join(blocks)
+
+def render_chapter(job):
+    """
+    Render one chapter page (runs in a worker process)
+
+    Returns:
+        (output path, rendered HTML)
+    """
+    template_file, language, chapter, previous_link, next_link = job
+
+    with open(Path(language['data_dir']) / f"{chapter}.json", 'r', encoding='utf-8') as f:
+        entries = json.load(f).get('entries', [])
+
+    strings = language['strings']
+    title = language['chapter_names'][chapter]
+    page_config = {
+        'previousChapter': previous_link,
+        'nextChapter': next_link,
+        'strings': {key: strings[key] for key in ('previous_entry', 'next_entry', 'previous_chapter', 'next_chapter', 'entry_of', 'no_entries')},
+    }
+    values = {
+        'LANG': language['code'],
+        'CHAPTER_TITLE': html.escape(title, quote=False),
+        'ENTRIES': render_entries(entries, language),
+        'PREVIOUS_ENTRY': html.escape(strings['previous_entry'], quote=False),
+        'NEXT_ENTRY': html.escape(strings['next_entry'], quote=False),
+        'BOOK_INDEX': html.escape(strings['book_index'], quote=False),
+        'RETURN_TO_INVESTIGATION': html.escape(strings['return_to_investigation'], quote=False),
+        # '</' cannot appear inside an inline <script>
+        'PAGE_CONFIG': json.dumps(page_config, ensure_ascii=False).replace('</', '<\\/'),
+    }
+    output_path = Path(language['output_dir']) / f"{chapter}.html"
+    return str(output_path), render_template(template_file, values)
+
+def entry_count(language, chapter):
+    with open(Path(language['data_dir']) / f"{chapter}.json", 'r', encoding='utf-8') as f:
+        return len(json.load(f).get('entries', []))
+
+def plan_jobs(config, template_file, languages=None):
+    """One render job per (language, chapter), with its neighbour links resolved"""
+    chapters = config['chapters']
+    jobs = []
+    for code, language in config['languages'].items():
+        if languages and code not in languages:
+            continue
+        language = dict(language, code=code)
+        for index, chapter in enumerate(chapters):
+            previous_link = None
+            if index > 0:
+                previous = chapters[index - 1]
+                # Going back opens the previous chapter at its last entry
+                previous_link = f"{previous}.html#{entry_count(language, previous)}"
+            if index < len(chapters) - 1:
+                next_link = f"{chapters[index + 1]}.html#1"
+            else:
+                next_link = config.get('end_page')
+            jobs.append((template_file, language, chapter, previous_link, next_link))
+    return jobs
+
+def build_book(config_file=CONFIG_FILE, template_file=TEMPLATE_FILE, languages=None, jobs=None, check=False):
+    """
+    Render all chapters in parallel and write the ones that changed
+
+    Returns:
+        (all (path, html) pairs rendered, paths that were - or with
+        check=True would be - changed)
+    """
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    render_jobs = plan_jobs(config, template_file, languages)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        rendered = list(executor.map(render_chapter, render_jobs))
+
+    changed = []
+    for output_path, page in rendered:
+        path = Path(output_path)
+        if path.exists() and path.read_text(encoding='utf-8') == page:
+            continue
+        changed.append(output_path)
+        if not check:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(page, encoding='utf-8')
+    return rendered, changed
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Render the online book chapters from data/book*/ JSON"
+    )
+    parser.add_argument(
+        "--language",
+        action="append",
+        help="Only build this language code (repeatable; default: all in data/book_languages.json)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that the chapter pages are up to date (exit 1 if not)"
+    )
+
+    args = parser.parse_args()
+
+    rendered, changed = build_book(languages=args.language, jobs=args.jobs, check=args.check)
+
+    if args.check:
+        if changed:
+            print(f"❌ {len(changed)} chapter pages out of date (run scripts/build_book.py):")
+            for path in changed:
+                print(f"   {path}")
+            sys.exit(1)
+        print(f"✅ All {len(rendered)} chapter pages are up to date")
+        return
+
+    for path in changed:
+        print(f"✓ Rendered: {path}")
+    print(f"\n✅ {len(rendered)} chapter pages built, {len(changed)} changed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Phase Payload Builder for Murder Mystery Game
+Splits data files whose entries belong to different game phases
+(data/phases.json: is_spoiler entries are 'reveal', the rest
+'investigation') into one pre-filtered payload per phase:
+
+    data/journals/cordelia_diary.json
+      -> data/phases/investigation/journals/cordelia_diary.json
+      -> data/phases/reveal/journals/cordelia_diary.json
+
+Pages fetch the payload for the phase they show, so a phone reading the
+diary never downloads the spoiler entries and pages no longer filter them.
+Exits with status 1 if any page still fetches a mixed-phase source file.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from content_units import iter_units, load_phases, locate_pages, phase_of
+
+DATA_DIR = 'data'
+OUTPUT_DIR = 'data/phases'
+
+# Every directory with pages that fetch data
+PAGE_DIRS = ('clue', 'character', 'vision', 'refs')
+
+def iter_data_files(root: Path):
+    """Source data files (generated payloads and indexes excluded)"""
+    for path in sorted((root / DATA_DIR).rglob('*.json')):
+        relative = path.relative_to(root).as_posix()
+        if relative.startswith((OUTPUT_DIR + '/', 'data/search/')):
+            continue
+        yield path, relative
+
+def partition(data, phases):
+    """
+    Split a data file by phase
+
+    Returns:
+        dict of phase -> data with only that phase's units; empty if the
+        file has a single phase (or no separate units) and needs no split
+    """
+    units = [(key, unit) for key, unit in iter_units(data) if key is not None]
+    by_phase = {}
+    for key, unit in units:
+        by_phase.setdefault(phase_of(unit, phases), []).append(unit)
+    if len(by_phase) < 2:
+        return {}
+
+    # Payloads keep the file's shape: same top-level keys, fewer units
+    list_key = 'entries' if units[0][0][0] == 'index' else next(
+        key for key, value in data.items() if isinstance(value, list)
+    )
+    return {phase: dict(data, **{list_key: phase_units}) for phase, phase_units in by_phase.items()}
+
+def build_payloads(root: Path, check=False):
+    """
+    Write the payload of every mixed-phase data file
+
+    Returns:
+        (mixed source files, payload files that were - or with check=True
+        would be - changed)
+    """
+    phases = load_phases(root)
+    output_dir = root / OUTPUT_DIR
+    mixed = []
+    changed = []
+    expected = set()
+
+    for path, relative in iter_data_files(root):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        payloads = partition(data, phases)
+        if not payloads:
+            continue
+        mixed.append(relative)
+        for phase, payload in payloads.items():
+            target = output_dir / phase / path.relative_to(root / DATA_DIR)
+            expected.add(target)
+            text = json.dumps(payload, indent=2, ensure_ascii=False) + '\n'
+            if target.exists() and target.read_text(encoding='utf-8') == text:
+                continue
+            changed.append(target.relative_to(root).as_posix())
+            if not check:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_text(text, encoding='utf-8')
+
+    # Payloads whose source no longer mixes phases
+    if output_dir.exists():
+        for stale in sorted(output_dir.rglob('*.json')):
+            if stale not in expected:
+                changed.append(stale.relative_to(root).as_posix())
+                if not check:
+                    stale.unlink()
+
+    return mixed, changed
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Split mixed-phase data files into per-phase payloads (data/phases/)"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that the payloads are up to date (exit 1 if not)"
+    )
+
+    args = parser.parse_args()
+    root = Path(args.root).resolve()
+
+    mixed, changed = build_payloads(root, check=args.check)
+
+    print("="*60)
+    print("🔒 Phase payloads")
+    print("="*60)
+    for relative in mixed:
+        print(f"   {relative}")
+    if args.check and changed:
+        print(f"\n❌ {len(changed)} payloads out of date (run scripts/build_phase_payloads.py):")
+        for relative in changed:
+            print(f"   {relative}")
+    elif changed:
+        print(f"\n✓ {len(changed)} payloads written or removed")
+
+    # A page fetching a mixed source ships every phase to the phone
+    pages = locate_pages(root, PAGE_DIRS)
+    leaking = [(relative, page) for relative in mixed for page, _ in pages.get(relative, [])]
+    if leaking:
+        print(f"\n❌ {len(leaking)} pages fetch a mixed-phase file instead of its payload:")
+        for relative, page in leaking:
+            print(f"   {page} -> {relative}")
+    else:
+        print(f"\n✅ {len(mixed)} mixed-phase files, no page downloads locked content")
+    print("="*60)
+
+    sys.exit(1 if leaking or (args.check and changed) else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Player Packet Builder for Murder Mystery Game
+Assembles one PDF per player with everything that role is handed at the
+start: their character card, their secret facts (data/facts.json,
+`character`) and the rumor cards they start with (data/rumors.json,
+`possession`), plus any shared pages (--shared, e.g. the documents).
+
+Each role's sections are rendered once as vector PDFs and cached in
+.cache/packets/ (keyed by the card data and the generator code); packets
+are then assembled by copying those pages and the shared pages with
+pypdf, without re-rendering or re-rasterising anything.
+Needs pypdf (pip install pypdf) for the page merging.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:
+    PdfReader = PdfWriter = None
+
+from generate_character_cards_pdf import CHARACTER_NAMES, create_character_card
+from generate_fact_cards_pdf import draw_fact_card, load_card_fonts
+from vector_canvas import VectorDocument, vector_available
+
+CACHE_DIR = '.cache/packets'
+OUTPUT_DIR = 'to_print/packets'
+
+# Role names used in the data files that differ from the character keys
+ROLE_ALIASES = {
+    'psychicmedium': 'psychic',
+}
+
+# Card sheet geometry (as generate_fact_cards_pdf.py, 150 DPI grid)
+DPI = 150
+PAGE_W_PX = int(8.5 * DPI)
+PAGE_H_PX = int(11 * DPI)
+MARGIN_PX = int(0.5 * DPI)
+CARD_W_PX = int(2.5 * DPI)
+CARD_H_PX = int(3.5 * DPI)
+COLS = (PAGE_W_PX - 2 * MARGIN_PX) // CARD_W_PX
+ROWS = (PAGE_H_PX - 2 * MARGIN_PX) // CARD_H_PX
+
+# The character card is laid out on a 72 DPI grid
+CHARACTER_DPI = 72
+
+SECTIONS = ['character', 'facts', 'rumors']
+
+def role_key(name):
+    """'Art Collector' / 'PSYCHIC MEDIUM' / 'heiress' -> character key"""
+    key = name.lower().replace(' ', '')
+    return ROLE_ALIASES.get(key, key)
+
+def load_role_cards(root: Path):
+    """
+    Returns:
+        {role key: {'facts': [card], 'rumors': [card]}} with cards as
+        draw_fact_card takes them
+    """
+    cards = {}
+    with open(root / 'data/facts.json', 'r') as f:
+        for fact in json.load(f).get('facts', []):
+            role = role_key(fact.get('character', ''))
+            cards.setdefault(role, {'facts': [], 'rumors': []})['facts'].append(
+                {'text': fact['text'], 'possession': fact['character']}
+            )
+    with open(root / 'data/rumors.json', 'r') as f:
+        for rumor in json.load(f).get('rumors', []):
+            role = role_key(rumor.get('possession', ''))
+            cards.setdefault(role, {'facts': [], 'rumors': []})['rumors'].append(rumor)
+    return cards
+
+def render_cards(cards, output_file, vector=True):
+    """Fact-card style sheets (as fact_cards.pdf) for a list of cards"""
+    document = VectorDocument(output_file, (PAGE_W_PX, PAGE_H_PX), DPI) if vector else None
+    pages = []
+    per_page = COLS * ROWS
+    for start in range(0, len(cards), per_page):
+        if document:
+            draw = page = document.new_page()
+            fonts = load_card_fonts(draw)
+        else:
+            page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='white')
+            draw = ImageDraw.Draw(page)
+            fonts = load_card_fonts()
+        for slot, card in enumerate(cards[start:start + per_page]):
+            x = MARGIN_PX + (slot % COLS) * CARD_W_PX
+            y = MARGIN_PX + (slot // COLS) * CARD_H_PX
+            draw_fact_card(draw, x, y, CARD_W_PX, CARD_H_PX, card, fonts)
+        pages.append(page)
+    if document:
+        document.save()
+    else:
+        pages[0].save(output_file, save_all=True, append_images=pages[1:])
+
+def render_character(role, output_file, vector=True):
+    """A page with the role's character card in the top-left card slot"""
+    page_size = (int(8.5 * CHARACTER_DPI), int(11 * CHARACTER_DPI))
+    margin = int(0.5 * CHARACTER_DPI)
+    image_path = f"assets/characters/{role}.png"
+    qr_path = f"qr_codes/character_{role}.png"
+    if vector:
+        document = VectorDocument(output_file, page_size, CHARACTER_DPI, background='#FFFAF0')
+        page = document.new_page()
+        create_character_card(role, CHARACTER_NAMES[role], image_path, qr_path,
+                              target=page.offset(margin, margin))
+        document.save()
+    else:
+        page = Image.new('RGB', page_size, color='#FFFAF0')
+        page.paste(create_character_card(role, CHARACTER_NAMES[role], image_path, qr_path), (margin, margin))
+        page.save(output_file)
+
+def source_version():
+    """Cached sections are only valid for the same drawing code"""
+    here = Path(__file__).resolve().parent
+    sources = [here / name for name in (
+        'build_player_packets.py', 'generate_character_cards_pdf.py',
+        'generate_fact_cards_pdf.py', 'vector_canvas.py',
+    )]
+    return ':'.join(str(source.stat().st_mtime_ns) for source in sources)
+
+def section_file(root: Path, role, section, cards, vector):
+    """
+    The cached PDF for one section of a role's packet, rendered if missing
+
+    Returns:
+        (path, rendered now)
+    """
+    key = json.dumps([role, section, cards, vector, source_version()], sort_keys=True)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+    cache_dir = root / CACHE_DIR
+    path = cache_dir / f"{role}_{section}_{digest}.pdf"
+    if path.exists():
+        return path, False
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Drop this section's stale renders
+    for old in cache_dir.glob(f"{role}_{section}_*.pdf"):
+        old.unlink()
+    if section == 'character':
+        render_character(role, path, vector)
+    else:
+        render_cards(cards, path, vector)
+    return path, True
+
+def parse_shared(value):
+    """'file.pdf' or 'file.pdf:1-3,5' -> (path, list of 0-based pages or None)"""
+    path, sep, spec = value.partition(':')
+    if not sep:
+        return Path(path), None
+    pages = []
+    try:
+        for part in spec.split(','):
+            first, dash, last = part.partition('-')
+            pages.extend(range(int(first) - 1, int(last if dash else first)))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FILE.pdf[:PAGES], got {value!r}")
+    return Path(path), pages
+
+def build_packets(root: Path, roles, shared, output_dir: Path, vector=True):
+    """
+    Write one packet per role
+
+    Returns:
+        list of (role, packet path, page count, sections rendered now)
+    """
+    role_cards = load_role_cards(root)
+    readers = {}
+
+    def pages_of(path, numbers=None):
+        # Each source PDF is parsed once, however many packets use it
+        if path not in readers:
+            readers[path] = PdfReader(str(path))
+        reader = readers[path]
+        return [reader.pages[i] for i in (numbers if numbers is not None else range(len(reader.pages)))]
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    for role in roles:
+        cards = role_cards.get(role, {'facts': [], 'rumors': []})
+        writer = PdfWriter()
+        rendered = 0
+        for section in SECTIONS:
+            section_cards = None if section == 'character' else cards[section]
+            if section_cards == []:
+                continue
+            path, fresh = section_file(root, role, section, section_cards, vector)
+            rendered += fresh
+            for page in pages_of(path):
+                writer.add_page(page)
+        for path, numbers in shared:
+            for page in pages_of(path, numbers):
+                writer.add_page(page)
+
+        packet = output_dir / f"{role}.pdf"
+        with open(packet, 'wb') as f:
+            writer.write(f)
+        results.append((role, packet, len(writer.pages), rendered))
+    return results
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Assemble one print packet per player"
+    )
+    parser.add_argument(
+        "--role",
+        action="append",
+        help="Only build this role's packet (repeatable; default: every character)"
+    )
+    parser.add_argument(
+        "--shared",
+        action="append",
+        type=parse_shared,
+        default=[],
+        metavar="FILE.pdf[:PAGES]",
+        help="Pages added to every packet, e.g. to_print/documents_visual.pdf:1-3 (repeatable)"
+    )
+    parser.add_argument(
+        "--output",
+        default=OUTPUT_DIR,
+        help=f"Output directory (default: {OUTPUT_DIR})"
+    )
+    parser.add_argument(
+        "--raster",
+        action="store_true",
+        help="Render sections as bitmaps instead of vector PDF"
+    )
+
+    args = parser.parse_args()
+    root = Path('.')
+
+    if PdfReader is None:
+        print("❌ Error: pypdf is not installed (pip install pypdf)")
+        sys.exit(1)
+
+    roles = [role_key(role) for role in args.role] if args.role else sorted(CHARACTER_NAMES)
+    unknown = [role for role in roles if role not in CHARACTER_NAMES]
+    if unknown:
+        print(f"❌ Error: unknown roles: {', '.join(unknown)}")
+        sys.exit(1)
+    missing = [str(path) for path, _ in args.shared if not path.exists()]
+    if missing:
+        print(f"❌ Error: not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    vector = not args.raster
+    if vector and not vector_available():
+        print("⚠️  reportlab not installed (pip install reportlab); rendering bitmap pages")
+        vector = False
+
+    print("="*60)
+    print("📦 Player Packet Builder")
+    print("="*60)
+    print(f"🎭 Roles: {len(roles)}")
+    print(f"📄 Shared pages from: {', '.join(str(path) for path, _ in args.shared) or 'none'}\n")
+
+    started = time.perf_counter()
+    results = build_packets(root, roles, args.shared, Path(args.output), vector)
+    elapsed = time.perf_counter() - started
+
+    rendered = 0
+    for role, packet, page_count, fresh in results:
+        rendered += fresh
+        print(f"✓ {CHARACTER_NAMES[role]:<30} {page_count:3d} pages -> {packet}")
+
+    print("\n" + "="*60)
+    print(f"✅ Built {len(results)} packets in {elapsed:.1f}s")
+    print(f"   Sections rendered: {rendered} (the rest reused from {CACHE_DIR}/)")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Multi-Venue QR Build for Murder Mystery Game
+Builds the QR codes and the printable QR sheet for several deployments
+(the same game served from different hosts) in one run:
+
+    python scripts/build_qr_deployments.py \
+        --deployment github=https://filatova-elena.github.io/murder_mystery \
+        --deployment library=http://192.168.1.20:8000/murder_mystery
+
+writes qr_builds/<name>/*.png, qr_builds/<name>/manifest.json and
+qr_builds/<name>/qr_codes_grid.pdf for each deployment. The code list
+(qr_codes/manifest.json), short links, fonts and sheet layout are worked
+out once and shared; only the QR matrices differ per deployment.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from generate_qr_codes import render_qr_image, save_qr_png
+from generate_qr_pdf import BASE_DPI, compose_pages, sheet_layout
+from pdf_stream import StreamingPdf
+from qr_manifest import iter_targets, save_manifest
+from short_links import STUB_DIR, allocate, load_links, resolve_path, save_links, write_stub
+
+def parse_deployment(value):
+    """'name=url' -> (name, url)"""
+    name, sep, url = value.partition('=')
+    if not sep or not name or not url.startswith(('http://', 'https://')):
+        raise argparse.ArgumentTypeError(f"expected NAME=URL, got {value!r}")
+    return name, url.rstrip('/')
+
+def discover_targets(root: Path, qr_dir, use_short_links=True):
+    """
+    The codes to build, shared by every deployment; codes whose page does
+    not exist are skipped, so no short id is burned on a missing page
+
+    Returns:
+        list of (code name, page path, path to encode after the base URL)
+    """
+    targets = []
+    for name, path in iter_targets(str(root / qr_dir)):
+        if not path:
+            continue
+        page = resolve_path(root, path)
+        if not page or not (root / page).is_file():
+            print(f"⚠️  Skipping {name}: {path} does not exist")
+            continue
+        targets.append((name, page))
+    if not use_short_links:
+        return [(name, path, path) for name, path in targets]
+
+    links = load_links(root)
+    encoded = []
+    added = False
+    for name, path in targets:
+        link_id, is_new = allocate(links, path)
+        added = added or is_new
+        write_stub(root, link_id, path)
+        encoded.append((name, path, f"{STUB_DIR}/{link_id}.html"))
+    if added:
+        save_links(root, links)
+    return encoded
+
+def build_deployment(name, base_url, targets, layout, output_root: Path):
+    """
+    Write one deployment's codes, manifest and sheet PDF
+
+    Returns:
+        (number of codes, PDF path, number of sheet pages)
+    """
+    output_dir = output_root / name
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    images = []
+    codes = {}
+    for code_name, page_path, encoded_path in targets:
+        url = f"{base_url}/{encoded_path}"
+        img, _ = render_qr_image(url)
+        save_qr_png(img, output_dir / f"{code_name}.png")
+        images.append((code_name, img))
+        codes[code_name] = {'path': page_path, 'url': url}
+    save_manifest({'base_url': base_url, 'codes': codes}, str(output_dir))
+
+    pdf_path = output_dir / "qr_codes_grid.pdf"
+    with StreamingPdf(pdf_path, layout['dpi']) as pdf:
+        for page_img, _ in compose_pages(images, layout):
+            pdf.add_page(page_img)
+    return len(codes), pdf_path, pdf.page_count
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Build QR codes and QR sheets for several deployments in one run"
+    )
+    parser.add_argument(
+        "--deployment",
+        action="append",
+        type=parse_deployment,
+        required=True,
+        metavar="NAME=URL",
+        help="A deployment name and its base URL (repeat for each venue)"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--qr-dir",
+        default="qr_codes",
+        help="QR code directory whose manifest lists the codes (default: qr_codes)"
+    )
+    parser.add_argument(
+        "--output",
+        default="qr_builds",
+        help="Output directory, one subdirectory per deployment (default: qr_builds)"
+    )
+    parser.add_argument(
+        "--long-urls",
+        action="store_true",
+        help="Encode full page URLs instead of short q/<id>.html links"
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=BASE_DPI,
+        help=f"Sheet resolution; 300 for print (default: {BASE_DPI})"
+    )
+
+    args = parser.parse_args()
+    root = Path(args.root).resolve()
+
+    names = [name for name, _ in args.deployment]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        print(f"❌ Error: deployment names used twice: {', '.join(duplicates)}")
+        sys.exit(1)
+
+    targets = discover_targets(root, args.qr_dir, use_short_links=not args.long_urls)
+    if not targets:
+        print(f"❌ Error: No codes listed in {args.qr_dir}/manifest.json")
+        sys.exit(1)
+    layout = sheet_layout(args.dpi)
+
+    print("="*60)
+    print("📱 Multi-venue QR build")
+    print("="*60)
+    print(f"📦 Codes per deployment: {len(targets)}")
+    print(f"🏠 Deployments: {len(args.deployment)}\n")
+
+    for name, base_url in args.deployment:
+        count, pdf_path, page_count = build_deployment(name, base_url, targets, layout, Path(args.output))
+        print(f"✓ {name}: {count} codes, {page_count} sheets -> {pdf_path} ({base_url})")
+
+    print("\n" + "="*60)
+    print(f"✅ Built {len(args.deployment)} deployments in {Path(args.output).resolve()}/")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Search Index Builder for Murder Mystery Game
+Builds a full-text index over the book and the clue data that players can
+reach on a page (journals, botanicals, artifacts, documents), so phones
+can search it locally with searchClues() from assets/script.js.
+
+Output (data/search/):
+- index.json: the document list (url, title, excerpt), shard count, stopwords
+- terms_<n>.json: inverted index shards, term -> postings with positions
+
+Only player-visible fields are indexed (title, name, description, content,
+text), and only content unlocked from the start of the game (the default
+phase in data/phases.json); expert fields such as 'reveals' and spoiler
+journal entries are not.
+The tokeniser and stemmer here must match searchTokenize()/searchStem()
+in assets/script.js.
+"""
+
+import argparse
+import html
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+from content_units import iter_units, load_phases, locate_pages, page_for, phase_of
+
+OUTPUT_DIR = 'data/search'
+BOOK_CONFIG = 'data/book_languages.json'
+
+# Only the English book is indexed; the stemmer is English-only
+BOOK_LANGUAGE = 'en'
+
+# Fields players see on every clue page
+TEXT_FIELDS = ['title', 'name', 'description', 'content', 'text']
+
+DEFAULT_SHARDS = 8
+EXCERPT_LENGTH = 140
+
+STOPWORDS = sorted({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from',
+    'had', 'has', 'have', 'he', 'her', 'his', 'i', 'in', 'is', 'it', 'its',
+    'me', 'my', 'of', 'on', 'or', 's', 'she', 'so', 'that', 'the', 'their',
+    'them', 'they', 'this', 'to', 'was', 'we', 'were', 'what', 'which',
+    'with', 'you',
+})
+
+# Suffix rules, first match wins; the stem must keep at least 3 letters
+SUFFIX_RULES = [
+    ('sses', 'ss'),
+    ('ies', 'y'),
+    ('ingly', ''),
+    ('edly', ''),
+    ('ing', ''),
+    ('ed', ''),
+    ('ly', ''),
+    ('s', ''),
+]
+
+TAG = re.compile(r'<[^>]+>')
+WORD = re.compile(r'[a-z0-9]+')
+
+def stem(word):
+    """Light English suffix stripping (mirrors searchStem in script.js)"""
+    for suffix, replacement in SUFFIX_RULES:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(replacement) >= 3:
+            if suffix == 's' and word.endswith(('ss', 'us', 'is')):
+                break
+            word = word[:len(word) - len(suffix)] + replacement
+            break
+    if len(word) > 3 and word.endswith('e'):
+        word = word[:-1]
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in 'aeiouslz':
+        word = word[:-1]
+    return word
+
+def tokenize(text):
+    """
+    Split text into (position, stem) pairs; stopwords and single letters
+    take up a position but are not returned (mirrors searchTokenize)
+    """
+    text = html.unescape(TAG.sub(' ', text or ''))
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    stopwords = set(STOPWORDS)
+    tokens = []
+    for position, word in enumerate(WORD.findall(text)):
+        if len(word) > 1 and word not in stopwords:
+            tokens.append((position, stem(word)))
+    return tokens
+
+def shard_of(term, shards):
+    """djb2 hash of a term, as computed by searchShardOf in script.js"""
+    value = 5381
+    for char in term:
+        value = (value * 33 + ord(char)) & 0xFFFFFFFF
+    return value % shards
+
+def unit_text(unit):
+    return '\n\n'.join(str(unit[field]) for field in TEXT_FIELDS if isinstance(unit.get(field), str))
+
+def excerpt(text):
+    """First words of the plain text, for result lists"""
+    plain = ' '.join(html.unescape(TAG.sub(' ', text)).split())
+    if len(plain) <= EXCERPT_LENGTH:
+        return plain
+    return plain[:EXCERPT_LENGTH].rsplit(' ', 1)[0] + '…'
+
+def collect_documents(root: Path):
+    """
+    Everything to index: list of dicts with url, title, text, source, plus
+    the number of data units skipped because no page shows them
+    """
+    documents = []
+    skipped = 0
+    phases = load_phases(root)
+
+    with open(root / BOOK_CONFIG, 'r', encoding='utf-8') as f:
+        book = json.load(f)
+    language = book['languages'][BOOK_LANGUAGE]
+    for chapter in book['chapters']:
+        with open(root / language['data_dir'] / f"{chapter}.json", 'r', encoding='utf-8') as f:
+            entries = json.load(f).get('entries', [])
+        for number, entry in enumerate(entries, 1):
+            documents.append({
+                'url': f"{language['output_dir']}/{chapter}.html#{number}",
+                'title': f"{language['chapter_names'][chapter]} - {entry.get('title') or number}",
+                'text': entry.get('content', ''),
+                'source': f"{language['data_dir']}/{chapter}.json",
+            })
+
+    for json_file, candidates in sorted(locate_pages(root).items()):
+        path = root / json_file
+        if not path.is_file() or path.suffix != '.json' or json_file.startswith(language['data_dir']):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for key, unit in iter_units(data):
+            if not isinstance(unit, dict):
+                continue
+            if phase_of(unit, phases) != phases['default']:
+                continue
+            page = page_for(key, unit, candidates)
+            text = unit_text(unit)
+            if page is None or not text:
+                skipped += 1
+                continue
+            documents.append({
+                'url': page,
+                'title': unit.get('title') or unit.get('name') or Path(page).stem.replace('_', ' ').title(),
+                'text': text,
+                'source': json_file,
+            })
+    return documents, skipped
+
+def build_postings(documents):
+    """term -> list of (doc number, positions)"""
+    postings = {}
+    for number, document in enumerate(documents):
+        positions = {}
+        # The title is indexed ahead of the text so title words rank too
+        for position, term in tokenize(document['title'] + ' \n ' + document['text']):
+            positions.setdefault(term, []).append(position)
+        for term, term_positions in positions.items():
+            postings.setdefault(term, []).append((number, term_positions))
+    return postings
+
+def encode_postings(entries):
+    """
+    Flatten postings as [doc, count, first position, gap, gap, ..., doc, ...]
+    (positions delta-encoded to keep the shards small)
+    """
+    flat = []
+    for number, positions in entries:
+        flat += [number, len(positions), positions[0]]
+        flat += [b - a for a, b in zip(positions, positions[1:])]
+    return flat
+
+def write_index(documents, output_dir: Path, shards=DEFAULT_SHARDS):
+    """Write index.json and the term shards; returns total bytes written"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for old_shard in output_dir.glob('terms_*.json'):
+        old_shard.unlink()
+
+    postings = build_postings(documents)
+    shard_terms = [{} for _ in range(shards)]
+    for term in sorted(postings):
+        shard_terms[shard_of(term, shards)][term] = encode_postings(postings[term])
+
+    meta = {
+        'version': 1,
+        'shards': shards,
+        'stopwords': STOPWORDS,
+        'docs': [[document['url'], document['title'], excerpt(document['text'])] for document in documents],
+    }
+    written = 0
+    for name, payload in [('index.json', meta)] + [(f'terms_{n}.json', terms) for n, terms in enumerate(shard_terms)]:
+        text = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        (output_dir / name).write_text(text, encoding='utf-8')
+        written += len(text.encode('utf-8'))
+    return len(postings), written
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Build the client-side full-text search index (data/search/)"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=DEFAULT_SHARDS,
+        help=f"Number of term shards (default: {DEFAULT_SHARDS})"
+    )
+
+    args = parser.parse_args()
+    root = Path(args.root).resolve()
+
+    documents, skipped = collect_documents(root)
+    terms, written = write_index(documents, root / OUTPUT_DIR, args.shards)
+
+    print("="*60)
+    print("🔎 Search index built")
+    print("="*60)
+    print(f"📄 Documents: {len(documents)}")
+    print(f"🔤 Terms: {terms} in {args.shards} shards")
+    print(f"📦 Size: {written / 1024:.1f} KB in {OUTPUT_DIR}/")
+    if skipped:
+        print(f"⏭️  {skipped} data entries skipped (no page shows them)")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
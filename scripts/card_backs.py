@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Card Backs for Murder Mystery Game
+Themed backs for the fact, rumor and character decks, for duplex
+printing. The back sheet is laid out from the same card slots as the
+fronts, mirrored the way the sheet turns over (long or short edge), so
+each back lands behind its card. A deck's back sheet is drawn once and
+reused after every front sheet: as a shared page (form) in vector and
+streamed output, as the same image in bitmap output.
+"""
+
+from PIL import Image, ImageDraw
+
+from vector_canvas import PixelCanvas, RasterCanvas, raster_font
+
+BACK_FONTS = ["/System/Library/Fonts/Georgia.ttf", "/System/Library/Fonts/Helvetica.ttc"]
+
+BACK_COLOR = '#F5E6D3'
+INK_COLOR = '#8B7355'
+
+def mirror_slots(slots, page_size_px, flip='long'):
+    """
+    Where each card's back goes on the reverse side
+
+    Args:
+        flip: 'long' for long-edge binding duplex (the sheet turns left to
+            right, so x is mirrored) or 'short' (turns top to bottom)
+    """
+    page_w, page_h = page_size_px
+    if flip == 'short':
+        return [(x, page_h - y - h, w, h) for x, y, w, h in slots]
+    return [(page_w - x - w, y, w, h) for x, y, w, h in slots]
+
+def _font(draw, size_px):
+    if isinstance(draw, (PixelCanvas, RasterCanvas)):
+        # Vector or print-resolution page
+        return draw.font(BACK_FONTS, size_px)
+    return raster_font(tuple(BACK_FONTS), size_px)
+
+def draw_card_back(draw, box, label):
+    """Draw one card back into box (x, y, width, height)"""
+    x, y, w, h = box
+    unit = w / 180  # the design is drawn for a 2.5" card at 72 DPI
+
+    draw.rectangle([x, y, x + w, y + h], fill=BACK_COLOR)
+
+    # Double border, as on the fronts
+    inset = round(5 * unit)
+    draw.rectangle([x + inset, y + inset, x + w - inset, y + h - inset], outline=INK_COLOR, width=max(1, round(2 * unit)))
+    inset = round(9 * unit)
+    draw.rectangle([x + inset, y + inset, x + w - inset, y + h - inset], outline=INK_COLOR, width=1)
+
+    # Diamond lattice between the borders' inner edge and the medallion
+    step = round(18 * unit)
+    left, top = x + round(14 * unit), y + round(14 * unit)
+    right, bottom = x + w - round(14 * unit), y + h - round(14 * unit)
+    cx, cy = x + w / 2, y + h / 2
+    for offset in range(0, right - left + bottom - top + 1, step):
+        # "\" and "/" diagonals clipped to the lattice area
+        start = (left + max(0, offset - (bottom - top)), top + min(offset, bottom - top))
+        end = (left + min(offset, right - left), top + max(0, offset - (right - left)))
+        draw.line([start, end], fill='#D8C3A5', width=1)
+        start = (right - max(0, offset - (bottom - top)), top + min(offset, bottom - top))
+        end = (right - min(offset, right - left), top + max(0, offset - (right - left)))
+        draw.line([start, end], fill='#D8C3A5', width=1)
+
+    # Central medallion with the game's monogram
+    radius = round(38 * unit)
+    draw.ellipse([cx - radius, cy - radius, cx + radius, cy + radius], fill=BACK_COLOR, outline=INK_COLOR, width=max(1, round(2 * unit)))
+    draw.ellipse([cx - radius + 5 * unit, cy - radius + 5 * unit, cx + radius - 5 * unit, cy + radius - 5 * unit],
+                 outline=INK_COLOR, width=1)
+    draw.text((cx, cy), "M", fill=INK_COLOR, font=_font(draw, round(40 * unit)), anchor="mm")
+
+    # Deck label on a band near the bottom
+    band_top, band_bottom = y + h - round(44 * unit), y + h - round(22 * unit)
+    draw.rectangle([x + round(24 * unit), band_top, x + w - round(24 * unit), band_bottom], fill=BACK_COLOR, outline=INK_COLOR, width=1)
+    draw.text((cx, (band_top + band_bottom) / 2), label, fill=INK_COLOR, font=_font(draw, round(12 * unit)), anchor="mm")
+
+def draw_back_page(draw, slots, label):
+    """Draw a back for every slot (already mirrored) of a sheet"""
+    for box in slots:
+        draw_card_back(draw, box, label)
+
+class CardBacks:
+    """One deck's back sheet, drawn once and added after each front sheet"""
+
+    def __init__(self, label, page_size_px, front_slots, flip='long', background='white', cut_grid=None):
+        self.label = label
+        self.page_size_px = page_size_px
+        self.flip = flip
+        self.slots = mirror_slots(front_slots, page_size_px, flip)
+        self.background = background
+        # Bleed behind the fronts' bleed (see cut_grid.CutGrid)
+        self.cut_grid = cut_grid
+        self.name = f"{label.title().replace(' ', '')}Back"
+        self._image = None
+
+    def draw(self, draw):
+        if self.cut_grid:
+            self.cut_grid.draw_bleed(draw, BACK_COLOR, self.flip)
+        draw_back_page(draw, self.slots, self.label)
+
+    def image(self):
+        """The back sheet as a bitmap (rendered on first use)"""
+        if self._image is None:
+            self._image = Image.new('RGB', self.page_size_px, color=self.background)
+            self.draw(ImageDraw.Draw(self._image))
+        return self._image
+
+    def add_to(self, document=None):
+        """
+        Add the back sheet as the next page of a VectorDocument or
+        RasterDocument; without a document, return the bitmap to append
+        to a list of page images
+
+        Returns:
+            the page (or page image) added
+        """
+        if document is None:
+            return self.image()
+        return document.shared_page(self.name, self.draw)
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Link and Asset Checker for the Murder Mystery site
+Parses every HTML page once (in parallel, cached by file mtime) and builds
+the site's link graph: <a href>, scripts, stylesheets, images, the JSON that
+pages fetch(), images inside that JSON, and the URLs encoded in the QR codes
+(qr_codes/manifest.json). Reports:
+- broken links: references to files that do not exist
+- orphan pages: HTML pages that cannot be reached from index.html or a QR code
+- unreferenced assets: files under assets/ and data/ that nothing uses
+- clue pages missing from the clue/clues.html list
+Exits with status 1 if there are broken links.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from page_dependencies import DependencyParser, images_in_json, strip_query
+from qr_manifest import iter_targets
+from short_links import STUB_DIR
+
+# Directories that are never served to players
+SKIP_DIRS = {'.git', '.cache', 'scripts', 'to_print', '__pycache__', 'node_modules', 'dist', 'logs'}
+
+# Hand-instantiated templates, never linked
+SKIP_PAGES = {'template.html', '_chapter_template.html'}
+
+# The site is mounted under this path on GitHub Pages
+SITE_PREFIX = '/murder_mystery/'
+
+# Files served to players whose references are checked for orphans/unused
+ASSET_DIRS = ['assets', 'data']
+
+# Build inputs and generated indexes that pages do not reference directly
+ASSET_IGNORE = ['data/access_levels.json', 'data/book_languages.json',
+                'data/phases.json', 'data/short_links.json', 'data/search/', 'data/book/', 'data/book_ru/']
+
+CACHE_FILE = '.cache/check_links.json'
+CACHE_VERSION = 1
+
+CLUE_LIST = 'clue/clues.html'
+
+# Pages that scripts navigate to (window.location.href = 'the_end.html')
+SCRIPT_LINK_PATTERN = re.compile(r"""['"]([^'"\s]+\.html)(?:#[^'"]*)?['"]""")
+
+class LinkParser(DependencyParser):
+    """Page dependencies plus <a href> links and pages named in scripts"""
+
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.dependencies.append(('link', href))
+
+    def handle_data(self, data):
+        super().handle_data(data)
+        if self.in_script:
+            for target in SCRIPT_LINK_PATTERN.findall(data):
+                self.dependencies.append(('link', target))
+
+def parse_page(path):
+    """
+    Parse one HTML page (runs in a worker process)
+
+    Returns:
+        (path, list of (kind, reference))
+    """
+    parser = LinkParser()
+    parser.feed(Path(path).read_text(encoding='utf-8', errors='replace'))
+    references = []
+    for kind, reference in parser.dependencies:
+        if kind != 'link':
+            reference = strip_query(reference)
+        if reference and not reference.startswith('data:') and '{{' not in reference:
+            if (kind, reference) not in references:
+                references.append((kind, reference))
+    return path, references
+
+def resolve(reference, page: Path, root: Path):
+    """
+    Map a reference to a site file
+
+    Returns:
+        Path inside root, or None for external or non-file links
+    """
+    if reference.startswith(('http://', 'https://', '//', 'mailto:', 'tel:', 'javascript:', '#')):
+        return None
+    reference = strip_query(reference)
+    if not reference:
+        return None
+    if reference.startswith(SITE_PREFIX):
+        target = root / reference[len(SITE_PREFIX):]
+    elif reference.startswith('/'):
+        target = root / reference.lstrip('/')
+    else:
+        target = page.parent / reference
+    target = Path(os.path.normpath(target))
+    if target.is_dir():
+        target = target / 'index.html'
+    return target
+
+def iter_site_files(root: Path):
+    """Every file served to players"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.')]
+        for filename in filenames:
+            if filename.startswith('.') or filename.endswith(('.gz', '.br', '.py', '.pyc')):
+                continue
+            yield Path(dirpath) / filename
+
+def cache_version():
+    """Cached results are only valid for the same parser code"""
+    here = Path(__file__).resolve().parent
+    sources = [here / 'check_links.py', here / 'page_dependencies.py']
+    return f"{CACHE_VERSION}:" + ':'.join(str(source.stat().st_mtime_ns) for source in sources)
+
+def load_cache(root: Path):
+    try:
+        with open(root / CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        if cache.get('version') == cache_version():
+            return cache['pages']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+def save_cache(root: Path, pages):
+    path = root / CACHE_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'version': cache_version(), 'pages': pages}, f)
+
+def parse_site(root: Path, pages, jobs=None, use_cache=True):
+    """
+    References of every page, re-parsing only pages changed since the last run
+
+    Returns:
+        (dict of page relative path -> list of (kind, reference), pages parsed)
+    """
+    cache = load_cache(root) if use_cache else {}
+    results = {}
+    stale = []
+    for page in pages:
+        relative = page.relative_to(root).as_posix()
+        entry = cache.get(relative)
+        if entry and entry['mtime'] == page.stat().st_mtime_ns:
+            results[relative] = [tuple(item) for item in entry['references']]
+        else:
+            stale.append(str(page))
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for path, references in executor.map(parse_page, stale, chunksize=8):
+                results[Path(path).relative_to(root).as_posix()] = references
+
+    if use_cache:
+        save_cache(root, {
+            relative: {'mtime': (root / relative).stat().st_mtime_ns, 'references': references}
+            for relative, references in results.items()
+        })
+    return results, len(stale)
+
+def build_graph(root: Path, parsed):
+    """
+    Resolve every reference
+
+    Returns:
+        (edges: page -> set of target relative paths, broken: list of (page, reference))
+    """
+    edges = {}
+    broken = []
+    json_images = {}
+    for page, references in sorted(parsed.items()):
+        page_path = root / page
+        targets = edges.setdefault(page, set())
+        for kind, reference in references:
+            target = resolve(reference, page_path, root)
+            if target is None:
+                continue
+            if not target.is_file():
+                broken.append((page, reference))
+                continue
+            relative = target.relative_to(root).as_posix()
+            targets.add(relative)
+            if kind == 'json' and target.suffix == '.json':
+                # Images inside fetched JSON are relative to the page, not the JSON
+                if relative not in json_images:
+                    json_images[relative] = images_in_json(target.read_text(encoding='utf-8', errors='replace'))
+                for image in json_images[relative]:
+                    image_target = resolve(image, page_path, root)
+                    if image_target is None:
+                        continue
+                    if image_target.is_file():
+                        targets.add(image_target.relative_to(root).as_posix())
+                    else:
+                        broken.append((page, image))
+    return edges, broken
+
+def reachable_from(entry_points, edges):
+    """Everything reachable from the entry points through the link graph"""
+    seen = set(entry_points)
+    queue = deque(entry_points)
+    while queue:
+        node = queue.popleft()
+        for target in edges.get(node, ()):
+            if target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return seen
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Check links, orphan pages and unreferenced assets across the whole site"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--qr-dir",
+        default="qr_codes",
+        help="QR code directory with manifest.json (default: qr_codes)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for parsing (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-parse every page instead of using {CACHE_FILE}"
+    )
+    parser.add_argument(
+        "--json",
+        help="Also write the full report to this JSON file"
+    )
+
+    args = parser.parse_args()
+    root = Path(args.root).resolve()
+
+    site_files = list(iter_site_files(root))
+    pages = [path for path in site_files if path.suffix == '.html' and path.name not in SKIP_PAGES]
+    parsed, parsed_count = parse_site(root, pages, args.jobs, use_cache=not args.no_cache)
+    edges, broken = build_graph(root, parsed)
+
+    # Entry points: the landing page, the short-link stubs and every page a QR code opens
+    stubs = sorted(page for page in parsed if page.startswith(STUB_DIR + '/'))
+    entry_points = ['index.html'] + stubs
+    qr_missing = []
+    for name, path in iter_targets(str(root / args.qr_dir)):
+        if path and (root / path).is_file():
+            entry_points.append(path)
+        else:
+            qr_missing.append((name, path))
+
+    reachable = reachable_from(entry_points, edges)
+    page_paths = {page.relative_to(root).as_posix() for page in pages}
+    orphans = sorted(page_paths - reachable)
+
+    referenced = set().union(*edges.values()) if edges else set()
+    unreferenced = sorted(
+        relative for relative in (path.relative_to(root).as_posix() for path in site_files)
+        if relative.split('/')[0] in ASSET_DIRS
+        and relative not in referenced
+        and not relative.startswith(tuple(ASSET_IGNORE))
+    )
+
+    clue_pages = {page for page in page_paths if page.startswith('clue/') and page != CLUE_LIST}
+    unlisted = sorted(clue_pages - edges.get(CLUE_LIST, set()))
+
+    print("="*70)
+    print("🔗 Site Link Check")
+    print("="*70)
+    print(f"📄 Pages: {len(pages)} ({parsed_count} parsed, {len(pages) - parsed_count} from cache)")
+    print(f"📱 QR entry points: {len(entry_points) - 1 - len(stubs)} ({len(stubs)} short links)")
+    print(f"🕸️  Links resolved: {sum(len(targets) for targets in edges.values())}")
+
+    if broken:
+        print(f"\n❌ BROKEN LINKS ({len(broken)}):")
+        for page, reference in broken:
+            print(f"   {page} -> {reference}")
+    if qr_missing:
+        print(f"\n❌ QR CODES WITHOUT A PAGE ({len(qr_missing)}):")
+        for name, path in qr_missing:
+            print(f"   {name} -> {path}")
+    if orphans:
+        print(f"\n⚠️  ORPHAN PAGES ({len(orphans)}) - not reachable from index.html or any QR code:")
+        for page in orphans:
+            print(f"   {page}")
+    if unreferenced:
+        print(f"\n⚠️  UNREFERENCED ASSETS ({len(unreferenced)}):")
+        for relative in unreferenced:
+            print(f"   {relative}")
+    if unlisted:
+        print(f"\n⚠️  CLUE PAGES NOT LISTED IN {CLUE_LIST} ({len(unlisted)}):")
+        for page in unlisted:
+            print(f"   {page}")
+
+    print("\n" + "="*70)
+    if broken or qr_missing:
+        print(f"❌ {len(broken)} broken links, {len(qr_missing)} QR codes without a page")
+    else:
+        print("✅ No broken links")
+    print("="*70)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'broken': [{'page': page, 'reference': reference} for page, reference in broken],
+                'qr_missing': [{'code': name, 'path': path} for name, path in qr_missing],
+                'orphans': orphans,
+                'unreferenced': unreferenced,
+                'unlisted_clues': unlisted,
+            }, f, indent=2)
+
+    sys.exit(1 if broken or qr_missing else 0)
+
+if __name__ == "__main__":
+    main()
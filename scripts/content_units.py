@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Content units shared by the site build tools
+A data JSON file holds one or more separately viewable units (a journal
+entry, a botanical specimen, a document). This module finds the clue page
+that shows each unit and the game phase each unit belongs to
+(data/phases.json)
+"""
+
+import json
+import re
+from pathlib import Path
+
+from page_dependencies import DependencyParser, strip_query
+
+PHASES_FILE = 'data/phases.json'
+
+# How a clue page picks its part of a JSON file
+ID_SELECTOR = re.compile(r"\.id\s*===\s*'([^']+)'")
+TITLE_SELECTOR = re.compile(r"\.title\s*===\s*'([^']+)'")
+INDEX_SELECTOR = re.compile(r"ENTRY_INDEX\s*=\s*(\d+)|entries(?:\s*\|\|\s*\[\]\))?\[(\d+)\]")
+SPOILER_SELECTOR = re.compile(r"find\(\s*\w+\s*=>\s*\w+\.is_spoiler\s*\)")
+
+def page_selectors(script_text):
+    """What part of its JSON a clue page shows: list of (kind, value)"""
+    selectors = [('id', value) for value in ID_SELECTOR.findall(script_text)]
+    selectors += [('title', value) for value in TITLE_SELECTOR.findall(script_text)]
+    selectors += [('index', int(a or b)) for a, b in INDEX_SELECTOR.findall(script_text)]
+    if SPOILER_SELECTOR.search(script_text):
+        selectors.append(('spoiler', None))
+    return selectors or [('all', None)]
+
+def locate_pages(root: Path, page_dirs=('clue',)):
+    """
+    Map each data JSON file to the pages that fetch it
+
+    Returns:
+        dict of JSON path (relative to root) -> list of (page, selectors)
+    """
+    pages = {}
+    for page_dir in page_dirs:
+        for page_path in sorted((root / page_dir).rglob('*.html')):
+            if page_path.name == 'template.html':
+                continue
+            parser = DependencyParser()
+            text = page_path.read_text(encoding='utf-8', errors='replace')
+            parser.feed(text)
+            for kind, reference in parser.dependencies:
+                if kind != 'json':
+                    continue
+                json_path = (page_path.parent / strip_query(reference)).resolve()
+                try:
+                    relative = json_path.relative_to(root).as_posix()
+                except ValueError:
+                    continue
+                pages.setdefault(relative, []).append(
+                    (page_path.relative_to(root).as_posix(), page_selectors(text))
+                )
+    return pages
+
+def iter_units(data):
+    """
+    The separately viewable parts of a data file: (key, unit) pairs where
+    key is ('index', n) for journal entries, ('id', id) for list items,
+    or None for a single document
+    """
+    if isinstance(data, dict) and isinstance(data.get('entries'), list):
+        for index, entry in enumerate(data['entries']):
+            yield ('index', index), entry
+        return
+    lists = [value for value in data.values() if isinstance(value, list)] if isinstance(data, dict) else []
+    if len(lists) == 1 and all(isinstance(item, dict) and 'id' in item for item in lists[0]):
+        for item in lists[0]:
+            yield ('id', item['id']), item
+        return
+    if isinstance(data, dict):
+        yield None, data.get('document', data)
+
+def page_for(key, unit, candidates):
+    """The first page (from locate_pages) that shows this unit, or None"""
+    for page, selectors in candidates:
+        for kind, value in selectors:
+            if kind == 'spoiler':
+                matched = bool(unit.get('is_spoiler'))
+            elif kind == 'title':
+                matched = unit.get('title') == value
+            elif kind == 'all':
+                matched = not unit.get('is_spoiler')
+            else:
+                matched = key == (kind, value)
+            if matched:
+                return page
+    return None
+
+def load_phases(root: Path):
+    """The phase configuration: {'default': name, 'phases': [...]}"""
+    with open(root / PHASES_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def phase_of(unit, phases):
+    """
+    The game phase a unit is unlocked in: its own 'phase' field if set,
+    else the first phase whose flags all match (a missing flag counts as
+    false), else the default phase
+    """
+    if isinstance(unit, dict) and unit.get('phase'):
+        return unit['phase']
+    for phase in phases['phases']:
+        match = phase.get('match')
+        if match and all(bool(unit.get(flag)) == value for flag, value in match.items()):
+            return phase['name']
+    return phases['default']
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Cut Grid for Murder Mystery Game
+The card decks are laid out butted edge to edge, so neighbouring cards
+share a cut: a 3 x 2 sheet is trimmed with 4 vertical and 3 horizontal
+guillotine passes, and a stack of sheets is cut in the same 7 passes.
+CutGrid adds what makes those cuts quick and accurate: a bleed band of
+the card colour past the grid's outer trim lines (so a slightly-off outer
+cut shows no white sliver) and crop marks in the margin in line with
+every cut. Inner cuts have no bleed; that is the price of shared cuts.
+"""
+
+# Print defaults (in inches)
+BLEED = 0.125
+MARK_OFFSET = 0.04  # gap between the bleed and a crop mark
+MARK_LENGTH = 0.25
+MARK_COLOR = 'black'
+
+class CutGrid:
+    """A sheet's grid of butted cards, its cut lines, bleed and crop marks"""
+
+    def __init__(self, margin_px, card_w_px, card_h_px, cols, rows, dpi, page_size_px, bleed=BLEED):
+        self.left = margin_px
+        self.top = margin_px
+        self.card_w = card_w_px
+        self.card_h = card_h_px
+        self.cols = cols
+        self.rows = rows
+        self.page_w, self.page_h = page_size_px
+        self.bleed = round(bleed * dpi)
+        self.mark_offset = max(1, round(MARK_OFFSET * dpi))
+        self.line_width = max(1, round(dpi / 150))
+
+        # Crop marks get whatever margin is left outside the bleed, up to MARK_LENGTH
+        room = min(self.left, self.top, self.page_w - self.right, self.page_h - self.bottom)
+        self.mark_length = min(round(MARK_LENGTH * dpi), room - self.bleed - self.mark_offset)
+
+    @property
+    def right(self):
+        return self.left + self.cols * self.card_w
+
+    @property
+    def bottom(self):
+        return self.top + self.rows * self.card_h
+
+    def slots(self):
+        """Card boxes (x, y, width, height), in reading order"""
+        return [(self.left + col * self.card_w, self.top + row * self.card_h, self.card_w, self.card_h)
+                for row in range(self.rows) for col in range(self.cols)]
+
+    def cut_lines(self):
+        """(x positions of vertical cuts, y positions of horizontal cuts)"""
+        xs = [self.left + col * self.card_w for col in range(self.cols + 1)]
+        ys = [self.top + row * self.card_h for row in range(self.rows + 1)]
+        return xs, ys
+
+    def guillotine_passes(self):
+        """Cuts for a stack of sheets; cards cut separately would need 4 each"""
+        xs, ys = self.cut_lines()
+        return len(xs) + len(ys)
+
+    def bleed_box(self, flip=None):
+        """
+        The grid plus bleed; with flip ('long' or 'short' edge), where that
+        lands on the back of the sheet
+        """
+        left, top, right, bottom = self.left, self.top, self.right, self.bottom
+        if flip == 'long':
+            left, right = self.page_w - right, self.page_w - left
+        elif flip == 'short':
+            top, bottom = self.page_h - bottom, self.page_h - top
+        return [left - self.bleed, top - self.bleed, right + self.bleed, bottom + self.bleed]
+
+    def draw_bleed(self, draw, color, flip=None):
+        """Fill the bleed band in the card colour (call before drawing the cards)"""
+        if self.bleed:
+            draw.rectangle(self.bleed_box(flip), fill=color)
+
+    def draw_sheet(self, draw, color):
+        """Bleed and crop marks for a new sheet, before its cards are drawn"""
+        self.draw_bleed(draw, color)
+        self.draw_crop_marks(draw)
+
+    def draw_crop_marks(self, draw):
+        """Marks in the margin, in line with every cut"""
+        if self.mark_length <= 0:
+            return
+        xs, ys = self.cut_lines()
+        near = self.bleed + self.mark_offset
+        far = near + self.mark_length
+        for x in xs:
+            draw.line([(x, self.top - far), (x, self.top - near)], fill=MARK_COLOR, width=self.line_width)
+            draw.line([(x, self.bottom + near), (x, self.bottom + far)], fill=MARK_COLOR, width=self.line_width)
+        for y in ys:
+            draw.line([(self.left - far, y), (self.left - near, y)], fill=MARK_COLOR, width=self.line_width)
+            draw.line([(self.right + near, y), (self.right + far, y)], fill=MARK_COLOR, width=self.line_width)
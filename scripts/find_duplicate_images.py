@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Duplicate Image Finder for Murder Mystery Game
+Repeated Gemini runs leave near-identical copies of the same picture in
+several folders. This finds them by perceptual hash rather than by bytes,
+so re-encoded, resized or slightly recompressed copies still match.
+
+Every image is reduced to a small grayscale thumbnail (JPEGs are decoded
+at reduced size straight away) and given two 64-bit hashes:
+- aHash: which of 8 x 8 pixels are brighter than the mean
+- dHash: which of 9 x 8 pixels are brighter than their right neighbour
+Two images are near-duplicates when both hashes differ in at most
+--threshold bits. Hashes are computed in parallel, and matches are found
+through an index of hash bands instead of comparing every pair: if two
+64-bit hashes differ in at most t bits, split into t + 1 bands at least
+one band is identical, so only images sharing a band are compared.
+
+Duplicates are reported in groups. Hashes this small also match distinct
+images that are flat or built from the same template (QR codes above all),
+so with --link a copy is only replaced by a hard link to the group's
+largest image after a full-resolution check that it is pixel-identical
+(same file type only); the rest are only reported. QR code directories are
+skipped: every code looks alike to these hashes.
+"""
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageChops
+
+from optimize_images import is_qr_code
+from precompress_assets import format_size
+
+DEFAULT_DIRS = ['assets', 'images']
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.webp'}
+
+HASH_SIZE = 8
+
+# Bits two hashes may differ in and still be the same picture
+DEFAULT_THRESHOLD = 4
+
+def iter_images(roots):
+    """Yield every image file under the given directories"""
+    for root in roots:
+        root = Path(root)
+        if root.is_dir():
+            for path in sorted(root.rglob('*')):
+                if path.suffix.lower() in IMAGE_EXTENSIONS and path.is_file():
+                    yield path
+
+def bits_to_int(bits):
+    value = 0
+    for bit in bits:
+        value = (value << 1) | bit
+    return value
+
+def image_hashes(path):
+    """
+    aHash and dHash of one image (run in a worker process)
+
+    Returns:
+        (path, (ahash, dhash, width, height), error or None)
+    """
+    try:
+        with Image.open(path) as image:
+            width, height = image.size
+            # JPEG: decode at 1/8 scale or less instead of full size
+            image.draft('L', (HASH_SIZE * 8, HASH_SIZE * 8))
+            gray = image.convert('L')
+        small = gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BILINEAR)
+        pixels = small.tobytes()
+        rows = [pixels[row * (HASH_SIZE + 1):(row + 1) * (HASH_SIZE + 1)] for row in range(HASH_SIZE)]
+        dhash = bits_to_int(row[col] > row[col + 1] for row in rows for col in range(HASH_SIZE))
+
+        square = gray.resize((HASH_SIZE, HASH_SIZE), Image.Resampling.BILINEAR).tobytes()
+        mean = sum(square) / len(square)
+        ahash = bits_to_int(value > mean for value in square)
+    except Exception as e:
+        return path, None, str(e)
+    return path, (ahash, dhash, width, height), None
+
+def distance(a, b):
+    return bin(a ^ b).count('1')
+
+def hash_bands(value, bands):
+    """Split a 64-bit hash into bands (band number, bits) for the index"""
+    bits = HASH_SIZE * HASH_SIZE
+    edges = [round(i * bits / bands) for i in range(bands + 1)]
+    return [(i, (value >> (bits - end)) & ((1 << (end - start)) - 1))
+            for i, (start, end) in enumerate(zip(edges, edges[1:]))]
+
+def find_groups(hashes, threshold):
+    """
+    Group near-duplicate images
+
+    Args:
+        hashes: {path: (ahash, dhash, width, height)}
+
+    Returns:
+        list of groups (lists of paths), largest image first
+    """
+    paths = list(hashes)
+    index = defaultdict(list)
+    for number, path in enumerate(paths):
+        for band in hash_bands(hashes[path][1], threshold + 1):
+            index[band].append(number)
+
+    # Union-find over matching pairs
+    parent = list(range(len(paths)))
+
+    def root(number):
+        while parent[number] != number:
+            parent[number] = parent[parent[number]]
+            number = parent[number]
+        return number
+
+    compared = set()
+    for members in index.values():
+        for i, first in enumerate(members):
+            for second in members[i + 1:]:
+                if (first, second) in compared:
+                    continue
+                compared.add((first, second))
+                a_first, d_first = hashes[paths[first]][:2]
+                a_second, d_second = hashes[paths[second]][:2]
+                if distance(d_first, d_second) <= threshold and distance(a_first, a_second) <= threshold:
+                    parent[root(second)] = root(first)
+
+    groups = defaultdict(list)
+    for number, path in enumerate(paths):
+        groups[root(number)].append(path)
+
+    def keep_order(path):
+        _, _, width, height = hashes[path]
+        return (-width * height, len(path.parts), str(path))
+
+    return [sorted(group, key=keep_order) for group in groups.values() if len(group) > 1]
+
+def pixel_identical(first: Path, second: Path):
+    """True if two images decode to the same size and the same pixels"""
+    with Image.open(first) as a, Image.open(second) as b:
+        if a.size != b.size:
+            return False
+        return ImageChops.difference(a.convert('RGBA'), b.convert('RGBA')).getbbox() is None
+
+def hard_link(original: Path, duplicate: Path):
+    """Replace duplicate with a hard link to original"""
+    temp = duplicate.with_name(duplicate.name + '.link')
+    os.link(original, temp)
+    os.replace(temp, duplicate)
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Find near-duplicate images by perceptual hash"
+    )
+    parser.add_argument(
+        "dirs",
+        nargs="*",
+        default=DEFAULT_DIRS,
+        help=f"Directories to search (default: {' '.join(DEFAULT_DIRS)})"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=int,
+        default=DEFAULT_THRESHOLD,
+        help=f"Hash bits two images may differ in (default: {DEFAULT_THRESHOLD}; 0 = visually identical)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for hashing (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Replace each pixel-identical copy with a hard link to the largest image of its group"
+    )
+    args = parser.parse_args()
+    if not 0 <= args.threshold < HASH_SIZE * HASH_SIZE // 2:
+        parser.error(f"--threshold must be between 0 and {HASH_SIZE * HASH_SIZE // 2 - 1}")
+
+    paths = [path for path in iter_images(args.dirs) if not is_qr_code(path)]
+
+    print("="*70)
+    print("🔍 Duplicate Image Finder")
+    print(f"   {len(paths)} images in {', '.join(args.dirs)}; aHash + dHash within {args.threshold} bits")
+    print("   = identical copy, ~ similar only (never linked); QR code directories skipped")
+    print("="*70 + "\n")
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        results = list(executor.map(image_hashes, paths, chunksize=16))
+
+    hashes = {}
+    for path, hashed, error in results:
+        if error:
+            print(f"  ❌ {path}: {error}")
+        else:
+            hashes[path] = hashed
+
+    groups = find_groups(hashes, args.threshold)
+
+    # Only pixel-identical copies of the original's file type can be hard-linked
+    reclaimable = similar = other_type = linked = 0
+    for group in groups:
+        original = group[0]
+        width, height = hashes[original][2:]
+        print(f"📷 {original} ({width}x{height})")
+        for duplicate in group[1:]:
+            width, height = hashes[duplicate][2:]
+            size = duplicate.stat().st_size
+            if os.path.samefile(original, duplicate):
+                print(f"   = {duplicate} ({width}x{height}, already linked)")
+                continue
+            if duplicate.suffix.lower() != original.suffix.lower():
+                other_type += size
+                marker = '~'
+            elif not pixel_identical(original, duplicate):
+                similar += size
+                marker = '~'
+            else:
+                reclaimable += size
+                marker = '='
+                if args.link:
+                    hard_link(original, duplicate)
+                    linked += 1
+            print(f"   {marker} {duplicate} ({width}x{height}, {format_size(size)})")
+
+    print("\n" + "="*70)
+    print(f"✅ {len(groups)} groups of near-duplicates among {len(hashes)} images")
+    print(f"   Identical copies take {format_size(reclaimable)}")
+    if similar:
+        print(f"   Similar but not identical copies take {format_size(similar)} (not linked)")
+    if other_type:
+        print(f"   Copies of another file type take {format_size(other_type)} (not linked)")
+    if args.link:
+        print(f"   Hard-linked: {linked} (copies of another file type are left alone)")
+    print("="*70)
+    sys.exit(1 if len(hashes) < len(results) else 0)
+
+if __name__ == "__main__":
+    main()
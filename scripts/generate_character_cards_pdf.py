@@ -9,8 +9,14 @@ Larger QR codes positioned to fit within borders
 import json
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
+import argparse
 import textwrap
 
+from card_backs import CardBacks
+from cut_grid import CutGrid
+from ink_coverage import save_ink
+from vector_canvas import RasterDocument, VectorDocument, fit_size, paste_fitted, vector_available
+
 # Page and card dimensions (in inches)
 PAGE_WIDTH = 8.5
 PAGE_HEIGHT = 11
@@ -36,6 +42,8 @@ COLS = USABLE_WIDTH // CARD_W_PX  # 3 cards
 ROWS = USABLE_HEIGHT // CARD_H_PX  # 2 cards
 CARDS_PER_PAGE = COLS * ROWS
 
+OUTPUT_FILE = 'character_cards.pdf'
+
 # Character names for display
 CHARACTER_NAMES = {
     'artcollector': 'Art Collector',
@@ -80,7 +88,7 @@ def draw_ornate_border(draw, x, y, width, height, line_width=2, color='#8B7355')
                      cx + corner_size, cy + corner_size], 
                     fill=color)
 
-def create_character_card(character_key: str, character_name: str, image_path: str, qr_path: str):
+def create_character_card(character_key: str, character_name: str, image_path: str, qr_path: str, target=None, ink_saver=0):
     """
     Create a single character card image
     Layout: Character name at top, image in middle, QR code at bottom (larger, fitted within borders)
@@ -89,16 +97,24 @@ def create_character_card(character_key: str, character_name: str, image_path: s
         PIL Image object for the card
     """
     # Create card with background
-    card = Image.new('RGB', (CARD_W_PX, CARD_H_PX), color='#F5E6D3')
-    draw = ImageDraw.Draw(card)
+    if target is None:
+        card = Image.new('RGB', (CARD_W_PX, CARD_H_PX), color='#F5E6D3')
+        draw = ImageDraw.Draw(card)
+    else:
+        card = draw = target
+        draw.rectangle([0, 0, CARD_W_PX, CARD_H_PX], fill='#F5E6D3')
     
     # Draw ornate border
     draw_ornate_border(draw, 5, 5, CARD_W_PX - 10, CARD_H_PX - 10, color='#8B7355')
     
     try:
         # Load fonts
-        name_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 12)
-        small_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 8)
+        if target is not None:
+            name_font = draw.font(["/System/Library/Fonts/Georgia.ttf"], 12)
+            small_font = draw.font(["/System/Library/Fonts/Georgia.ttf"], 8)
+        else:
+            name_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 12)
+            small_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 8)
     except:
         name_font = ImageFont.load_default()
         small_font = ImageFont.load_default()
@@ -124,20 +140,20 @@ def create_character_card(character_key: str, character_name: str, image_path: s
     
     try:
         if Path(image_path).exists():
-            img = Image.open(image_path)
+            img = save_ink(Image.open(image_path), ink_saver)
             
-            # Resize image to fit available space
+            # Fit image to available space
             img_height = int(available_height * 0.95)  # Use most of available space
-            img.thumbnail((CARD_W_PX - 20, img_height), Image.Resampling.LANCZOS)
+            img_w, img_h = fit_size(img.size, (CARD_W_PX - 20, img_height))
             
             # Center image horizontally
-            img_x = (CARD_W_PX - img.width) // 2
+            img_x = (CARD_W_PX - img_w) // 2
             img_y = img_y_pos
             
-            # Paste image onto card
-            card.paste(img, (img_x, img_y))
+            # Paste image onto card (full resolution in vector output)
+            paste_fitted(card, img, (img_x, img_y, img_w, img_h))
             
-            img_y_pos = img_y + img.height + 3
+            img_y_pos = img_y + img_h + 3
             image_loaded = True
     except Exception as e:
         print(f"  ⚠️ Could not load image for {character_key}: {e}")
@@ -147,15 +163,15 @@ def create_character_card(character_key: str, character_name: str, image_path: s
         if Path(qr_path).exists():
             qr = Image.open(qr_path)
             
-            # Resize QR code to fit
-            qr.thumbnail((qr_size, qr_size), Image.Resampling.LANCZOS)
+            # Fit QR code
+            qr_w, qr_h = fit_size(qr.size, (qr_size, qr_size))
             
             # Center QR code horizontally and position near bottom with padding
-            qr_x = (CARD_W_PX - qr.width) // 2
-            qr_y = CARD_H_PX - qr.height - qr_bottom_padding  # Position with bottom padding
+            qr_x = (CARD_W_PX - qr_w) // 2
+            qr_y = CARD_H_PX - qr_h - qr_bottom_padding  # Position with bottom padding
             
             # Paste QR code
-            card.paste(qr, (qr_x, qr_y))
+            paste_fitted(card, qr, (qr_x, qr_y, qr_w, qr_h))
     except Exception as e:
         # QR code might not exist, that's okay
         pass
@@ -164,6 +180,42 @@ def create_character_card(character_key: str, character_name: str, image_path: s
 
 def main():
     """Generate character cards PDF"""
+    parser = argparse.ArgumentParser(description="Generate character cards PDF")
+    parser.add_argument(
+        "--raster",
+        action="store_true",
+        help="Render pages as 72 DPI bitmaps instead of vector PDF"
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        help="Render bitmap pages at this print resolution (e.g. 300), one page in memory at a time"
+    )
+    parser.add_argument(
+        "--duplex",
+        choices=["long", "short"],
+        help="Add card backs after every sheet for double-sided printing, flipped on this edge"
+    )
+    parser.add_argument(
+        "--no-cut-marks",
+        action="store_true",
+        help="Leave out the bleed and crop marks around the card grid"
+    )
+    parser.add_argument(
+        "--ink-saver",
+        type=float,
+        default=0,
+        metavar="STRENGTH",
+        help="Lighten the portraits with the ink-saving tone curve, 0 (off) to 1 (see ink_coverage.py)"
+    )
+    args = parser.parse_args()
+    if not 0 <= args.ink_saver <= 1:
+        parser.error("--ink-saver must be between 0 and 1")
+    
+    vector = not args.raster and not args.dpi
+    if vector and not vector_available():
+        print("⚠️  reportlab not installed (pip install reportlab); rendering bitmap pages")
+        vector = False
     
     print("="*70)
     print("🎭 Character Cards PDF Generator (Final)")
@@ -172,10 +224,21 @@ def main():
     characters = sorted(CHARACTER_NAMES.keys())
     print(f"\nLoading {len(characters)} characters...")
     
-    # Create list to hold page images
+    # Create list to hold page images (or vector pages)
     pages = []
-    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
+    document = None
+    if vector:
+        document = VectorDocument(OUTPUT_FILE, (PAGE_W_PX, PAGE_H_PX), DPI, background='#FFFAF0')
+    elif args.dpi:
+        # Print resolution: same layout, each page streamed to the PDF when done
+        document = RasterDocument(OUTPUT_FILE, (PAGE_W_PX, PAGE_H_PX), DPI, args.dpi, background='#FFFAF0')
     current_card_index = 0
+    grid = CutGrid(MARGIN_PX, CARD_W_PX, CARD_H_PX, COLS, ROWS, DPI, (PAGE_W_PX, PAGE_H_PX))
+    cut_grid = None if args.no_cut_marks else grid
+    backs = None
+    if args.duplex:
+        backs = CardBacks("CHARACTER", (PAGE_W_PX, PAGE_H_PX), grid.slots(), args.duplex,
+                          background='#FFFAF0', cut_grid=cut_grid)
     
     print(f"Grid: {COLS} columns × {ROWS} rows = {CARDS_PER_PAGE} cards per page")
     print(f"QR codes: Correct GitHub URLs, fitted within borders\n")
@@ -189,8 +252,15 @@ def main():
         print(f"Card {card_idx:2d}: {character_name:<30}", end=" ")
         
         try:
-            # Create card
-            card = create_character_card(character_key, character_name, image_path, qr_path)
+            # Start a new page when the previous one is full
+            if current_card_index == 0:
+                if document:
+                    current_page = document.new_page()
+                else:
+                    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
+                if cut_grid:
+                    cut_grid.draw_sheet(current_page if document else ImageDraw.Draw(current_page), '#F5E6D3')
+                pages.append(current_page)
             
             # Calculate position on page
             row = current_card_index // COLS
@@ -199,41 +269,57 @@ def main():
             x = MARGIN_PX + (col * CARD_W_PX)
             y = MARGIN_PX + (row * CARD_H_PX)
             
-            # Paste card onto current page
-            current_page.paste(card, (x, y))
+            if document:
+                # Draw card in place on the vector (or print resolution) page
+                create_character_card(character_key, character_name, image_path, qr_path,
+                                      target=current_page.offset(x, y), ink_saver=args.ink_saver)
+            else:
+                # Create card and paste it onto current page
+                card = create_character_card(character_key, character_name, image_path, qr_path,
+                                             ink_saver=args.ink_saver)
+                current_page.paste(card, (x, y))
             current_card_index += 1
             
             print("✅")
             
             # Check if page is full
             if current_card_index >= CARDS_PER_PAGE:
-                pages.append(current_page)
-                current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
                 current_card_index = 0
+                if backs:
+                    pages.append(backs.add_to(document))
         
         except Exception as e:
             print(f"❌ Error: {e}")
     
-    # Add the last page if it has cards
-    if current_card_index > 0:
-        pages.append(current_page)
+    # Backs for the last, partly filled sheet
+    if backs and current_card_index > 0:
+        pages.append(backs.add_to(document))
     
     # Save as PDF
     print(f"\n📄 Saving PDF with {len(pages)} pages...")
     if pages:
-        pages[0].save(
-            'character_cards.pdf',
-            'PDF',
-            save_all=True,
-            append_images=pages[1:] if len(pages) > 1 else []
-        )
-        print(f"✅ Saved: character_cards.pdf")
+        if document:
+            document.save()
+        else:
+            pages[0].save(
+                OUTPUT_FILE,
+                'PDF',
+                save_all=True,
+                append_images=pages[1:] if len(pages) > 1 else []
+            )
+        print(f"✅ Saved: {OUTPUT_FILE}")
     
     print("\n" + "="*70)
     print(f"✅ Complete!")
     print(f"   Total cards: {len(characters)}")
     print(f"   Total pages: {len(pages)}")
-    print(f"   File: character_cards.pdf")
+    print(f"   File: {OUTPUT_FILE}")
+    if cut_grid:
+        print(f"   Cutting: {cut_grid.guillotine_passes()} guillotine passes per stack (shared cut lines)")
+    if backs:
+        print(f"   Duplex: card backs after every sheet ({args.duplex} edge flip)")
+    if args.ink_saver:
+        print(f"   Ink saver: portraits lightened at strength {args.ink_saver:g}")
     print("="*70)
 
 if __name__ == "__main__":
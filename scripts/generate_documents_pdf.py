@@ -2,15 +2,22 @@
 """
 Generate a PDF document with all game documents
 QR codes overlaid in the center to cover incorrect AI-generated text
-Layout: Full page or half page depending on document size
+Layout: documents are packed onto as few pages as possible (turned
+sideways or scaled down to --min-scale where that saves paper), or with
+--flow placed in data order on full or half pages depending on their shape
 Uses real artifact image for treasure map instead of AI-generated
 """
 
+import argparse
 import json
 from pathlib import Path
 from PIL import Image, ImageDraw
 import math
 
+from ink_coverage import save_ink
+from page_packing import plan_pages
+from vector_canvas import VectorDocument, fit_size, paste_fitted, vector_available
+
 # Page dimensions (in inches, 72 DPI)
 PAGE_WIDTH = 8.5
 PAGE_HEIGHT = 11
@@ -18,6 +25,15 @@ DPI = 72
 PAGE_W_PX = int(PAGE_WIDTH * DPI)
 PAGE_H_PX = int(PAGE_HEIGHT * DPI)
 
+OUTPUT_FILE = 'documents_visual.pdf'
+
+# Packed layout: page margin and space between documents
+PACK_MARGIN_PX = 20
+PACK_GAP_PX = 15
+
+# Smallest scale (of the full/half page size) documents stay legible at
+DEFAULT_MIN_SCALE = 0.75
+
 def load_documents():
     """Load documents from documents.json"""
     with open('data/documents.json', 'r') as f:
@@ -80,6 +96,27 @@ def create_document_with_qr(doc_image, qr_code, doc_id: str):
     
     return doc_img
 
+def place_document(page, doc_image, qr_code, box):
+    """
+    Draw a document with its QR overlay into box (x, y, width, height).
+    On a vector page the document and QR code stay separate images, each
+    stored once in the PDF however many copies are printed; on a bitmap
+    page they are composited first.
+    """
+    x, y, width, height = box
+    if isinstance(page, Image.Image):
+        doc_with_qr = create_document_with_qr(doc_image, qr_code, None)
+        page.paste(doc_with_qr.resize((width, height), Image.Resampling.LANCZOS), (x, y))
+        return
+    
+    paste_fitted(page, doc_image, box)
+    if qr_code is not None:
+        # Same proportions as create_document_with_qr
+        qr_scale = width / doc_image.width
+        qr_w, qr_h = fit_size(qr_code.size, (int(min(doc_image.size) / 2.5),) * 2)
+        qr_w, qr_h = max(1, int(qr_w * qr_scale)), max(1, int(qr_h * qr_scale))
+        paste_fitted(page, qr_code, (x + (width - qr_w) // 2, y + (height - qr_h) // 2, qr_w, qr_h))
+
 def determine_layout(doc_image):
     """
     Determine if document should be full page or half page
@@ -101,8 +138,100 @@ def determine_layout(doc_image):
     else:
         return ('half', PAGE_H_PX // 2)
 
+def flow_pages(sizes, layouts):
+    """
+    The data-order layout: full page documents alone, half page documents
+    stacked down the page until it is full
+
+    Returns:
+        list of pages, each a list of (index, x, y, width, height, rotated)
+    """
+    pages = []
+    current_page = None
+    current_y = 0
+    
+    for index, ((width, height), layout) in enumerate(zip(sizes, layouts)):
+        # Center horizontally
+        doc_x = (PAGE_W_PX - width) // 2
+        if layout == 'full':
+            # Full page document on a page of its own, centered
+            if current_page:
+                pages.append(current_page)
+            pages.append([(index, doc_x, (PAGE_H_PX - height) // 2, width, height, False)])
+            current_page = None
+            current_y = 0
+        else:
+            # Half page document; start a new page when this one is full
+            if current_page and current_y + height + 30 > PAGE_H_PX:
+                pages.append(current_page)
+                current_page = None
+                current_y = 0
+            if current_page is None:
+                current_page = []
+            doc_y = current_y + 15
+            current_page.append((index, doc_x, doc_y, width, height, False))
+            current_y = doc_y + height + 15
+    
+    # Add final page if it has content
+    if current_page:
+        pages.append(current_page)
+    return pages
+
+def packed_pages(sizes, min_scale):
+    """
+    Documents bin-packed onto the fewest pages, rotated where that helps
+    and shrunk no further than min_scale
+
+    Returns:
+        (scale used, pages as from flow_pages)
+    """
+    usable = (PAGE_W_PX - 2 * PACK_MARGIN_PX, PAGE_H_PX - 2 * PACK_MARGIN_PX)
+    scale, pages = plan_pages(sizes, usable, gap=PACK_GAP_PX, min_scale=min_scale)
+    return scale, [[(index, x + PACK_MARGIN_PX, y + PACK_MARGIN_PX, w, h, rotated)
+                     for index, x, y, w, h, rotated in page] for page in pages]
+
 def main():
     """Generate documents PDF"""
+    parser = argparse.ArgumentParser(description="Generate the game documents PDF")
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=1,
+        help="Number of copies of the document set to print (default: 1)"
+    )
+    parser.add_argument(
+        "--raster",
+        action="store_true",
+        help="Render pages as 72 DPI bitmaps instead of vector PDF"
+    )
+    parser.add_argument(
+        "--flow",
+        action="store_true",
+        help="Place documents in data order on full or half pages instead of packing them"
+    )
+    parser.add_argument(
+        "--min-scale",
+        type=float,
+        default=DEFAULT_MIN_SCALE,
+        help=f"Smallest scale packing may shrink documents to (default: {DEFAULT_MIN_SCALE})"
+    )
+    parser.add_argument(
+        "--ink-saver",
+        type=float,
+        default=0,
+        metavar="STRENGTH",
+        help="Lighten the images with the ink-saving tone curve, 0 (off) to 1 (see ink_coverage.py)"
+    )
+    args = parser.parse_args()
+    if not 0 < args.min_scale <= 1:
+        parser.error("--min-scale must be between 0 and 1")
+    if not 0 <= args.ink_saver <= 1:
+        parser.error("--ink-saver must be between 0 and 1")
+    
+    vector = not args.raster
+    if vector and not vector_available():
+        print("⚠️  reportlab not installed (pip install reportlab); rendering bitmap pages")
+        vector = False
     
     print("="*70)
     print("📄 Game Documents PDF Generator")
@@ -113,11 +242,8 @@ def main():
     documents = load_documents()
     print(f"\nProcessing {len(documents)} documents...\n")
     
-    # Create list to hold page images
-    pages = []
-    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='white')
-    current_y = 0
-    
+    # Load every document once; copies reuse them
+    prepared = []
     for i, doc in enumerate(documents, 1):
         doc_id = doc['id']
         title = doc['title']
@@ -130,20 +256,15 @@ def main():
             if doc_img is None:
                 print("❌ Image not found")
                 continue
-            
+            doc_img = save_ink(doc_img, args.ink_saver)
+
             # Load QR code
             qr_code = load_qr_code(doc_id)
             
-            # Create document with QR overlay
-            doc_with_qr = create_document_with_qr(doc_img, qr_code, doc_id)
-            if doc_with_qr is None:
-                print("❌ Failed to create document")
-                continue
-            
             # Determine layout
-            layout, layout_height = determine_layout(doc_with_qr)
+            layout, layout_height = determine_layout(doc_img)
             
-            # Resize document to fit page
+            # Fit document to page
             if layout == 'full':
                 # Full page
                 max_width = PAGE_W_PX - 40  # 20px margin on each side
@@ -154,75 +275,82 @@ def main():
                 max_height = (PAGE_H_PX // 2) - 30
             
             # Resize maintaining aspect ratio
-            doc_with_qr.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+            width, height = fit_size(doc_img.size, (max_width, max_height))
+            prepared.append((doc_id, doc_img, qr_code, layout, width, height))
             
-            # Check if document fits on current page
-            if layout == 'full':
-                # Full page document
-                if current_y > 0:
-                    # Start new page
-                    pages.append(current_page)
-                    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='white')
-                    current_y = 0
-                
-                # Center document on page
-                doc_x = (PAGE_W_PX - doc_with_qr.width) // 2
-                doc_y = (PAGE_H_PX - doc_with_qr.height) // 2
-                current_page.paste(doc_with_qr, (doc_x, doc_y))
-                
-                # Add page and start new one
-                pages.append(current_page)
-                current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='white')
-                current_y = 0
-                
-                is_real = " (Real Artifact)" if doc_id == 'treasure_map_hand_drawn' else ""
-                print(f"✅ (Full page){is_real}")
-            else:
-                # Half page document
-                if current_y + doc_with_qr.height + 30 > PAGE_H_PX:
-                    # Start new page
-                    pages.append(current_page)
-                    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='white')
-                    current_y = 0
-                
-                # Center horizontally, position vertically
-                doc_x = (PAGE_W_PX - doc_with_qr.width) // 2
-                doc_y = current_y + 15
-                current_page.paste(doc_with_qr, (doc_x, doc_y))
-                current_y = doc_y + doc_with_qr.height + 15
-                
-                is_real = " (Real Artifact)" if doc_id == 'treasure_map_hand_drawn' else ""
-                print(f"✅ (Half page){is_real}")
+            is_real = " (Real Artifact)" if doc_id == 'treasure_map_hand_drawn' else ""
+            print(f"✅ ({layout.capitalize()} page){is_real}")
         
         except Exception as e:
             print(f"❌ Error: {e}")
     
-    # Add final page if it has content
-    if current_y > 0:
-        pages.append(current_page)
+    # Every copy of every document, in print order
+    items = prepared * args.copies
+    sizes = [(width, height) for _, _, _, _, width, height in items]
+    flow = flow_pages(sizes, [layout for _, _, _, layout, _, _ in items])
+    packed = None
+    if not args.flow:
+        scale, packed = packed_pages(sizes, args.min_scale)
+        if len(packed) >= len(flow):
+            # Packing saves nothing; keep documents at full size and in order
+            packed = None
+    layout_pages = packed or flow
+    
+    document = VectorDocument(OUTPUT_FILE, (PAGE_W_PX, PAGE_H_PX), DPI, background='white') if vector else None
+    
+    # Turned documents are rotated once and shared by every copy
+    rotated_images = {}
+    
+    pages = []
+    for placements in layout_pages:
+        if document:
+            page = document.new_page()
+        else:
+            page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='white')
+        for index, x, y, width, height, rotated in placements:
+            doc_id, doc_img, qr_code, _, _, _ = items[index]
+            if rotated:
+                if doc_id not in rotated_images:
+                    rotated_images[doc_id] = doc_img.transpose(Image.Transpose.ROTATE_90)
+                doc_img = rotated_images[doc_id]
+            place_document(page, doc_img, qr_code, (x, y, width, height))
+        pages.append(page)
     
     # Save as PDF
     print(f"\n📄 Saving PDF with {len(pages)} pages...")
     if pages:
-        pages[0].save(
-            'documents_visual.pdf',
-            'PDF',
-            save_all=True,
-            append_images=pages[1:] if len(pages) > 1 else []
-        )
-        print(f"✅ Saved: documents_visual.pdf")
+        if document:
+            document.save()
+        else:
+            pages[0].save(
+                OUTPUT_FILE,
+                'PDF',
+                save_all=True,
+                append_images=pages[1:] if len(pages) > 1 else []
+            )
+        print(f"✅ Saved: {OUTPUT_FILE}")
     
     print("\n" + "="*70)
     print(f"✅ Complete!")
-    print(f"   Total documents: {len(documents)}")
+    print(f"   Total documents: {len(prepared)} x {args.copies} copies")
     print(f"   Total pages: {len(pages)}")
-    print(f"   File: documents_visual.pdf")
+    print(f"   File: {OUTPUT_FILE}")
+    if args.ink_saver:
+        print(f"   Ink saver: images lightened at strength {args.ink_saver:g}")
     print(f"   Features:")
     print(f"   - Document images with QR code overlays")
     print(f"   - QR codes cover incorrect AI text")
     print(f"   - Treasure Map uses real artifact image")
     print(f"   - Scan QR to see correct information")
-    print(f"   - Full/half page layouts")
+    if packed:
+        saved = len(flow) - len(packed)
+        print(f"   - Packed layout at {scale:.0%} size, rotation allowed")
+        print(f"   - Paper: {len(packed)} sheets vs {len(flow)} in data order "
+              f"({saved} saved, {saved / len(flow):.0%})")
+    else:
+        print(f"   - Full/half page layouts, in data order")
+    if document:
+        print(f"   - Vector PDF, {len(document.images.forms)} distinct images stored once each")
     print("="*70)
 
 if __name__ == "__main__":
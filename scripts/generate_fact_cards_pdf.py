@@ -11,6 +11,13 @@ import argparse
 import math
 import textwrap
 
+from card_backs import CardBacks
+from cut_grid import CutGrid
+from vector_canvas import VectorDocument, vector_available
+
+# Font files for the 1920s look, in order of preference
+CARD_FONTS = ["/System/Library/Fonts/Georgia.ttf", "/System/Library/Fonts/Helvetica.ttc"]
+
 def get_text_width(draw, text, font):
     """Get the width of text for centering"""
     try:
@@ -19,16 +26,143 @@ def get_text_width(draw, text, font):
     except:
         return len(text) * 6  # Fallback estimate
 
-def create_fact_cards_pdf(data_file="data/rumors.json", output_file="fact_cards.pdf"):
+def load_card_fonts(page=None):
+    """
+    (title, text, owner) fonts: PIL fonts for bitmap pages, or vector
+    fonts when page is a vector_canvas.PixelCanvas
+    """
+    sizes = (32, 14, 10)
+    if page is not None:
+        return tuple(page.font(CARD_FONTS, size) for size in sizes)
+    for font_file in CARD_FONTS:
+        try:
+            return tuple(ImageFont.truetype(font_file, size) for size in sizes)
+        except:
+            continue
+    # Fallback to default font
+    return tuple(ImageFont.load_default() for size in sizes)
+
+def draw_fact_card(draw, x, y, card_width_px, card_height_px, rumor, fonts):
+    """Draw one fact card with its top-left corner at (x, y)"""
+    title_font, text_font, owner_font = fonts
+    card_center_x = x + (card_width_px // 2)
+    
+    # Draw ornate card border (1920s style)
+    # Outer border
+    draw.rectangle(
+        [x, y, x + card_width_px, y + card_height_px],
+        outline='#1a1a1a',
+        width=3
+    )
+    # Inner decorative border
+    draw.rectangle(
+        [x + 4, y + 4, x + card_width_px - 4, y + card_height_px - 4],
+        outline='#4a4a4a',
+        width=1
+    )
+    
+    # Add decorative corner elements
+    # Top-left corner
+    draw.line([(x + 8, y + 6), (x + 12, y + 6)], fill='#1a1a1a', width=1)
+    draw.line([(x + 6, y + 8), (x + 6, y + 12)], fill='#1a1a1a', width=1)
+    # Top-right corner
+    draw.line([(x + card_width_px - 12, y + 6), (x + card_width_px - 8, y + 6)], fill='#1a1a1a', width=1)
+    draw.line([(x + card_width_px - 6, y + 8), (x + card_width_px - 6, y + 12)], fill='#1a1a1a', width=1)
+    
+    # Add title "FACT" centered
+    title_text = "FACT"
+    title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
+    title_width = title_bbox[2] - title_bbox[0]
+    title_x = card_center_x - (title_width // 2)
+    draw.text(
+        (title_x, y + 10),
+        title_text,
+        fill='#1a1a1a',
+        font=title_font
+    )
+    
+    # Decorative line under title
+    draw.line(
+        [(x + 12, y + 50), (x + card_width_px - 12, y + 50)],
+        fill='#2a2a2a',
+        width=2
+    )
+    
+    # Add decorative dots
+    dot_y = y + 50
+    draw.ellipse([(x + 16, dot_y - 2), (x + 20, dot_y + 2)], fill='#2a2a2a')
+    draw.ellipse([(x + card_width_px - 20, dot_y - 2), (x + card_width_px - 16, dot_y + 2)], fill='#2a2a2a')
+    
+    # Add fact text with word wrapping, centered
+    text = rumor.get('text', 'No text')
+    
+    # Wrap text at 13 characters per line for better fit with 14pt font
+    lines = textwrap.wrap(text, width=13)
+    
+    # Ensure we don't exceed card height
+    available_height = card_height_px - 120  # Space for title, decorations, attribution
+    line_spacing = 16
+    max_lines = available_height // line_spacing
+    
+    # Trim to fit
+    if len(lines) > max_lines:
+        lines = lines[:max_lines-1]
+        if lines:
+            lines[-1] = lines[-1].rstrip() + "..."
+    
+    # Calculate starting Y to center text vertically in available space
+    total_text_height = len(lines) * line_spacing
+    text_start_y = y + 60 + ((available_height - total_text_height) // 2)
+    
+    for i, line in enumerate(lines):
+        line_bbox = draw.textbbox((0, 0), line, font=text_font)
+        line_width = line_bbox[2] - line_bbox[0]
+        line_x = card_center_x - (line_width // 2)
+        draw.text(
+            (line_x, text_start_y + (i * line_spacing)),
+            line,
+            fill='#1a1a1a',
+            font=text_font
+        )
+    
+    # Decorative line before attribution
+    draw.line(
+        [(x + 12, y + card_height_px - 32), (x + card_width_px - 12, y + card_height_px - 32)],
+        fill='#2a2a2a',
+        width=1
+    )
+    
+    # Add who starts with this card at the bottom, centered
+    possession = rumor.get('possession', 'UNKNOWN').lower()
+    owner_text = f"— {possession.upper()} —"
+    owner_bbox = draw.textbbox((0, 0), owner_text, font=owner_font)
+    owner_width = owner_bbox[2] - owner_bbox[0]
+    owner_x = card_center_x - (owner_width // 2)
+    draw.text(
+        (owner_x, y + card_height_px - 24),
+        owner_text,
+        fill='#1a1a1a',
+        font=owner_font
+    )
+
+def create_fact_cards_pdf(data_file="data/rumors.json", output_file="fact_cards.pdf", role=None, vector=True,
+                          duplex=None, cut_marks=True):
     """
     Create a PDF with fact cards arranged in a grid (1920s style).
+    With role set, only the cards that character starts with (by the
+    cards' possession field) are printed.
+    With vector set (and reportlab installed), text and borders are written
+    as PDF vector operators; otherwise each page is a bitmap.
+    With duplex ('long' or 'short' edge), every sheet is followed by the
+    card backs, mirrored to line up behind the fronts.
+    With cut_marks, the grid gets a bleed and crop marks on every cut line.
     
     Layout:
     - Page size: 8.5" x 11" (letter)
     - Margins: 0.5" on all sides
     - Card size: 2.5" wide x 3.5" high
     - Grid: 3 columns x 2 rows = 6 cards per page
-    - DPI: 150 (standard screen viewing)
+    - DPI: 150 (pixel grid the layout is designed on; bitmap resolution)
     - Style: 1920s mystery with elegant typography, centered text
     """
     
@@ -84,6 +218,13 @@ def create_fact_cards_pdf(data_file="data/rumors.json", output_file="fact_cards.
         print(f"❌ Error: No rumors found in {data_file}")
         return False
     
+    if role:
+        rumors = [rumor for rumor in rumors if rumor.get('possession', '').lower() == role.lower()]
+        print(f"🎭 Role: {role} (cards with possession: {role})")
+        if not rumors:
+            print(f"❌ Error: {role} starts with no fact cards")
+            return False
+    
     print(f"📊 Found {len(rumors)} fact cards")
     print(f"📄 Generating PDF...\n")
     
@@ -93,27 +234,29 @@ def create_fact_cards_pdf(data_file="data/rumors.json", output_file="fact_cards.
     # Create pages
     pages = []
     card_index = 0
+    document = None
+    if vector:
+        document = VectorDocument(output_file, (page_width_px, page_height_px), dpi)
+    else:
+        fonts = load_card_fonts()
+    grid = CutGrid(margin_px, card_width_px, card_height_px, cols_per_page, rows_per_page, dpi,
+                   (page_width_px, page_height_px))
+    cut_grid = grid if cut_marks else None
+    backs = None
+    if duplex:
+        backs = CardBacks("FACT", (page_width_px, page_height_px), grid.slots(), duplex, cut_grid=cut_grid)
     
     for page_num in range(1, num_pages + 1):
-        # Create new page image
-        page_img = Image.new('RGB', (page_width_px, page_height_px), color='white')
-        draw = ImageDraw.Draw(page_img)
-        
-        # Try to load fonts (using system fonts for 1920s feel)
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 32)
-            text_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 14)
-            owner_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 10)
-        except:
-            try:
-                title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 32)
-                text_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 14)
-                owner_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 10)
-            except:
-                # Fallback to default font
-                title_font = ImageFont.load_default()
-                text_font = ImageFont.load_default()
-                owner_font = ImageFont.load_default()
+        if document:
+            # Vector page: text and borders are PDF operators
+            draw = page_img = document.new_page()
+            fonts = load_card_fonts(draw)
+        else:
+            # Create new page image
+            page_img = Image.new('RGB', (page_width_px, page_height_px), color='white')
+            draw = ImageDraw.Draw(page_img)
+        if cut_grid:
+            cut_grid.draw_sheet(draw, 'white')
         
         # Draw grid of cards
         for row in range(rows_per_page):
@@ -127,110 +270,12 @@ def create_fact_cards_pdf(data_file="data/rumors.json", output_file="fact_cards.
                 # Calculate position
                 x = margin_px + (col * card_width_px)
                 y = margin_px + (row * card_height_px)
-                card_center_x = x + (card_width_px // 2)
                 
                 # Get rumor/fact
                 rumor = rumors[card_index]
                 
                 try:
-                    # Draw ornate card border (1920s style)
-                    # Outer border
-                    draw.rectangle(
-                        [x, y, x + card_width_px, y + card_height_px],
-                        outline='#1a1a1a',
-                        width=3
-                    )
-                    # Inner decorative border
-                    draw.rectangle(
-                        [x + 4, y + 4, x + card_width_px - 4, y + card_height_px - 4],
-                        outline='#4a4a4a',
-                        width=1
-                    )
-                    
-                    # Add decorative corner elements
-                    # Top-left corner
-                    draw.line([(x + 8, y + 6), (x + 12, y + 6)], fill='#1a1a1a', width=1)
-                    draw.line([(x + 6, y + 8), (x + 6, y + 12)], fill='#1a1a1a', width=1)
-                    # Top-right corner
-                    draw.line([(x + card_width_px - 12, y + 6), (x + card_width_px - 8, y + 6)], fill='#1a1a1a', width=1)
-                    draw.line([(x + card_width_px - 6, y + 8), (x + card_width_px - 6, y + 12)], fill='#1a1a1a', width=1)
-                    
-                    # Add title "FACT" centered
-                    title_text = "FACT"
-                    title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
-                    title_width = title_bbox[2] - title_bbox[0]
-                    title_x = card_center_x - (title_width // 2)
-                    draw.text(
-                        (title_x, y + 10),
-                        title_text,
-                        fill='#1a1a1a',
-                        font=title_font
-                    )
-                    
-                    # Decorative line under title
-                    draw.line(
-                        [(x + 12, y + 50), (x + card_width_px - 12, y + 50)],
-                        fill='#2a2a2a',
-                        width=2
-                    )
-                    
-                    # Add decorative dots
-                    dot_y = y + 50
-                    draw.ellipse([(x + 16, dot_y - 2), (x + 20, dot_y + 2)], fill='#2a2a2a')
-                    draw.ellipse([(x + card_width_px - 20, dot_y - 2), (x + card_width_px - 16, dot_y + 2)], fill='#2a2a2a')
-                    
-                    # Add fact text with word wrapping, centered
-                    text = rumor.get('text', 'No text')
-                    
-                    # Wrap text at 13 characters per line for better fit with 14pt font
-                    lines = textwrap.wrap(text, width=13)
-                    
-                    # Ensure we don't exceed card height
-                    available_height = card_height_px - 120  # Space for title, decorations, attribution
-                    line_spacing = 16
-                    max_lines = available_height // line_spacing
-                    
-                    # Trim to fit
-                    if len(lines) > max_lines:
-                        lines = lines[:max_lines-1]
-                        if lines:
-                            lines[-1] = lines[-1].rstrip() + "..."
-                    
-                    # Calculate starting Y to center text vertically in available space
-                    total_text_height = len(lines) * line_spacing
-                    text_start_y = y + 60 + ((available_height - total_text_height) // 2)
-                    
-                    for i, line in enumerate(lines):
-                        line_bbox = draw.textbbox((0, 0), line, font=text_font)
-                        line_width = line_bbox[2] - line_bbox[0]
-                        line_x = card_center_x - (line_width // 2)
-                        draw.text(
-                            (line_x, text_start_y + (i * line_spacing)),
-                            line,
-                            fill='#1a1a1a',
-                            font=text_font
-                        )
-                    
-                    # Decorative line before attribution
-                    draw.line(
-                        [(x + 12, y + card_height_px - 32), (x + card_width_px - 12, y + card_height_px - 32)],
-                        fill='#2a2a2a',
-                        width=1
-                    )
-                    
-                    # Add who starts with this card at the bottom, centered
-                    possession = rumor.get('possession', 'UNKNOWN').lower()
-                    owner_text = f"— {possession.upper()} —"
-                    owner_bbox = draw.textbbox((0, 0), owner_text, font=owner_font)
-                    owner_width = owner_bbox[2] - owner_bbox[0]
-                    owner_x = card_center_x - (owner_width // 2)
-                    draw.text(
-                        (owner_x, y + card_height_px - 24),
-                        owner_text,
-                        fill='#1a1a1a',
-                        font=owner_font
-                    )
-                    
+                    draw_fact_card(draw, x, y, card_width_px, card_height_px, rumor, fonts)
                     card_index += 1
                     
                 except Exception as e:
@@ -238,10 +283,16 @@ def create_fact_cards_pdf(data_file="data/rumors.json", output_file="fact_cards.
                     card_index += 1
         
         pages.append(page_img)
+        if backs:
+            # Same back sheet after every front, drawn once
+            pages.append(backs.add_to(document))
     
     # Save as PDF
     if pages:
-        pages[0].save(output_file, save_all=True, append_images=pages[1:])
+        if document:
+            document.save()
+        else:
+            pages[0].save(output_file, save_all=True, append_images=pages[1:])
         
         print(f"{'='*60}")
         print(f"✅ PDF successfully created!")
@@ -250,6 +301,11 @@ def create_fact_cards_pdf(data_file="data/rumors.json", output_file="fact_cards.
         print(f"📊 Total pages: {len(pages)}")
         print(f"📦 Total fact cards: {len(rumors)}")
         print(f"✨ Style: 1920s Mystery - Centered, Readable Text")
+        print(f"🖋️  Output: {'vector' if document else f'{dpi} DPI bitmap'}")
+        if cut_grid:
+            print(f"✂️  Cutting: {cut_grid.guillotine_passes()} guillotine passes per stack (shared cut lines)")
+        if backs:
+            print(f"🔁 Duplex: card backs after every sheet ({duplex} edge flip)")
         print(f"{'='*60}\n")
         
         return True
@@ -272,10 +328,35 @@ def main():
         default="fact_cards.pdf",
         help="Output PDF filename (default: fact_cards.pdf)"
     )
+    parser.add_argument(
+        "--role",
+        help="Only print the cards this character starts with (e.g. heiress)"
+    )
+    parser.add_argument(
+        "--raster",
+        action="store_true",
+        help="Render pages as 150 DPI bitmaps instead of vector PDF"
+    )
+    parser.add_argument(
+        "--duplex",
+        choices=["long", "short"],
+        help="Add card backs after every sheet for double-sided printing, flipped on this edge"
+    )
+    parser.add_argument(
+        "--no-cut-marks",
+        action="store_true",
+        help="Leave out the bleed and crop marks around the card grid"
+    )
     
     args = parser.parse_args()
     
-    success = create_fact_cards_pdf(args.data, args.output)
+    vector = not args.raster
+    if vector and not vector_available():
+        print("⚠️  reportlab not installed (pip install reportlab); rendering bitmap pages")
+        vector = False
+    
+    success = create_fact_cards_pdf(args.data, args.output, args.role, vector, args.duplex,
+                                    cut_marks=not args.no_cut_marks)
     exit(0 if success else 1)
 
 if __name__ == "__main__":
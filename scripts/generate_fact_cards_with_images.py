@@ -121,7 +121,8 @@ def create_fact_card(fact_id, fact_text, image_path):
     
     try:
         if Path(image_path).exists():
-            img = Image.open(image_path)
+            # RGB, so palette images are scaled smoothly
+            img = Image.open(image_path).convert('RGB')
             
             # Calculate available space for text
             available_for_text = CARD_H_PX - title_end - TEXT_PADDING - TEXT_PADDING
@@ -4,10 +4,13 @@ Generate PDF with QR codes for ghost characters
 The Lonely Ghost (Alice), The Heartbroken Ghost (Cordelia), The Ghost of the Alchemist (Sebastian)
 """
 
+import argparse
 import os
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
+from vector_canvas import VectorDocument, fit_size, paste_fitted, vector_available
+
 # Page dimensions
 PAGE_WIDTH = 8.5
 PAGE_HEIGHT = 11
@@ -42,21 +45,8 @@ GHOSTS = [
     }
 ]
 
-def create_ghost_qr_pdf():
-    """Create a PDF with ghost character QR codes"""
-    
-    PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    QR_CODES_DIR = os.path.join(PROJECT_DIR, 'qr_codes')
-    OUTPUT_DIR = os.path.join(PROJECT_DIR, 'to_print')
-    
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    
-    print("👻 Creating Ghost Character QR Code PDF...")
-    print("=" * 60)
-    
-    # Create page
-    page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
-    draw = ImageDraw.Draw(page)
+def draw_ghost_page(page, draw, qr_dir, vector=False):
+    """Draw the ghost QR codes page"""
     
     # Draw border
     draw.rectangle([MARGIN_PX, MARGIN_PX, PAGE_W_PX - MARGIN_PX, PAGE_H_PX - MARGIN_PX],
@@ -64,9 +54,14 @@ def create_ghost_qr_pdf():
     
     # Title at top
     try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 16)
+        if vector:
+            title_font = draw.font(["/System/Library/Fonts/Georgia.ttf"], 16)
+            label_font = draw.font(["/System/Library/Fonts/Georgia.ttf"], 11)
+        else:
+            title_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 16)
+            label_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 11)
     except:
-        title_font = ImageFont.load_default()
+        title_font = label_font = ImageFont.load_default()
     
     title_y = MARGIN_PX + 0.25 * DPI
     draw.text((PAGE_W_PX / 2, title_y), "Ghost Characters", 
@@ -74,7 +69,6 @@ def create_ghost_qr_pdf():
     
     # Calculate grid positions (vertical layout, centered)
     spacing = int(0.4 * DPI)  # 0.4 inches between codes
-    total_height = (QR_SIZE_PX * len(GHOSTS)) + (spacing * (len(GHOSTS) - 1))
     grid_start_y = title_y + 0.6 * DPI
     
     # Center the QR codes horizontally
@@ -82,7 +76,7 @@ def create_ghost_qr_pdf():
     
     # Add QR codes vertically
     for idx, ghost in enumerate(GHOSTS):
-        qr_path = os.path.join(QR_CODES_DIR, ghost['qr_file'])
+        qr_path = os.path.join(qr_dir, ghost['qr_file'])
         
         # Calculate position
         y = grid_start_y + (QR_SIZE_PX + spacing) * idx
@@ -92,17 +86,12 @@ def create_ghost_qr_pdf():
         try:
             if Path(qr_path).exists():
                 qr_img = Image.open(qr_path)
-                qr_img.thumbnail((QR_SIZE_PX, QR_SIZE_PX), Image.Resampling.LANCZOS)
+                qr_w, qr_h = fit_size(qr_img.size, (QR_SIZE_PX, QR_SIZE_PX))
                 
-                # Paste QR code
-                page.paste(qr_img, (int(x_center), int(y)))
+                # Paste QR code (stored once in vector output, however many copies)
+                paste_fitted(page, qr_img, (int(x_center), int(y), qr_w, qr_h))
                 
                 # Add label below QR code
-                try:
-                    label_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 11)
-                except:
-                    label_font = ImageFont.load_default()
-                
                 label_y = int(y + QR_SIZE_PX + 0.15 * DPI)
                 label_x = int(PAGE_W_PX / 2)
                 draw.text((label_x, label_y), ghost['name'], 
@@ -113,20 +102,78 @@ def create_ghost_qr_pdf():
                 print(f"❌ (QR not found)")
         except Exception as e:
             print(f"❌ ({e})")
+
+def create_ghost_qr_pdf(copies=1, vector=True):
+    """Create a PDF with ghost character QR codes (one page per copy)"""
+    
+    PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    QR_CODES_DIR = os.path.join(PROJECT_DIR, 'qr_codes')
+    OUTPUT_DIR = os.path.join(PROJECT_DIR, 'to_print')
+    
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    
+    print("👻 Creating Ghost Character QR Code PDF...")
+    print("=" * 60)
     
-    # Save PDF
     pdf_path = os.path.join(OUTPUT_DIR, 'ghost_qr_codes.pdf')
-    page.save(pdf_path, 'PDF')
+    document = VectorDocument(pdf_path, (PAGE_W_PX, PAGE_H_PX), DPI, background='#FFFAF0') if vector else None
+    pages = []
+    
+    for copy in range(copies):
+        if copies > 1:
+            print(f"\n  Copy {copy + 1} of {copies}")
+        
+        # Create page
+        if document:
+            page = draw = document.new_page()
+        else:
+            page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
+            draw = ImageDraw.Draw(page)
+        draw_ghost_page(page, draw, QR_CODES_DIR, vector=document is not None)
+        pages.append(page)
+    
+    # Save PDF
+    if document:
+        document.save()
+    else:
+        pages[0].save(pdf_path, 'PDF', save_all=True, append_images=pages[1:])
     
     print("\n" + "=" * 60)
     print(f"✅ PDF Created: {pdf_path}")
     print(f"   Layout: Vertical Grid")
     print(f"   Size: 2.5 x 2.5 inches each")
     print(f"   Characters: {len(GHOSTS)}")
+    print(f"   Copies: {copies}")
     print("=" * 60)
 
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Generate the ghost character QR code page"
+    )
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=1,
+        help="Number of copies of the page to print (default: 1)"
+    )
+    parser.add_argument(
+        "--raster",
+        action="store_true",
+        help="Render pages as 72 DPI bitmaps instead of vector PDF"
+    )
+    
+    args = parser.parse_args()
+    
+    vector = not args.raster
+    if vector and not vector_available():
+        print("⚠️  reportlab not installed (pip install reportlab); rendering bitmap pages")
+        vector = False
+    
+    create_ghost_qr_pdf(args.copies, vector)
+
 if __name__ == '__main__':
-    create_ghost_qr_pdf()
+    main()
 
 
 
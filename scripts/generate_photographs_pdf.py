@@ -1,40 +1,57 @@
 #!/usr/bin/env python3
 """
 Generate a PDF with all photographs from clue_images/
-Layout: 2 photos per page in 4x6 inch frames
+Layout: each photograph in a frame of its print size (wallet, 4x6, 5x7),
+packed onto as few letter or A4 sheets as possible, with cut marks
 No QR codes
 """
 
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageDraw
+
+from ink_coverage import save_ink
+from page_packing import pack_pages
+
+# Paper sizes (in inches)
+PAPER_SIZES = {
+    'letter': (8.5, 11),
+    'a4': (8.27, 11.69),
+}
 
 # Page dimensions (in inches, 72 DPI)
-PAGE_WIDTH = 8.5
-PAGE_HEIGHT = 11
+PAGE_WIDTH, PAGE_HEIGHT = PAPER_SIZES['letter']
 DPI = 72
 PAGE_W_PX = int(PAGE_WIDTH * DPI)
 PAGE_H_PX = int(PAGE_HEIGHT * DPI)
 
+# Photo print sizes (width x height in inches, portrait)
+PRINT_SIZES = {
+    'wallet': (2.5, 3.5),
+    '4x6': (4, 6),
+    '5x7': (5, 7),
+}
+
 # Photo frame dimensions (in inches, converted to pixels)
-FRAME_WIDTH = 4  # inches
-FRAME_HEIGHT = 6  # inches
+FRAME_WIDTH, FRAME_HEIGHT = PRINT_SIZES['4x6']
 FRAME_W_PX = int(FRAME_WIDTH * DPI)
 FRAME_H_PX = int(FRAME_HEIGHT * DPI)
 
 # Page margins
-MARGIN_TOP = int(0.5 * DPI)
-MARGIN_BOTTOM = int(0.5 * DPI)
+MARGIN = int(0.5 * DPI)
 
-# Photos per page
-PHOTOS_PER_PAGE = 2
+# Space between frames; cut marks are drawn in it
+FRAME_GAP = int(0.25 * DPI)
+CUT_MARK_LENGTH = FRAME_GAP // 2 - 2
 
-# Photo files
+# Photo files and the size each is printed at
 PHOTO_FILES = [
-    'photograph_eleanor_baby.png',
-    'photograph_eleanor_child.png',
-    'photograph_eleanor_adolescent.png',
-    'romano_family_photo_harbor.png',
-    'romano_family_photograph2_at_home.png',
+    ('photograph_eleanor_baby.png', 'wallet'),
+    ('photograph_eleanor_child.png', 'wallet'),
+    ('photograph_eleanor_adolescent.png', '4x6'),
+    ('romano_family_photo_harbor.png', '5x7'),
+    ('romano_family_photograph2_at_home.png', '4x6'),
 ]
 
 def load_photograph(photo_filename):
@@ -44,13 +61,20 @@ def load_photograph(photo_filename):
         return Image.open(photo_path)
     return None
 
-def create_photo_frame(photo):
+def frame_size(print_size):
+    """Print size name -> frame size in pixels"""
+    width, height = PRINT_SIZES[print_size]
+    return int(width * DPI), int(height * DPI)
+
+def create_photo_frame(photo, frame_size=(FRAME_W_PX, FRAME_H_PX)):
     """
-    Create a 4x6 photo frame with centered photo
+    Create a photo frame (4x6 unless frame_size is given) with centered photo
     White background
     """
+    frame_w, frame_h = frame_size
+    
     # Create frame
-    frame = Image.new('RGB', (FRAME_W_PX, FRAME_H_PX), color='white')
+    frame = Image.new('RGB', (frame_w, frame_h), color='white')
     
     if photo is not None:
         # Convert photo to RGB if needed
@@ -59,99 +83,161 @@ def create_photo_frame(photo):
             photo_rgb = photo_rgb.convert('RGB')
         
         # Resize photo to fit in frame while maintaining aspect ratio
-        photo_rgb.thumbnail((FRAME_W_PX - 20, FRAME_H_PX - 20), Image.Resampling.LANCZOS)
+        photo_rgb.thumbnail((frame_w - 20, frame_h - 20), Image.Resampling.LANCZOS)
         
         # Center photo in frame
-        photo_x = (FRAME_W_PX - photo_rgb.width) // 2
-        photo_y = (FRAME_H_PX - photo_rgb.height) // 2
+        photo_x = (frame_w - photo_rgb.width) // 2
+        photo_y = (frame_h - photo_rgb.height) // 2
         
         # Paste photo
         frame.paste(photo_rgb, (photo_x, photo_y))
     
     return frame
 
+def prepare_frame(job):
+    """
+    Load a photograph and build its frame (run in a worker process)
+
+    Returns:
+        the frame image, or None if the photograph is missing
+    """
+    filename, size, ink_saver = job
+    photo = load_photograph(filename)
+    if photo is None:
+        return None
+    return create_photo_frame(save_ink(photo, ink_saver), size)
+
+def draw_cut_marks(draw, x, y, width, height):
+    """Short lines in the gap around a frame, in line with its edges"""
+    gap = 2
+    for corner_x, dx in ((x, -1), (x + width, 1)):
+        for corner_y, dy in ((y, -1), (y + height, 1)):
+            # Horizontal mark along the top/bottom edge, vertical along the side
+            draw.line([(corner_x + dx * gap, corner_y), (corner_x + dx * (gap + CUT_MARK_LENGTH), corner_y)],
+                      fill='black', width=1)
+            draw.line([(corner_x, corner_y + dy * gap), (corner_x, corner_y + dy * (gap + CUT_MARK_LENGTH))],
+                      fill='black', width=1)
+
+def parse_print_size(value):
+    """'photo_name=size' -> (photo name, size)"""
+    name, sep, size = value.partition('=')
+    if not sep or size not in PRINT_SIZES:
+        raise argparse.ArgumentTypeError(
+            f"expected NAME={'|'.join(PRINT_SIZES)}, got {value!r}"
+        )
+    return name.replace('.png', ''), size
+
 def main():
     """Generate photographs PDF"""
+    parser = argparse.ArgumentParser(description="Generate the prop photographs PDF")
+    parser.add_argument(
+        "--paper",
+        choices=sorted(PAPER_SIZES),
+        default='letter',
+        help="Sheet size (default: letter)"
+    )
+    parser.add_argument(
+        "--size",
+        action="append",
+        type=parse_print_size,
+        default=[],
+        metavar="NAME=SIZE",
+        help=f"Print a photograph at another size ({', '.join(PRINT_SIZES)}); repeatable"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for loading and resizing photos (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--output",
+        default='photographs.pdf',
+        help="Output PDF filename (default: photographs.pdf)"
+    )
+    parser.add_argument(
+        "--ink-saver",
+        type=float,
+        default=0,
+        metavar="STRENGTH",
+        help="Lighten the photographs with the ink-saving tone curve, 0 (off) to 1 (see ink_coverage.py)"
+    )
+    args = parser.parse_args()
+    if not 0 <= args.ink_saver <= 1:
+        parser.error("--ink-saver must be between 0 and 1")
+    
+    paper_w, paper_h = PAPER_SIZES[args.paper]
+    page_w_px, page_h_px = int(paper_w * DPI), int(paper_h * DPI)
+    overrides = dict(args.size)
+    photos = [(filename, overrides.get(filename.replace('.png', ''), size)) for filename, size in PHOTO_FILES]
     
     print("="*70)
-    print("📷 Photographs PDF Generator (4x6 Layout)")
-    print("   2 photos per page")
+    print("📷 Photographs PDF Generator (Mixed Print Sizes)")
+    print(f"   {args.paper.capitalize()} sheets, cut marks")
     print("="*70)
     
-    print(f"\nProcessing {len(PHOTO_FILES)} photographs...\n")
-    
-    # Create list to hold page images
-    pages = []
-    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='white')
-    
-    # Calculate positions for 2 frames per page (vertically stacked)
-    frame_spacing = 20  # pixels between frames
-    total_frames_height = (FRAME_H_PX * 2) + frame_spacing
-    start_y = (PAGE_H_PX - total_frames_height) // 2
-    frame_x = (PAGE_W_PX - FRAME_W_PX) // 2
-    
-    photo_positions = [
-        (frame_x, start_y),                           # Top frame
-        (frame_x, start_y + FRAME_H_PX + frame_spacing)  # Bottom frame
-    ]
+    print(f"\nProcessing {len(photos)} photographs...\n")
     
-    frame_index = 0
+    # Load and resize every photo in parallel
+    jobs = [(filename, frame_size(size), args.ink_saver) for filename, size in photos]
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        frames = list(executor.map(prepare_frame, jobs))
     
-    for filename in PHOTO_FILES:
+    placed = []
+    for (filename, size), frame in zip(photos, frames):
         photo_name = filename.replace('.png', '')
-        print(f"📷 {photo_name:<45}", end=" ")
-        
-        try:
-            # Load photograph
-            photo = load_photograph(filename)
-            if photo is None:
-                print("❌ Not found")
-                continue
-            
-            # Create photo frame
-            frame = create_photo_frame(photo)
-            
-            # Determine which position on page
-            position_index = frame_index % PHOTOS_PER_PAGE
-            
-            if position_index == 0 and frame_index > 0:
-                # Start new page
-                pages.append(current_page)
-                current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='white')
-            
-            # Paste frame on current page
-            frame_x_pos, frame_y_pos = photo_positions[position_index]
-            current_page.paste(frame, (frame_x_pos, frame_y_pos))
-            
-            frame_index += 1
-            print("✅")
-        
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        print(f"📷 {photo_name:<45} {size:<7}", end=" ")
+        if frame is None:
+            print("❌ Not found")
+            continue
+        placed.append((photo_name, frame))
+        print("✅")
+    
+    # Pack frames onto as few sheets as possible (turned sideways where that helps)
+    usable = (page_w_px - 2 * MARGIN, page_h_px - 2 * MARGIN)
+    try:
+        layout = pack_pages([frame.size for _, frame in placed], usable, gap=FRAME_GAP)
+    except ValueError as e:
+        print(f"\n❌ Error: {e} ({args.paper} sheet)")
+        return
     
-    # Add final page
-    if frame_index > 0:
+    # Create list to hold page images
+    pages = []
+    for placements in layout:
+        current_page = Image.new('RGB', (page_w_px, page_h_px), color='white')
+        draw = ImageDraw.Draw(current_page)
+        for index, x, y, width, height, rotated in placements:
+            frame = placed[index][1]
+            if rotated:
+                frame = frame.transpose(Image.Transpose.ROTATE_90)
+            current_page.paste(frame, (MARGIN + x, MARGIN + y))
+            draw_cut_marks(draw, MARGIN + x, MARGIN + y, width, height)
         pages.append(current_page)
     
     # Save as PDF
     print(f"\n📄 Saving PDF with {len(pages)} pages...")
     if pages:
         pages[0].save(
-            'photographs.pdf',
+            args.output,
             'PDF',
             save_all=True,
             append_images=pages[1:] if len(pages) > 1 else []
         )
-        print(f"✅ Saved: photographs.pdf")
+        print(f"✅ Saved: {args.output}")
+    
+    counts = {}
+    for _, size in photos:
+        counts[size] = counts.get(size, 0) + 1
     
     print("\n" + "="*70)
     print(f"✅ Complete!")
-    print(f"   Total photographs: {len(PHOTO_FILES)}")
+    print(f"   Total photographs: {len(placed)}")
     print(f"   Total pages: {len(pages)}")
-    print(f"   File: photographs.pdf")
+    print(f"   File: {args.output}")
     print(f"   Features:")
-    print(f"   - 4x6 inch photo frames")
-    print(f"   - 2 photos per page")
+    print(f"   - Print sizes: {', '.join(f'{count} x {size}' for size, count in counts.items())}")
+    print(f"   - Packed onto {args.paper} sheets, rotated where that saves paper")
+    print(f"   - Cut marks at every frame corner")
     print(f"   - Centered photos")
     print(f"   - Clean layout (no QR codes)")
     print("="*70)
@@ -11,8 +11,6 @@ def create_qr_code(url, filename, output_dir="qr_codes"):
     qr.add_data(url)
     qr.make(fit=True)
     qr_img = qr.make_image(fill_color="black", back_color="white")
-    if qr_img.mode != 'RGB':
-        qr_img = qr_img.convert('RGB')
     output_path = os.path.join(output_dir, f"{filename}.png")
     qr_img.save(output_path)
     print(f"✅ Generated: {output_path}")
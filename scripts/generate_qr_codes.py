@@ -9,32 +9,59 @@ import qrcode
 from qrcode.image.pure import PyPNGImage
 from PIL import Image, ImageDraw, ImageFont
 import json
+from functools import lru_cache
 from pathlib import Path
+from qr_manifest import add_code, load_manifest, record_code, save_manifest, url_to_page_path
+from short_links import STUB_DIR, allocate, load_links, resolve_path, save_links, short_link, short_url, write_stub
 
 # Base URL for the hosted game (change this to your GitHub Pages URL)
 BASE_URL = "https://filatova-elena.github.io/murder_mystery"
 
-def create_qr_code(url, filename, output_dir="qr_codes"):
+# Encode game pages as short q/<id>.html redirects (see short_links.py)
+USE_SHORT_LINKS = True
+
+# Site root, where data/short_links.json and the q/ stubs live (wherever this is run from)
+SITE_ROOT = Path(__file__).resolve().parent.parent
+
+def fit_qr_code(data):
     """
-    Create a QR code for a given URL and save it as an image file.
-    
-    Args:
-        url (str): The URL to encode in the QR code
-        filename (str): Name of the output file (without extension)
-        output_dir (str): Directory to save QR codes
+    Build the smallest QR code that holds data: the lowest version any
+    error-correction level fits in, at the highest level that still fits
+    that version.
     """
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    best = None
+    for error_correction in (qrcode.constants.ERROR_CORRECT_H, qrcode.constants.ERROR_CORRECT_Q,
+                             qrcode.constants.ERROR_CORRECT_M, qrcode.constants.ERROR_CORRECT_L):
+        qr = qrcode.QRCode(
+            version=None,
+            error_correction=error_correction,
+            box_size=10,
+            border=4,
+        )
+        qr.add_data(data)
+        qr.make(fit=True)
+        if best is None or qr.version < best.version:
+            best = qr
+    return best
+
+@lru_cache(maxsize=None)
+def label_font():
+    """Font for the URL strip (loaded once per process)"""
+    return ImageFont.load_default()
+
+def save_qr_png(img, path):
+    """Save a QR code image as a 1-bit PNG (it is pure black and white)"""
+    img.convert('1', dither=Image.Dither.NONE).save(path, optimize=True)
+
+def render_qr_image(url):
+    """
+    Render a QR code for url with the URL printed above it.
     
+    Returns:
+        (PIL image, qrcode.QRCode)
+    """
     # Generate QR code
-    qr = qrcode.QRCode(
-        version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
-        border=4,
-    )
-    qr.add_data(url)
-    qr.make(fit=True)
+    qr = fit_qr_code(url)
     
     # Create an image
     qr_img = qr.make_image(fill_color="black", back_color="white")
@@ -58,8 +85,7 @@ def create_qr_code(url, filename, output_dir="qr_codes"):
     # Add URL text
     try:
         draw = ImageDraw.Draw(img)
-        # Try to use a default font with size
-        font = ImageFont.load_default()
+        font = label_font()
         
         # Use textbbox instead of textsize (textsize is deprecated)
         bbox = draw.textbbox((0, 0), url, font=font)
@@ -71,13 +97,57 @@ def create_qr_code(url, filename, output_dir="qr_codes"):
     except Exception as e:
         print(f"Warning: Could not add text to QR code: {e}")
     
+    return img, qr
+
+def create_qr_code(url, filename, output_dir="qr_codes", manifest=None, links=None):
+    """
+    Create a QR code for a given URL and save it as an image file.
+    
+    Args:
+        url (str): The URL to encode in the QR code
+        filename (str): Name of the output file (without extension)
+        output_dir (str): Directory to save QR codes
+        manifest (dict): Loaded manifest to add the code to (the caller
+            saves it); without one, the manifest file is updated directly
+        links (dict): Loaded short link table to allocate ids in (the caller
+            saves it and writes the stubs); without one, data/short_links.json
+            and the stub are updated directly
+
+    Returns:
+        the PNG path, or None if the URL is a game page that does not exist
+    """
+    # Create output directory if it doesn't exist
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Game pages are encoded as their short link
+    page_path = url_to_page_path(url, BASE_URL)
+    if page_path is not None:
+        if page_path.startswith(STUB_DIR + '/'):
+            page_path = resolve_path(SITE_ROOT, page_path)
+        if not page_path or not (SITE_ROOT / page_path).is_file():
+            # No code (and no short id) for a page that would 404
+            print(f"⚠️  Skipping {filename}: {url} has no page in the site")
+            return None
+    if USE_SHORT_LINKS and page_path:
+        if links is None:
+            link_id = short_link(SITE_ROOT, page_path)
+        else:
+            link_id, _ = allocate(links, page_path)
+        url = short_url(BASE_URL, link_id)
+    
+    img, qr = render_qr_image(url)
+    
     # Save the image
     output_path = os.path.join(output_dir, f"{filename}.png")
-    img.save(output_path)
-    print(f"✓ Generated: {output_path} -> {url}")
+    save_qr_png(img, output_path)
+    if manifest is None:
+        record_code(filename, url, BASE_URL, output_dir, path=page_path)
+    else:
+        add_code(manifest, filename, url, BASE_URL, path=page_path)
+    print(f"✓ Generated: {output_path} -> {url} (version {qr.version})")
     return output_path
 
-def generate_botanical_qr_codes(output_dir="qr_codes"):
+def generate_botanical_qr_codes(output_dir="qr_codes", manifest=None, links=None):
     """Generate QR codes for all botanical clues"""
     print("\n📚 Generating Botanical Clue QR Codes...")
     
@@ -91,9 +161,9 @@ def generate_botanical_qr_codes(output_dir="qr_codes"):
     
     for botanical in botanicals:
         url = f"{BASE_URL}/clue/botanicals/{botanical}.html"
-        create_qr_code(url, f"botanical_{botanical}", output_dir)
+        create_qr_code(url, f"botanical_{botanical}", output_dir, manifest, links)
 
-def generate_document_qr_codes(output_dir="qr_codes"):
+def generate_document_qr_codes(output_dir="qr_codes", manifest=None, links=None):
     """Generate QR codes for all document clues"""
     print("\n📄 Generating Document QR Codes...")
     
@@ -109,9 +179,9 @@ def generate_document_qr_codes(output_dir="qr_codes"):
     
     for document in documents:
         url = f"{BASE_URL}/clue/documents/{document}.html"
-        create_qr_code(url, f"document_{document}", output_dir)
+        create_qr_code(url, f"document_{document}", output_dir, manifest, links)
 
-def generate_character_qr_codes(output_dir="qr_codes"):
+def generate_character_qr_codes(output_dir="qr_codes", manifest=None, links=None):
     """Generate QR codes for all characters"""
     print("\n👥 Generating Character QR Codes...")
     
@@ -123,9 +193,9 @@ def generate_character_qr_codes(output_dir="qr_codes"):
     
     for character in characters:
         url = f"{BASE_URL}/character/{character}.html"
-        create_qr_code(url, f"character_{character}", output_dir)
+        create_qr_code(url, f"character_{character}", output_dir, manifest, links)
 
-def generate_artifact_qr_codes(output_dir="qr_codes"):
+def generate_artifact_qr_codes(output_dir="qr_codes", manifest=None, links=None):
     """Generate QR codes for all artifact clues"""
     print("\n🎨 Generating Artifact QR Codes...")
     
@@ -140,9 +210,9 @@ def generate_artifact_qr_codes(output_dir="qr_codes"):
     
     for artifact in artifacts:
         url = f"{BASE_URL}/clue/artifacts/{artifact}.html"
-        create_qr_code(url, f"artifact_{artifact}", output_dir)
+        create_qr_code(url, f"artifact_{artifact}", output_dir, manifest, links)
 
-def generate_vision_qr_codes(output_dir="qr_codes"):
+def generate_vision_qr_codes(output_dir="qr_codes", manifest=None, links=None):
     """Generate QR codes for all vision pages"""
     print("\n👁️ Generating Vision QR Codes...")
     
@@ -150,21 +220,21 @@ def generate_vision_qr_codes(output_dir="qr_codes"):
     
     for vision in visions:
         url = f"{BASE_URL}/clue/vision/{vision}.html"
-        create_qr_code(url, f"vision_{vision}", output_dir)
+        create_qr_code(url, f"vision_{vision}", output_dir, manifest, links)
 
-def generate_custom_qr_code(url, filename, output_dir="qr_codes"):
+def generate_custom_qr_code(url, filename, output_dir="qr_codes", manifest=None, links=None):
     """Generate a QR code for a custom URL"""
     print(f"\n🔗 Generating Custom QR Code...")
-    create_qr_code(url, filename, output_dir)
+    create_qr_code(url, filename, output_dir, manifest, links)
 
-def generate_all_qr_codes(output_dir="qr_codes"):
+def generate_all_qr_codes(output_dir="qr_codes", manifest=None, links=None):
     """Generate all QR codes at once"""
     print(f"🎯 Generating all QR codes to: {output_dir}/")
-    generate_botanical_qr_codes(output_dir)
-    generate_document_qr_codes(output_dir)
-    generate_character_qr_codes(output_dir)
-    generate_artifact_qr_codes(output_dir)
-    generate_vision_qr_codes(output_dir)
+    generate_botanical_qr_codes(output_dir, manifest, links)
+    generate_document_qr_codes(output_dir, manifest, links)
+    generate_character_qr_codes(output_dir, manifest, links)
+    generate_artifact_qr_codes(output_dir, manifest, links)
+    generate_vision_qr_codes(output_dir, manifest, links)
     print(f"\n✅ All QR codes generated successfully!")
     print(f"📁 Find them in: {os.path.abspath(output_dir)}/")
 
@@ -172,7 +242,7 @@ def main():
     """Main entry point"""
     import argparse
     
-    global BASE_URL
+    global BASE_URL, USE_SHORT_LINKS
     
     parser = argparse.ArgumentParser(
         description="Generate QR codes for Murder Mystery game clues"
@@ -201,29 +271,46 @@ def main():
         default=BASE_URL,
         help=f"Base URL for generated links (default: {BASE_URL})"
     )
+    parser.add_argument(
+        "--long-urls",
+        action="store_true",
+        help="Encode full page URLs instead of short q/<id>.html links"
+    )
     
     args = parser.parse_args()
     
     # Update global BASE_URL if provided
     BASE_URL = args.base_url
+    USE_SHORT_LINKS = not args.long_urls
+    
+    if args.type == "custom" and (not args.url or not args.name):
+        print("❌ Error: --url and --name are required for custom QR codes")
+        return
     
+    # The manifest and the short link table are read once and written once,
+    # after every code is saved
+    manifest = load_manifest(args.output)
+    links = load_links(SITE_ROOT)
+    link_count = len(links)
     if args.type == "all":
-        generate_all_qr_codes(args.output)
+        generate_all_qr_codes(args.output, manifest, links)
     elif args.type == "botanicals":
-        generate_botanical_qr_codes(args.output)
+        generate_botanical_qr_codes(args.output, manifest, links)
     elif args.type == "documents":
-        generate_document_qr_codes(args.output)
+        generate_document_qr_codes(args.output, manifest, links)
     elif args.type == "characters":
-        generate_character_qr_codes(args.output)
+        generate_character_qr_codes(args.output, manifest, links)
     elif args.type == "artifacts":
-        generate_artifact_qr_codes(args.output)
+        generate_artifact_qr_codes(args.output, manifest, links)
     elif args.type == "visions":
-        generate_vision_qr_codes(args.output)
+        generate_vision_qr_codes(args.output, manifest, links)
     elif args.type == "custom":
-        if not args.url or not args.name:
-            print("❌ Error: --url and --name are required for custom QR codes")
-            return
-        generate_custom_qr_code(args.url, args.name, args.output)
+        generate_custom_qr_code(args.url, args.name, args.output, manifest, links)
+    save_manifest(manifest, args.output)
+    if len(links) > link_count:
+        save_links(SITE_ROOT, links)
+    for link_id, page_path in links.items():
+        write_stub(SITE_ROOT, link_id, page_path)
 
 if __name__ == "__main__":
     main()
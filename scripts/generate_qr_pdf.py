@@ -6,20 +6,38 @@ Uses PIL/Pillow to create the PDF
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 from pathlib import Path
 import argparse
 import math
 
-def create_qr_code_pdf(qr_dir="qr_codes", output_file="qr_codes_grid.pdf"):
+from pdf_stream import StreamingPdf
+
+# Resolution the sheet's fonts and insets were designed at
+BASE_DPI = 150
+
+@lru_cache(maxsize=None)
+def load_fonts(scale=1.0):
+    """(label font, title font) at scale times their 150 DPI size, loaded once per process"""
+    try:
+        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", round(20 * scale))
+        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", round(14 * scale))
+    except:
+        # Fallback to default font
+        font = ImageFont.load_default()
+        title_font = font
+    return font, title_font
+
+def sheet_layout(dpi=BASE_DPI):
     """
-    Create a PDF with QR codes arranged in a grid.
+    Sheet geometry in pixels.
     
     Layout:
     - Page size: 8.5" x 11" (letter)
     - Margins: 0.5" on all sides
     - QR code size: 2.5" x 2.5"
     - Grid: 3 columns x 4 rows = 12 QR codes per page
-    - DPI: 150 (standard screen viewing)
+    - DPI: 150 (standard screen viewing); 300 for print
     """
     
     # Page settings (in inches)
@@ -28,65 +46,64 @@ def create_qr_code_pdf(qr_dir="qr_codes", output_file="qr_codes_grid.pdf"):
     margin = 0.5
     qr_size = 2.5
     title_height = 0.5
-    dpi = 150
     
     # Convert to pixels
-    page_width_px = int(page_width * dpi)
-    page_height_px = int(page_height * dpi)
-    margin_px = int(margin * dpi)
-    qr_size_px = int(qr_size * dpi)
-    title_height_px = int(title_height * dpi)
+    layout = {
+        'page_width': page_width,
+        'page_height': page_height,
+        'margin': margin,
+        'qr_size': qr_size,
+        'dpi': dpi,
+        'page_width_px': int(page_width * dpi),
+        'page_height_px': int(page_height * dpi),
+        'margin_px': int(margin * dpi),
+        'qr_size_px': int(qr_size * dpi),
+        'title_height_px': int(title_height * dpi),
+    }
     
     # Calculate grid
-    usable_width_px = page_width_px - (2 * margin_px)
-    usable_height_px = page_height_px - (2 * margin_px) - title_height_px
-    
-    cols_per_page = int(usable_width_px / qr_size_px)  # 3 columns
-    rows_per_page = int(usable_height_px / qr_size_px)  # 4 rows
-    qr_codes_per_page = cols_per_page * rows_per_page
-    
-    print(f"\n{'='*60}")
-    print(f"QR Code PDF Generator for Murder Mystery")
-    print(f"{'='*60}")
-    print(f"Page size: {page_width}\" x {page_height}\"")
-    print(f"Margins: {margin}\" on all sides")
-    print(f"QR code size: {qr_size}\" x {qr_size}\"")
-    print(f"DPI: {dpi}")
-    print(f"Grid layout: {cols_per_page} columns × {rows_per_page} rows")
-    print(f"QR codes per page: {qr_codes_per_page}")
-    print(f"{'='*60}\n")
+    usable_width_px = layout['page_width_px'] - (2 * layout['margin_px'])
+    usable_height_px = layout['page_height_px'] - (2 * layout['margin_px']) - layout['title_height_px']
     
-    # Get all QR code files
-    qr_path = Path(qr_dir)
-    qr_files = sorted([f for f in qr_path.glob("*.png") if f.is_file()])
+    layout['cols_per_page'] = int(usable_width_px / layout['qr_size_px'])  # 3 columns
+    layout['rows_per_page'] = int(usable_height_px / layout['qr_size_px'])  # 4 rows
+    layout['qr_codes_per_page'] = layout['cols_per_page'] * layout['rows_per_page']
+    return layout
+
+def compose_pages(qr_files, layout):
+    """
+    Lay QR codes out on sheet images.
     
-    if not qr_files:
-        print(f"❌ Error: No QR codes found in {qr_dir}")
-        return False
+    Args:
+        qr_files: PNG paths, or (code name, PIL image) pairs for codes
+            rendered in memory
     
-    print(f"📊 Found {len(qr_files)} QR code files")
-    print(f"📄 Generating PDF...\n")
+    Yields:
+        (page image, list of (code name, cell box)) per page
+    """
+    margin_px = layout['margin_px']
+    qr_size_px = layout['qr_size_px']
+    # Insets and fonts are designed at 150 DPI
+    scale = layout['dpi'] / BASE_DPI
+    inset = round(5 * scale)
+    label_height = round(20 * scale)
+    title_height_px = layout['title_height_px']
+    cols_per_page = layout['cols_per_page']
+    rows_per_page = layout['rows_per_page']
     
     # Calculate number of pages
-    num_pages = math.ceil(len(qr_files) / qr_codes_per_page)
+    num_pages = math.ceil(len(qr_files) / layout['qr_codes_per_page'])
     
-    # Create pages
-    pages = []
     qr_index = 0
     
     for page_num in range(1, num_pages + 1):
         # Create new page image
-        page_img = Image.new('RGB', (page_width_px, page_height_px), color='white')
+        page_img = Image.new('RGB', (layout['page_width_px'], layout['page_height_px']), color='white')
         draw = ImageDraw.Draw(page_img)
+        cells = []
         
         # Add page title
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 20)
-            title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 14)
-        except:
-            # Fallback to default font
-            font = ImageFont.load_default()
-            title_font = font
+        font, title_font = load_fonts(scale)
         
         title = f"Murder Mystery QR Codes - Page {page_num}"
         draw.text((margin_px, margin_px // 2), title, fill='black', font=title_font)
@@ -106,41 +123,87 @@ def create_qr_code_pdf(qr_dir="qr_codes", output_file="qr_codes_grid.pdf"):
                 
                 # Get QR code file
                 qr_file = qr_files[qr_index]
+                if isinstance(qr_file, tuple):
+                    name, source = qr_file
+                else:
+                    name, source = qr_file.stem, qr_file
                 
                 try:
                     # Load and resize QR code
-                    qr_img = Image.open(qr_file).convert('RGB')
-                    qr_img = qr_img.resize((qr_size_px - 10, qr_size_px - 30), Image.Resampling.LANCZOS)
+                    if isinstance(source, Image.Image):
+                        qr_img = source.convert('RGB')
+                    else:
+                        qr_img = Image.open(source).convert('RGB')
+                    
+                    # Scale uniformly (stretching distorts the modules) into the
+                    # area above the label; NEAREST keeps module edges sharp
+                    area_w, area_h = qr_size_px - 2 * inset, qr_size_px - 2 * inset - label_height
+                    factor = min(area_w / qr_img.width, area_h / qr_img.height)
+                    qr_w, qr_h = max(1, int(qr_img.width * factor)), max(1, int(qr_img.height * factor))
+                    qr_img = qr_img.resize((qr_w, qr_h), Image.Resampling.NEAREST)
                     
-                    # Paste QR code onto page
-                    page_img.paste(qr_img, (x + 5, y + 5))
+                    # Paste QR code onto page, centred in its area
+                    page_img.paste(qr_img, (x + inset + (area_w - qr_w) // 2, y + inset + (area_h - qr_h) // 2))
                     
                     # Draw border
-                    draw.rectangle([x, y, x + qr_size_px, y + qr_size_px], outline='black', width=1)
+                    draw.rectangle([x, y, x + qr_size_px, y + qr_size_px], outline='black', width=max(1, round(scale)))
                     
                     # Add filename
-                    filename = qr_file.stem
+                    filename = name
                     if len(filename) > 28:
                         filename = filename[:25] + "..."
-                    draw.text((x + 5, y + qr_size_px - 20), filename, fill='black', font=font)
+                    draw.text((x + inset, y + qr_size_px - label_height), filename, fill='black', font=font)
                     
+                    cells.append((name, (x, y, x + qr_size_px, y + qr_size_px)))
                     qr_index += 1
                     
                 except Exception as e:
-                    print(f"⚠️  Warning: Could not process {qr_file.name}: {e}")
+                    print(f"⚠️  Warning: Could not process {name}: {e}")
                     qr_index += 1
         
-        pages.append(page_img)
+        yield page_img, cells
+
+def create_qr_code_pdf(qr_dir="qr_codes", output_file="qr_codes_grid.pdf", dpi=BASE_DPI):
+    """
+    Create a PDF with QR codes arranged in a grid (see sheet_layout).
+    Pages are written as they are composed, so only one is in memory.
+    """
     
-    # Save as PDF
-    if pages:
-        pages[0].save(output_file, save_all=True, append_images=pages[1:])
-        
+    layout = sheet_layout(dpi)
+    
+    print(f"\n{'='*60}")
+    print(f"QR Code PDF Generator for Murder Mystery")
+    print(f"{'='*60}")
+    print(f"Page size: {layout['page_width']}\" x {layout['page_height']}\"")
+    print(f"Margins: {layout['margin']}\" on all sides")
+    print(f"QR code size: {layout['qr_size']}\" x {layout['qr_size']}\"")
+    print(f"DPI: {layout['dpi']}")
+    print(f"Grid layout: {layout['cols_per_page']} columns × {layout['rows_per_page']} rows")
+    print(f"QR codes per page: {layout['qr_codes_per_page']}")
+    print(f"{'='*60}\n")
+    
+    # Get all QR code files
+    qr_path = Path(qr_dir)
+    qr_files = sorted([f for f in qr_path.glob("*.png") if f.is_file()])
+    
+    if not qr_files:
+        print(f"❌ Error: No QR codes found in {qr_dir}")
+        return False
+    
+    print(f"📊 Found {len(qr_files)} QR code files")
+    print(f"📄 Generating PDF...\n")
+    
+    # Create pages, streaming each to the PDF
+    with StreamingPdf(output_file, dpi) as pdf:
+        for page_img, _ in compose_pages(qr_files, layout):
+            pdf.add_page(page_img)
+    
+    if pdf.page_count:
         print(f"{'='*60}")
         print(f"✅ PDF successfully created!")
         print(f"{'='*60}")
         print(f"📄 Filename: {output_file}")
-        print(f"📊 Total pages: {len(pages)}")
+        print(f"📊 Total pages: {pdf.page_count}")
         print(f"📦 Total QR codes: {len(qr_files)}")
         print(f"{'='*60}\n")
         
@@ -164,10 +227,16 @@ def main():
         default="qr_codes_grid.pdf",
         help="Output PDF filename (default: qr_codes_grid.pdf)"
     )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=BASE_DPI,
+        help=f"Sheet resolution; 300 for print (default: {BASE_DPI})"
+    )
     
     args = parser.parse_args()
     
-    success = create_qr_code_pdf(args.qr_dir, args.output)
+    success = create_qr_code_pdf(args.qr_dir, args.output, args.dpi)
     exit(0 if success else 1)
 
 if __name__ == "__main__":
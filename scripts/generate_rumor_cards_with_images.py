@@ -6,11 +6,16 @@ Adjusts image size if text doesn't fit, adds 10px padding
 Includes character attribution at bottom right
 """
 
+import argparse
 import json
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
 
+from card_backs import CardBacks
+from cut_grid import CutGrid
+from ink_coverage import save_ink
+
 # Page and card dimensions (in inches)
 PAGE_WIDTH = 8.5
 PAGE_HEIGHT = 11
@@ -66,7 +71,7 @@ def draw_ornate_border(draw, x, y, width, height, line_width=2, color='#8B7355')
                      cx + corner_size, cy + corner_size], 
                     fill=color)
 
-def create_rumor_card(rumor_id, rumor_text, possession, image_path):
+def create_rumor_card(rumor_id, rumor_text, possession, image_path, ink_saver=0):
     """
     Create a single rumor card image
     Dynamically adjusts image size if text doesn't fit
@@ -122,7 +127,8 @@ def create_rumor_card(rumor_id, rumor_text, possession, image_path):
     
     try:
         if Path(image_path).exists():
-            img = Image.open(image_path)
+            # RGB, so palette images are scaled smoothly
+            img = save_ink(Image.open(image_path).convert('RGB'), ink_saver)
             
             # Calculate available space for text
             available_for_text = CARD_H_PX - title_end - TEXT_PADDING - TEXT_PADDING
@@ -187,6 +193,40 @@ def create_rumor_card(rumor_id, rumor_text, possession, image_path):
 
 def main():
     """Generate rumor cards PDF"""
+    parser = argparse.ArgumentParser(description="Generate rumor cards PDF with images")
+    parser.add_argument(
+        "--duplex",
+        choices=["long", "short"],
+        help="Add card backs after every sheet for double-sided printing, flipped on this edge"
+    )
+    parser.add_argument(
+        "--no-cut-marks",
+        action="store_true",
+        help="Leave out the bleed and crop marks around the card grid"
+    )
+    parser.add_argument(
+        "--ink-saver",
+        type=float,
+        default=0,
+        metavar="STRENGTH",
+        help="Lighten the images with the ink-saving tone curve, 0 (off) to 1 (see ink_coverage.py)"
+    )
+    args = parser.parse_args()
+    if not 0 <= args.ink_saver <= 1:
+        parser.error("--ink-saver must be between 0 and 1")
+    
+    grid = CutGrid(MARGIN_PX, CARD_W_PX, CARD_H_PX, COLS, ROWS, DPI, (PAGE_W_PX, PAGE_H_PX))
+    cut_grid = None if args.no_cut_marks else grid
+    backs = None
+    if args.duplex:
+        backs = CardBacks("RUMOR", (PAGE_W_PX, PAGE_H_PX), grid.slots(), args.duplex,
+                          background='#FFFAF0', cut_grid=cut_grid)
+    
+    def new_sheet():
+        sheet = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
+        if cut_grid:
+            cut_grid.draw_sheet(ImageDraw.Draw(sheet), '#F5E6D3')
+        return sheet
     
     print("="*70)
     print("📋 Rumor Cards PDF Generator (with AI images)")
@@ -197,7 +237,7 @@ def main():
     
     # Create list to hold page images
     pages = []
-    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
+    current_page = new_sheet()
     current_card_index = 0
     
     print(f"Grid: {COLS} columns × {ROWS} rows = {CARDS_PER_PAGE} cards per page")
@@ -214,7 +254,7 @@ def main():
         
         try:
             # Create card
-            card = create_rumor_card(rumor_id, rumor_text, possession, image_path)
+            card = create_rumor_card(rumor_id, rumor_text, possession, image_path, args.ink_saver)
             
             # Calculate position on page
             row = current_card_index // COLS
@@ -232,7 +272,10 @@ def main():
             # Check if page is full
             if current_card_index >= CARDS_PER_PAGE:
                 pages.append(current_page)
-                current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
+                if backs:
+                    # The same back image after every front
+                    pages.append(backs.image())
+                current_page = new_sheet()
                 current_card_index = 0
         
         except Exception as e:
@@ -241,6 +284,8 @@ def main():
     # Add the last page if it has cards
     if current_card_index > 0:
         pages.append(current_page)
+        if backs:
+            pages.append(backs.image())
     
     # Save as PDF
     print(f"\n📄 Saving PDF with {len(pages)} pages...")
@@ -263,6 +308,12 @@ def main():
     print(f"   Text padding: {TEXT_PADDING}px")
     print(f"   Character attribution: Bottom right (tiny text)")
     print(f"   Dynamic image sizing: Enabled (adjusts for text fit)")
+    if cut_grid:
+        print(f"   Cutting: {cut_grid.guillotine_passes()} guillotine passes per stack (shared cut lines)")
+    if backs:
+        print(f"   Duplex: card backs after every sheet ({args.duplex} edge flip)")
+    if args.ink_saver:
+        print(f"   Ink saver: images lightened at strength {args.ink_saver:g}")
     print("="*70)
 
 if __name__ == "__main__":
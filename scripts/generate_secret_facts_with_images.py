@@ -4,12 +4,16 @@ Generate secret facts PDF with AI-generated images, ornate 1920s styling
 Creates new_secret_facts.pdf with images and matching rumor_cards.pdf style
 """
 
+import argparse
 import json
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 import textwrap
 import os
 
+from ink_coverage import save_ink
+from vector_canvas import RasterDocument, fit_size, paste_fitted
+
 # Page and card dimensions (in inches)
 PAGE_WIDTH = 8.5
 PAGE_HEIGHT = 11
@@ -59,27 +63,37 @@ def draw_ornate_border(draw, x, y, width, height, line_width=2, color='#8B7355')
                      cx + corner_size, cy + corner_size], 
                     fill=color)
 
-def create_secret_fact_card(fact_id, fact_text, possession, image_path):
+def create_secret_fact_card(fact_id, fact_text, possession, image_path, target=None, ink_saver=0):
     """
     Create a single secret fact card image
     Dynamically adjusts image size if text doesn't fit
     Includes character name at bottom right
+    With target (a print-resolution page view), the card is drawn in place
     
     Returns:
         PIL Image object for the card
     """
     # Create card with background
-    card = Image.new('RGB', (CARD_W_PX, CARD_H_PX), color='#F5E6D3')
-    draw = ImageDraw.Draw(card)
+    if target is None:
+        card = Image.new('RGB', (CARD_W_PX, CARD_H_PX), color='#F5E6D3')
+        draw = ImageDraw.Draw(card)
+    else:
+        card = draw = target
+        draw.rectangle([0, 0, CARD_W_PX, CARD_H_PX], fill='#F5E6D3')
     
     # Draw ornate border
     draw_ornate_border(draw, 5, 5, CARD_W_PX - 10, CARD_H_PX - 10, color='#8B7355')
     
     try:
         # Try to load fonts - fallback to default if not available
-        title_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 24)
-        text_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 10)
-        tiny_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 7)
+        if target is not None:
+            title_font = draw.font(["/System/Library/Fonts/Georgia.ttf"], 24)
+            text_font = draw.font(["/System/Library/Fonts/Georgia.ttf"], 10)
+            tiny_font = draw.font(["/System/Library/Fonts/Georgia.ttf"], 7)
+        else:
+            title_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 24)
+            text_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 10)
+            tiny_font = ImageFont.truetype("/System/Library/Fonts/Georgia.ttf", 7)
     except:
         # Fallback to default font
         title_font = ImageFont.load_default()
@@ -115,7 +129,7 @@ def create_secret_fact_card(fact_id, fact_text, possession, image_path):
     
     try:
         if Path(image_path).exists():
-            img = Image.open(image_path)
+            img = save_ink(Image.open(image_path), ink_saver)
             
             # Calculate available space for text
             available_for_text = CARD_H_PX - title_end - TEXT_PADDING - TEXT_PADDING
@@ -132,16 +146,16 @@ def create_secret_fact_card(fact_id, fact_text, possession, image_path):
                     break
             
             img_height = int(CARD_H_PX * image_height_percent)
-            img.thumbnail((CARD_W_PX - 20, img_height), Image.Resampling.LANCZOS)
+            img_w, img_h = fit_size(img.size, (CARD_W_PX - 20, img_height))
             
             # Center image horizontally
-            img_x = (CARD_W_PX - img.width) // 2
+            img_x = (CARD_W_PX - img_w) // 2
             img_y = title_end
             
-            # Paste image onto card
-            card.paste(img, (img_x, img_y))
+            # Paste image onto card (resampled once, at output resolution)
+            paste_fitted(card, img, (img_x, img_y, img_w, img_h))
             
-            content_start = img_y + img.height + TEXT_PADDING
+            content_start = img_y + img_h + TEXT_PADDING
             image_loaded = True
     except Exception as e:
         print(f"  ⚠️ Could not load image: {e}")
@@ -180,6 +194,22 @@ def create_secret_fact_card(fact_id, fact_text, possession, image_path):
 
 def main():
     """Generate secret facts PDF"""
+    parser = argparse.ArgumentParser(description="Generate secret facts PDF with images")
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        help="Render pages at this print resolution (e.g. 300), one page in memory at a time"
+    )
+    parser.add_argument(
+        "--ink-saver",
+        type=float,
+        default=0,
+        metavar="STRENGTH",
+        help="Lighten the images with the ink-saving tone curve, 0 (off) to 1 (see ink_coverage.py)"
+    )
+    args = parser.parse_args()
+    if not 0 <= args.ink_saver <= 1:
+        parser.error("--ink-saver must be between 0 and 1")
     
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_dir = os.path.dirname(script_dir)
@@ -206,9 +236,14 @@ def main():
     
     print(f"\nLoading {len(facts)} secret facts...")
     
-    # Create list to hold page images
+    output_path = os.path.join(project_dir, 'to_print', 'new_secret_facts.pdf')
+    
+    # Create list to hold page images (or print resolution pages)
     pages = []
-    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
+    document = None
+    if args.dpi:
+        # Same layout, each page streamed to the PDF when done
+        document = RasterDocument(output_path, (PAGE_W_PX, PAGE_H_PX), DPI, args.dpi, background='#FFFAF0')
     current_card_index = 0
     
     print(f"Grid: {COLS} columns × {ROWS} rows = {CARDS_PER_PAGE} cards per page")
@@ -224,8 +259,12 @@ def main():
         print(f"Card {fact_idx:2d}: {fact_text[:50]:<50} ({possession})", end=" ")
         
         try:
-            # Create card
-            card = create_secret_fact_card(fact_id, fact_text, possession, image_path)
+            # Start a new page when the previous one is full
+            if current_card_index == 0:
+                if document:
+                    current_page = document.new_page()
+                else:
+                    current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
             
             # Calculate position on page
             row = current_card_index // COLS
@@ -234,8 +273,15 @@ def main():
             x = MARGIN_PX + (col * CARD_W_PX)
             y = MARGIN_PX + (row * CARD_H_PX)
             
-            # Paste card onto current page
-            current_page.paste(card, (x, y))
+            if document:
+                # Draw card in place on the print resolution page
+                create_secret_fact_card(fact_id, fact_text, possession, image_path,
+                                        target=current_page.offset(x, y), ink_saver=args.ink_saver)
+            else:
+                # Create card and paste it onto current page
+                card = create_secret_fact_card(fact_id, fact_text, possession, image_path,
+                                               ink_saver=args.ink_saver)
+                current_page.paste(card, (x, y))
             current_card_index += 1
             
             print("✅")
@@ -243,7 +289,6 @@ def main():
             # Check if page is full
             if current_card_index >= CARDS_PER_PAGE:
                 pages.append(current_page)
-                current_page = Image.new('RGB', (PAGE_W_PX, PAGE_H_PX), color='#FFFAF0')
                 current_card_index = 0
         
         except Exception as e:
@@ -254,9 +299,11 @@ def main():
         pages.append(current_page)
     
     # Save as PDF
-    output_path = os.path.join(project_dir, 'to_print', 'new_secret_facts.pdf')
     print(f"\n📄 Saving PDF with {len(pages)} pages...")
-    if pages:
+    if document:
+        document.save()
+        print(f"✅ Saved: {output_path}")
+    elif pages:
         pages[0].save(
             output_path,
             'PDF',
@@ -271,10 +318,13 @@ def main():
     print(f"   Total pages: {len(pages)}")
     print(f"   File: new_secret_facts.pdf")
     print(f"   Card dims: {CARD_WIDTH}\" × {CARD_HEIGHT}\"")
+    print(f"   Resolution: {args.dpi or DPI} DPI")
     print(f"   Title: FACT")
     print(f"   Text padding: {TEXT_PADDING}px")
     print(f"   Character attribution: Bottom right (tiny text)")
     print(f"   Image sizing: Dynamic (adjusts for text fit)")
+    if args.ink_saver:
+        print(f"   Ink saver: images lightened at strength {args.ink_saver:g}")
     print("="*70)
 
 if __name__ == "__main__":
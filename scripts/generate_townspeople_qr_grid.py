@@ -100,7 +100,7 @@ def create_qr_grid():
         
         try:
             if Path(qr_path).exists():
-                qr_img = Image.open(qr_path)
+                qr_img = Image.open(qr_path).convert('RGB')
                 qr_img.thumbnail((QR_SIZE_PX, QR_SIZE_PX), Image.Resampling.LANCZOS)
                 
                 # Paste QR code
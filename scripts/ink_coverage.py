@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Ink Coverage for Murder Mystery Game
+Estimates how much ink every page of the print PDFs in to_print/ takes,
+so ink savings (crop_dark_background_images.py, --ink-saver) can be
+measured instead of guessed.
+
+Pages are rendered at a low resolution (coverage is an average, so detail
+does not matter) and converted to CMYK with full black generation: the ink
+all three colours share is printed as black, the rest as C, M and Y. The
+conversion and averages run on whole image planes in PIL, not per pixel.
+Coverage is the fraction of the page area a channel would cover at full
+strength; the total (up to 400%) is what drives toner use.
+
+The same module has the ink-saving tone curve the generators apply to the
+dark sepia images before composing them (--ink-saver STRENGTH).
+Needs pypdfium2 (pip install pypdfium2) to render the PDFs.
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import ImageChops, ImageOps, ImageStat
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+PRINT_DIR = 'to_print'
+REPORT_FILE = 'to_print/ink_coverage.json'
+
+# Coverage is an average over the page; 50 DPI is plenty
+RENDER_DPI = 50
+
+CHANNELS = 'CMYK'
+
+# Darkest tone left after the ink-saving curve at full strength
+INK_SAVER_FLOOR = 96
+
+def cmyk_planes(image):
+    """RGB image -> C, M, Y, K planes (0 = no ink, 255 = full ink)"""
+    inverted = ImageOps.invert(image.convert('RGB'))
+    cyan, magenta, yellow = inverted.split()
+    black = ImageChops.darker(ImageChops.darker(cyan, magenta), yellow)
+    return [ImageChops.subtract(cyan, black), ImageChops.subtract(magenta, black),
+            ImageChops.subtract(yellow, black), black]
+
+def ink_coverage(image):
+    """
+    Returns:
+        {'C': ..., 'M': ..., 'Y': ..., 'K': ..., 'total': ...} as
+        fractions of the image area at full strength
+    """
+    coverage = {channel: ImageStat.Stat(plane).mean[0] / 255
+                for channel, plane in zip(CHANNELS, cmyk_planes(image))}
+    coverage['total'] = sum(coverage.values())
+    return coverage
+
+def ink_saver_curve(strength):
+    """
+    Tone curve (256-entry lookup table) that lightens shadows most and
+    leaves highlights alone: blacks are lifted to INK_SAVER_FLOOR * strength
+    and the rest is brightened with a gamma of 1 / (1 + strength)
+    """
+    floor = INK_SAVER_FLOOR * strength
+    gamma = 1 / (1 + strength)
+    return [round(floor + (255 - floor) * (value / 255) ** gamma) for value in range(256)]
+
+def save_ink(image, strength):
+    """
+    Lighten an image with the ink-saving tone curve (strength 0 to 1)
+    before it is composed onto a page; transparency is kept
+    """
+    if not strength:
+        return image
+    if image.mode not in ('RGB', 'RGBA', 'L'):
+        image = image.convert('RGBA' if 'transparency' in image.info or 'A' in image.getbands() else 'RGB')
+    curve = ink_saver_curve(strength)
+    table = []
+    for band in image.getbands():
+        table.extend(range(256) if band == 'A' else curve)
+    return image.point(table)
+
+def render_pages(pdf_path, dpi=RENDER_DPI):
+    """Yield each page of a PDF as a PIL image"""
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        for index in range(len(pdf)):
+            page = pdf[index]
+            yield page.render(scale=dpi / 72).to_pil()
+            page.close()
+    finally:
+        pdf.close()
+
+def measure_pdf(job):
+    """
+    Coverage of every page of one PDF (run in a worker process)
+
+    Returns:
+        (pdf path, list of per-page coverage dicts, error or None); with an
+        ink-saver strength, each page also has 'saved_total'
+    """
+    pdf_path, dpi, strength = job
+    pages = []
+    try:
+        for number, image in enumerate(render_pages(pdf_path, dpi), 1):
+            coverage = ink_coverage(image)
+            coverage['page'] = number
+            if strength:
+                # Whole page lightened: an upper bound, the generators only lighten images
+                coverage['saved_total'] = ink_coverage(save_ink(image.convert('RGB'), strength))['total']
+            pages.append(coverage)
+    except Exception as e:
+        return pdf_path, pages, str(e)
+    return pdf_path, pages, None
+
+def summarize(pages):
+    """Average coverage per channel over a PDF's pages"""
+    keys = list(CHANNELS) + ['total'] + (['saved_total'] if pages and 'saved_total' in pages[0] else [])
+    return {key: sum(page[key] for page in pages) / len(pages) for key in keys}
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Estimate the ink coverage of the print PDFs"
+    )
+    parser.add_argument(
+        "pdfs",
+        nargs="*",
+        help=f"PDFs to measure (default: every PDF in {PRINT_DIR}/)"
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=RENDER_DPI,
+        help=f"Resolution pages are rendered at for measuring (default: {RENDER_DPI})"
+    )
+    parser.add_argument(
+        "--ink-saver",
+        type=float,
+        default=0,
+        metavar="STRENGTH",
+        help="Also estimate coverage with the ink-saving tone curve at this strength (0 to 1)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for measuring (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--report",
+        default=REPORT_FILE,
+        help=f"Per-page report file (default: {REPORT_FILE}; '' to skip)"
+    )
+    args = parser.parse_args()
+    if not 0 <= args.ink_saver <= 1:
+        parser.error("--ink-saver must be between 0 and 1")
+
+    if pdfium is None:
+        print("❌ Error: pypdfium2 is not installed (pip install pypdfium2)")
+        sys.exit(1)
+
+    pdfs = [Path(pdf) for pdf in args.pdfs] if args.pdfs else sorted(Path(PRINT_DIR).glob('*.pdf'))
+    if not pdfs:
+        print(f"❌ Error: no PDFs in {PRINT_DIR}/")
+        sys.exit(1)
+
+    print("="*70)
+    print("🖨️  Ink Coverage Estimator")
+    print(f"   {len(pdfs)} PDFs, rendered at {args.dpi} DPI, CMYK with full black generation")
+    if args.ink_saver:
+        print(f"   With --ink-saver {args.ink_saver:g} (upper bound: whole page lightened)")
+    print("="*70 + "\n")
+
+    jobs = [(pdf, args.dpi, args.ink_saver) for pdf in pdfs]
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        results = list(executor.map(measure_pdf, jobs))
+
+    header = f"{'PDF':<36} {'Pages':>5} {'C':>5} {'M':>5} {'Y':>5} {'K':>5} {'Total':>6} {'Max':>6}"
+    if args.ink_saver:
+        header += f" {'Saver':>6}"
+    print(header)
+    print("-" * len(header))
+
+    report = {}
+    all_pages = []
+    failed = 0
+    for pdf_path, pages, error in results:
+        if error or not pages:
+            print(f"{pdf_path.name:<36} ❌ {error or 'no pages'}")
+            failed += 1
+            continue
+        average = summarize(pages)
+        heaviest = max(page['total'] for page in pages)
+        line = (f"{pdf_path.name:<36} {len(pages):>5} "
+                + ' '.join(f"{average[channel]:>5.0%}" for channel in CHANNELS)
+                + f" {average['total']:>6.0%} {heaviest:>6.0%}")
+        if args.ink_saver:
+            line += f" {average['saved_total']:>6.0%}"
+        print(line)
+        report[str(pdf_path)] = {'average': average, 'pages': pages}
+        all_pages.extend((page['total'], pdf_path.name, page['page']) for page in pages)
+
+    if all_pages:
+        print("\nHeaviest pages:")
+        for total, name, number in sorted(all_pages, reverse=True)[:5]:
+            print(f"   {total:>5.0%}  {name} page {number}")
+
+    if args.report and report:
+        Path(args.report).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.report, 'w') as f:
+            json.dump({'dpi': args.dpi, 'ink_saver': args.ink_saver, 'pdfs': report}, f, indent=2)
+
+    print("\n" + "="*70)
+    print(f"✅ Measured {len(report)} PDFs ({len(all_pages)} pages)")
+    if args.report and report:
+        print(f"   Per-page report: {args.report}")
+    print("="*70)
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Load Test for Murder Mystery Venue Setups
+Simulates a room of phones scanning QR codes against a local server:
+each phone scans random codes from qr_codes/manifest.json, loads the page,
+then everything the page pulls in (script.js, style.css, fetched JSON, images).
+Reports p50/p95/p99 latency and bytes transferred.
+
+Start the server first, e.g.:
+    python scripts/serve_local.py --port 8000
+    python scripts/load_test_scans.py --url http://localhost:8000/murder_mystery --phones 15
+"""
+
+import argparse
+import gzip
+import http.client
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+from page_dependencies import images_in_json, parse_dependencies
+from qr_manifest import iter_targets
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# What a phone browser sends
+REQUEST_HEADERS = {
+    'User-Agent': 'MurderMysteryLoadTest/1.0 (simulated phone)',
+    'Accept-Encoding': 'br, gzip' if brotli else 'gzip',
+    'Connection': 'keep-alive',
+}
+
+def find_dependencies(html_text, page_url):
+    """(kind, absolute URL) of everything the page loads, without duplicates"""
+    dependencies = []
+    seen = set()
+    for kind, reference in parse_dependencies(html_text):
+        url = urljoin(page_url, reference)
+        if url not in seen:
+            seen.add(url)
+            dependencies.append((kind, url))
+    return dependencies
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+class Results:
+    """Thread-safe collection of request and page-load timings"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.request_times = []
+        self.page_times = []
+        self.bytes_received = 0
+        self.requests = 0
+        self.errors = []
+
+    def add_request(self, elapsed, num_bytes):
+        with self.lock:
+            self.request_times.append(elapsed)
+            self.bytes_received += num_bytes
+            self.requests += 1
+
+    def add_page(self, elapsed):
+        with self.lock:
+            self.page_times.append(elapsed)
+
+    def add_error(self, url, message):
+        with self.lock:
+            self.errors.append((url, message))
+
+class Phone:
+    """One simulated player: a keep-alive connection and a browser cache"""
+
+    def __init__(self, server_url, results):
+        parts = urlsplit(server_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.https = parts.scheme == 'https'
+        self.results = results
+        self.cache = set()
+        self.connection = None
+
+    def connect(self):
+        connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        self.connection = connection_class(self.host, self.port, timeout=30)
+
+    def get(self, url):
+        """
+        GET one URL over the phone's connection
+
+        Returns:
+            (status or None, body bytes as received, Content-Encoding or None)
+        """
+        path = urlsplit(url).path
+        for attempt in range(2):
+            if self.connection is None:
+                self.connect()
+            start = time.perf_counter()
+            try:
+                self.connection.request('GET', path, headers=REQUEST_HEADERS)
+                response = self.connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                # Server closed the keep-alive connection; reconnect once
+                self.connection.close()
+                self.connection = None
+                if attempt == 1:
+                    self.results.add_error(url, str(e))
+                    return None, b'', None
+                continue
+            self.results.add_request(time.perf_counter() - start, len(body))
+            if response.getheader('Connection', '').lower() == 'close':
+                self.connection.close()
+                self.connection = None
+            if response.status >= 400:
+                self.results.add_error(url, f"HTTP {response.status}")
+            return response.status, body, response.getheader('Content-Encoding')
+        return None, b'', None
+
+    def scan(self, page_url):
+        """Load a page and its dependencies like a browser after a QR scan"""
+        start = time.perf_counter()
+        status, body, encoding = self.get(page_url)
+        if status != 200:
+            return
+        text = decode_body(body, encoding)
+        for kind, dependency in find_dependencies(text, page_url):
+            # JSON is fetched with a cache-busting query, so it is never cached
+            if dependency in self.cache and kind != 'json':
+                continue
+            status, body, encoding = self.get(dependency)
+            self.cache.add(dependency)
+            if kind == 'json' and status == 200:
+                # Images inside fetched JSON are relative to the page, not the JSON
+                for reference in images_in_json(decode_body(body, encoding)):
+                    image_url = urljoin(page_url, reference)
+                    if image_url not in self.cache:
+                        self.get(image_url)
+                        self.cache.add(image_url)
+        self.results.add_page(time.perf_counter() - start)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+
+def decode_body(body, encoding):
+    """Decompress a response body for dependency parsing"""
+    if encoding == 'gzip':
+        body = gzip.decompress(body)
+    elif encoding == 'br':
+        body = brotli.decompress(body)
+    return body.decode('utf-8', errors='replace')
+
+def run_phone(server_url, targets, scans, think_time, start_barrier, results, seed):
+    """Worker: one phone performing a series of scans"""
+    rng = random.Random(seed)
+    phone = Phone(server_url, results)
+    start_barrier.wait()
+    try:
+        for _ in range(scans):
+            name, page_path = rng.choice(targets)
+            phone.scan(f"{server_url.rstrip('/')}/{page_path}")
+            if think_time:
+                time.sleep(rng.uniform(0, think_time))
+    finally:
+        phone.close()
+
+def format_ms(seconds):
+    return f"{seconds * 1000:8.1f} ms"
+
+def print_report(results, elapsed, phones, scans):
+    """Print latency percentiles and transfer totals"""
+    request_times = sorted(results.request_times)
+    page_times = sorted(results.page_times)
+
+    print("\n" + "="*70)
+    print("📊 Load Test Results")
+    print("="*70)
+    print(f"   Phones: {phones}   Scans per phone: {scans}   Wall time: {elapsed:.2f} s")
+    print(f"   Requests: {results.requests}   Page loads: {len(page_times)}   Errors: {len(results.errors)}")
+    if elapsed > 0:
+        print(f"   Throughput: {results.requests / elapsed:.1f} req/s")
+    print(f"   Bytes transferred: {results.bytes_received / 1024:.1f} KB"
+          f" ({results.bytes_received / max(1, len(page_times)) / 1024:.1f} KB per scan)")
+    print()
+    print(f"   {'':<14}{'p50':>11}{'p95':>11}{'p99':>11}{'max':>11}")
+    for label, values in (('Request', request_times), ('Page load', page_times)):
+        if values:
+            print(f"   {label:<14}{format_ms(percentile(values, 50)):>11}{format_ms(percentile(values, 95)):>11}"
+                  f"{format_ms(percentile(values, 99)):>11}{format_ms(values[-1]):>11}")
+
+    if results.errors:
+        print(f"\n⚠️  First errors:")
+        for url, message in results.errors[:10]:
+            print(f"   {message:<20} {url}")
+    print("="*70)
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Simulate a room of players scanning QR codes against a local server"
+    )
+    parser.add_argument(
+        "--url",
+        default="http://localhost:8000/murder_mystery",
+        help="Site URL on the server under test (default: http://localhost:8000/murder_mystery)"
+    )
+    parser.add_argument(
+        "--phones",
+        type=int,
+        default=15,
+        help="Number of simulated phones (default: 15)"
+    )
+    parser.add_argument(
+        "--scans",
+        type=int,
+        default=10,
+        help="Scans per phone (default: 10)"
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.0,
+        help="Max random pause between a phone's scans in seconds (default: 0, pure burst)"
+    )
+    parser.add_argument(
+        "--qr-dir",
+        default="qr_codes",
+        help="Directory containing manifest.json (default: qr_codes)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=1,
+        help="Random seed so runs are comparable (default: 1)"
+    )
+
+    args = parser.parse_args()
+
+    targets = [(name, path) for name, path in iter_targets(args.qr_dir) if path]
+    if not targets:
+        print(f"❌ Error: No QR targets found in {args.qr_dir}")
+        return
+
+    print("="*70)
+    print("📱 Murder Mystery Scan Load Test")
+    print(f"   Server: {args.url}")
+    print(f"   QR targets: {len(targets)}")
+    print(f"   {args.phones} phones x {args.scans} scans, all starting at once")
+    print("="*70)
+
+    results = Results()
+    start_barrier = threading.Barrier(args.phones + 1)
+
+    with ThreadPoolExecutor(max_workers=args.phones) as pool:
+        futures = [
+            pool.submit(run_phone, args.url, targets, args.scans, args.think_time,
+                        start_barrier, results, args.seed + i)
+            for i in range(args.phones)
+        ]
+        start_barrier.wait()
+        start = time.perf_counter()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+
+    print_report(results, elapsed, args.phones, args.scans)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+PNG optimiser for the Murder Mystery site
+Rewrites the PNGs under assets/ and qr_codes/ smaller, in place:
+- QR codes are pure black and white, so they are stored as 1-bit PNGs
+- illustrations are quantised to an adaptive 256-colour palette where
+  the result is visually lossless (PSNR against the original of at
+  least --min-psnr); otherwise they are only re-encoded
+- metadata (text chunks, EXIF, timestamps, DPI) is dropped; colour
+  profiles are kept, since they change how the image looks
+A file is only replaced when the new encoding is smaller. Files are
+processed in parallel, one worker process per CPU.
+"""
+
+import argparse
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageStat
+
+from precompress_assets import format_size
+
+DEFAULT_DIRS = ['assets', 'qr_codes']
+
+# Directories whose PNGs are QR codes (black modules on white)
+QR_DIRS = {'qr_codes'}
+
+# Quantised images at least this close to the original look identical
+MIN_PSNR = 40.0
+
+def iter_pngs(roots):
+    """Yield every PNG under the given directories"""
+    for root in roots:
+        root = Path(root)
+        if root.is_dir():
+            yield from sorted(root.rglob('*.png'))
+
+def is_qr_code(path: Path):
+    return any(part in QR_DIRS for part in path.parts)
+
+def psnr(original, candidate):
+    """Peak signal-to-noise ratio (dB) between two images of the same mode"""
+    rms = ImageStat.Stat(ImageChops.difference(original, candidate)).rms
+    mse = sum(value * value for value in rms) / len(rms)
+    if mse == 0:
+        return math.inf
+    return 10 * math.log10(255 * 255 / mse)
+
+def encode(image, **params):
+    """The image as an optimised PNG, without metadata"""
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', optimize=True, **params)
+    return buffer.getvalue()
+
+def candidates(image, qr_code, min_psnr):
+    """
+    Encodings to choose from
+
+    Returns:
+        list of (description, PNG bytes)
+    """
+    params = {}
+    if image.info.get('icc_profile'):
+        params['icc_profile'] = image.info['icc_profile']
+    lossless = dict(params)
+    if 'transparency' in image.info:
+        lossless['transparency'] = image.info['transparency']
+    options = [('re-encoded', encode(image, **lossless))]
+
+    has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+    reference = image.convert('RGBA' if has_alpha else 'RGB')
+    if qr_code and not has_alpha:
+        # Modules and the URL label are black on white: threshold at 50%
+        options.append(('1-bit', encode(reference.convert('L').convert('1', dither=Image.Dither.NONE), **params)))
+    elif image.mode not in ('1', 'P'):
+        method = Image.Quantize.FASTOCTREE if has_alpha else Image.Quantize.MEDIANCUT
+        quantized = reference.quantize(colors=256, method=method, dither=Image.Dither.NONE)
+        score = psnr(reference, quantized.convert(reference.mode))
+        if score >= min_psnr:
+            options.append((f"palette, {score:.0f} dB", encode(quantized, **params)))
+    return options
+
+def optimize_png(job):
+    """
+    Rewrite one PNG with its smallest acceptable encoding (run in a
+    worker process)
+
+    Returns:
+        (path, original size, new size, description or error)
+    """
+    path, min_psnr, dry_run = job
+    original_size = path.stat().st_size
+    try:
+        with Image.open(path) as image:
+            image.load()
+            options = candidates(image, is_qr_code(path), min_psnr)
+    except Exception as e:
+        return path, original_size, original_size, f"error: {e}"
+
+    description, data = min(options, key=lambda option: len(option[1]))
+    if len(data) >= original_size:
+        return path, original_size, original_size, 'already optimal'
+    if not dry_run:
+        # Replace atomically so an interrupted run never leaves a broken image
+        temp = path.with_name(path.name + '.tmp')
+        temp.write_bytes(data)
+        os.replace(temp, path)
+    return path, original_size, len(data), description
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Shrink the site's PNGs: 1-bit QR codes, palette illustrations, no metadata"
+    )
+    parser.add_argument(
+        "dirs",
+        nargs="*",
+        default=DEFAULT_DIRS,
+        help=f"Directories to optimise (default: {' '.join(DEFAULT_DIRS)})"
+    )
+    parser.add_argument(
+        "--min-psnr",
+        type=float,
+        default=MIN_PSNR,
+        help=f"Quality a palette version must keep to be used, in dB (default: {MIN_PSNR:g})"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the savings without rewriting any file"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print per-file sizes"
+    )
+    args = parser.parse_args()
+
+    paths = list(iter_pngs(args.dirs))
+
+    print("="*70)
+    print("🗜️  Optimising PNGs" + (" (dry run)" if args.dry_run else ""))
+    print(f"   {len(paths)} files in {', '.join(args.dirs)}; palette when PSNR >= {args.min_psnr:g} dB")
+    print("="*70 + "\n")
+
+    jobs = [(path, args.min_psnr, args.dry_run) for path in paths]
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        results = list(executor.map(optimize_png, jobs))
+
+    total_before = total_after = 0
+    changed = errors = 0
+    for path, before, after, description in results:
+        total_before += before
+        total_after += after
+        changed += after < before
+        if description.startswith('error'):
+            errors += 1
+            print(f"  ❌ {str(path):<55} {description}")
+        elif args.verbose:
+            print(f"  {str(path):<55} {format_size(before):>9} -> {format_size(after):>9}  {description}")
+
+    print("\n" + "="*70)
+    print(f"✅ {'Would shrink' if args.dry_run else 'Shrank'} {changed} of {len(results)} files")
+    print(f"   Before: {format_size(total_before)}")
+    if total_before:
+        print(f"   After:  {format_size(total_after)} ({total_after / total_before * 100:.0f}%)")
+    if errors:
+        print(f"   Errors: {errors}")
+    print("="*70)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Page dependency parsing shared by the site tools
+Finds what a browser loads for one of our HTML pages: <script src>,
+stylesheets, <img src>, and the JSON that inline scripts fetch() or
+hand to a shared script as its dataUrl
+"""
+
+import re
+from html.parser import HTMLParser
+
+# fetch('../../data/visions.json?t=' + ...) and fetch("...") in inline scripts
+FETCH_PATTERN = re.compile(r"""fetch\(\s*['"]([^'"]+)['"]""")
+
+# loadGhostVision({dataUrl: '../../data/visions.json', ...}): the fetch
+# itself is in assets/vision.js, so pages name the file in their config
+DATA_URL_PATTERN = re.compile(r"""dataUrl\s*:\s*['"]([^'"]+)['"]""")
+
+# Image paths in inline scripts and in HTML stored inside data JSON
+# (e.g. "<img src=\"../assets/cordelia_portrait.png\">" in data/book/*.json)
+IMAGE_PATTERN = re.compile(r"""['"]([^'"\s]+\.(?:png|jpe?g|gif|webp|svg))\\?['"]""", re.IGNORECASE)
+
+class DependencyParser(HTMLParser):
+    """Collect (kind, reference) pairs for the subresources of a page"""
+
+    def __init__(self):
+        super().__init__()
+        self.dependencies = []
+        self.in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'script':
+            if attrs.get('src'):
+                self.dependencies.append(('script', attrs['src']))
+            else:
+                self.in_script = True
+        elif tag == 'link' and 'stylesheet' in (attrs.get('rel') or '') and attrs.get('href'):
+            self.dependencies.append(('style', attrs['href']))
+        elif tag == 'img' and attrs.get('src'):
+            self.dependencies.append(('image', attrs['src']))
+
+    def handle_endtag(self, tag):
+        if tag == 'script':
+            self.in_script = False
+
+    def handle_data(self, data):
+        if self.in_script:
+            for target in FETCH_PATTERN.findall(data) + DATA_URL_PATTERN.findall(data):
+                self.dependencies.append(('json', target))
+            for target in IMAGE_PATTERN.findall(data):
+                self.dependencies.append(('image', target))
+
+def strip_query(reference):
+    """Drop cache-busting query strings and fragments ('?t=' + Date)"""
+    return reference.split('#')[0].split('?')[0]
+
+def parse_dependencies(html_text):
+    """
+    List the subresources of a page in document order, without duplicates
+
+    Returns:
+        list of (kind, reference) with kind in script/style/image/json;
+        references are as written in the page, minus query strings
+    """
+    parser = DependencyParser()
+    parser.feed(html_text)
+    seen = []
+    for kind, reference in parser.dependencies:
+        reference = strip_query(reference)
+        if not reference or reference.startswith('data:') or '{{' in reference:
+            continue
+        if (kind, reference) not in seen:
+            seen.append((kind, reference))
+    return seen
+
+def images_in_json(json_text):
+    """Image references embedded in HTML strings inside a data JSON file"""
+    return [strip_query(target) for target in IMAGE_PATTERN.findall(json_text)]
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Page Packing for Murder Mystery Game
+Plans which printed page each rectangle (a document, a photo) goes on and
+where, using a MaxRects bin packer: rectangles are placed largest first,
+each in the free space that fits it most tightly, turned 90 degrees when
+that fits better. plan_pages() also tries shrinking everything in steps,
+never below a minimum scale, and keeps the smallest scale-down that
+reaches the fewest pages.
+"""
+
+import math
+
+def _fits(free, width, height):
+    return width <= free[2] and height <= free[3]
+
+def _split(free, used):
+    """The maximal free rectangles left of free once used is taken out of it"""
+    fx, fy, fw, fh = free
+    ux, uy, uw, uh = used
+    if ux >= fx + fw or ux + uw <= fx or uy >= fy + fh or uy + uh <= fy:
+        return [free]
+    parts = []
+    if ux > fx:
+        parts.append((fx, fy, ux - fx, fh))
+    if ux + uw < fx + fw:
+        parts.append((ux + uw, fy, fx + fw - ux - uw, fh))
+    if uy > fy:
+        parts.append((fx, fy, fw, uy - fy))
+    if uy + uh < fy + fh:
+        parts.append((fx, uy + uh, fw, fy + fh - uy - uh))
+    return parts
+
+def _contained(inner, outer):
+    return (inner[0] >= outer[0] and inner[1] >= outer[1]
+            and inner[0] + inner[2] <= outer[0] + outer[2]
+            and inner[1] + inner[3] <= outer[1] + outer[3])
+
+def _best_fit(free_rects, width, height, rotate):
+    """
+    (score, x, y, rotated) of the tightest spot for a rectangle, or None;
+    score is the leftover on the shorter side (best short side fit)
+    """
+    best = None
+    orientations = [(width, height, False)]
+    if rotate and width != height:
+        orientations.append((height, width, True))
+    for free in free_rects:
+        for w, h, rotated in orientations:
+            if _fits(free, w, h):
+                score = (min(free[2] - w, free[3] - h), max(free[2] - w, free[3] - h))
+                if best is None or score < best[0]:
+                    best = (score, free[0], free[1], rotated)
+    return best
+
+def pack_pages(sizes, page_size, gap=0, rotate=True):
+    """
+    Pack rectangles onto as few pages as possible
+
+    Args:
+        sizes: list of (width, height)
+        page_size: usable (width, height) of a page
+        gap: space kept between neighbouring rectangles
+        rotate: allow turning rectangles 90 degrees
+
+    Returns:
+        list of pages, each a list of (index into sizes, x, y, width,
+        height, rotated) with width and height as placed
+
+    Raises:
+        ValueError: if a rectangle fits on no page in either orientation
+    """
+    page_w, page_h = page_size
+    # Every rectangle is padded by the gap; so is the page, so a rectangle
+    # can still touch the page's far edges
+    bins_size = (page_w + gap, page_h + gap)
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][0] * sizes[i][1], -max(sizes[i]), i))
+
+    pages = []
+    for index in order:
+        width, height = sizes[index]
+        padded = (width + gap, height + gap)
+        if not (_fits((0, 0) + bins_size, *padded)
+                or (rotate and _fits((0, 0) + bins_size, padded[1], padded[0]))):
+            raise ValueError(f"{width}x{height} does not fit a {page_w}x{page_h} page")
+
+        # First page with room, tightest spot on it
+        for page in pages:
+            spot = _best_fit(page['free'], *padded, rotate)
+            if spot:
+                break
+        else:
+            page = {'free': [(0, 0) + bins_size], 'placed': []}
+            pages.append(page)
+            spot = _best_fit(page['free'], *padded, rotate)
+
+        _, x, y, rotated = spot
+        w, h = (height, width) if rotated else (width, height)
+        used = (x, y, w + gap, h + gap)
+        free = [part for rect in page['free'] for part in _split(rect, used)]
+        page['free'] = [rect for i, rect in enumerate(free)
+                        if not any(j != i and _contained(rect, other) and (rect != other or j < i)
+                                   for j, other in enumerate(free))]
+        page['placed'].append((index, x, y, w, h, rotated))
+
+    return [center_page(page['placed'], page_size) for page in pages]
+
+def center_page(placed, page_size):
+    """Shift a page's rectangles so the group is centred on the page"""
+    if not placed:
+        return placed
+    right = max(x + w for _, x, _, w, _, _ in placed)
+    bottom = max(y + h for _, _, y, _, h, _ in placed)
+    dx = (page_size[0] - right) // 2
+    dy = (page_size[1] - bottom) // 2
+    return [(index, x + dx, y + dy, w, h, rotated) for index, x, y, w, h, rotated in placed]
+
+def plan_pages(sizes, page_size, gap=0, min_scale=1.0, steps=10, rotate=True):
+    """
+    Pack at full size, then at smaller scales down to min_scale, and keep
+    the largest scale that needs the fewest pages
+
+    Returns:
+        (scale, pages) with pages as from pack_pages
+    """
+    lower_bound = math.ceil(sum(w * h for w, h in sizes) * min_scale ** 2 / (page_size[0] * page_size[1]))
+    best = None
+    for step in range(steps + 1):
+        scale = 1.0 - (1.0 - min_scale) * step / steps
+        scaled = [(max(1, int(w * scale)), max(1, int(h * scale))) for w, h in sizes]
+        pages = pack_pages(scaled, page_size, gap, rotate)
+        if best is None or len(pages) < len(best[1]):
+            best = (scale, pages)
+        if len(best[1]) <= lower_bound or min_scale >= 1.0:
+            break
+    return best
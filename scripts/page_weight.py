@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Page Weight Analyser for the Murder Mystery site
+For every HTML entry point under character/, clue/, book/ and book_ru/,
+adds up what a phone downloads on a scan: the page, scripts, styles,
+fetched JSON, images (including <img> tags inside fetched JSON).
+Text is counted gzip-compressed, as served; images as-is.
+Exits with status 1 if any page exceeds its budget (scripts/page_budgets.json)
+"""
+
+import argparse
+import fnmatch
+import gzip
+import json
+import sys
+from pathlib import Path
+
+from page_dependencies import images_in_json, parse_dependencies
+
+# Entry points players reach by scanning or by following book links
+PAGE_DIRS = ['character', 'clue', 'book', 'book_ru']
+
+# Hand-instantiated templates, never served to players
+SKIP_PAGES = {'template.html', '_chapter_template.html'}
+
+# The site is mounted under this path on GitHub Pages
+SITE_PREFIX = '/murder_mystery/'
+
+TEXT_SUFFIXES = {'.html', '.css', '.js', '.json', '.svg', '.txt'}
+
+CATEGORIES = ['html', 'script', 'style', 'json', 'image']
+
+DEFAULT_BUDGET_FILE = Path(__file__).with_name('page_budgets.json')
+
+def parse_size(value):
+    """'500KB' / '2MB' / 1234 -> bytes"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = value.strip().upper()
+    for unit, factor in (('MB', 1024 * 1024), ('KB', 1024), ('B', 1)):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+def format_size(num_bytes):
+    """Human-readable byte count"""
+    if num_bytes >= 1024 * 1024:
+        return f"{num_bytes / (1024 * 1024):.1f} MB"
+    if num_bytes >= 1024:
+        return f"{num_bytes / 1024:.1f} KB"
+    return f"{num_bytes} B"
+
+class SizeCache:
+    """Transfer sizes per file, computed once per run"""
+
+    def __init__(self):
+        self.sizes = {}
+
+    def transfer_size(self, path: Path):
+        if path not in self.sizes:
+            data = path.read_bytes()
+            if path.suffix.lower() in TEXT_SUFFIXES:
+                self.sizes[path] = len(gzip.compress(data, compresslevel=9, mtime=0))
+            else:
+                self.sizes[path] = len(data)
+        return self.sizes[path]
+
+def resolve_reference(reference, page_path: Path, root: Path):
+    """
+    Map a reference from a page to a local file
+
+    Returns:
+        Path inside root, or None for external URLs
+    """
+    if reference.startswith(('http://', 'https://', '//', 'mailto:')):
+        return None
+    if reference.startswith(SITE_PREFIX):
+        return (root / reference[len(SITE_PREFIX):]).resolve()
+    if reference.startswith('/'):
+        return (root / reference.lstrip('/')).resolve()
+    return (page_path.parent / reference).resolve()
+
+def analyse_page(page_path: Path, root: Path, sizes: SizeCache):
+    """
+    Work out everything one page downloads
+
+    Returns:
+        dict with per-category transfer bytes, the resource list and missing references
+    """
+    totals = dict.fromkeys(CATEGORIES, 0)
+    resources = []
+    missing = []
+    seen = set()
+
+    def add(kind, path):
+        if path in seen:
+            return
+        seen.add(path)
+        size = sizes.transfer_size(path)
+        totals[kind] += size
+        resources.append((kind, path, size))
+
+    add('html', page_path.resolve())
+    html_text = page_path.read_text(encoding='utf-8', errors='replace')
+
+    for kind, reference in parse_dependencies(html_text):
+        path = resolve_reference(reference, page_path, root)
+        if path is None:
+            continue
+        if not path.is_file():
+            missing.append(reference)
+            continue
+        add(kind, path)
+        if kind == 'json':
+            # Images inside fetched JSON are relative to the page, not the JSON
+            json_text = path.read_text(encoding='utf-8', errors='replace')
+            for image_reference in images_in_json(json_text):
+                image_path = resolve_reference(image_reference, page_path, root)
+                if image_path is None:
+                    continue
+                if image_path.is_file():
+                    add('image', image_path)
+                else:
+                    missing.append(image_reference)
+
+    totals['total'] = sum(totals[kind] for kind in CATEGORIES)
+    return {'totals': totals, 'resources': resources, 'missing': missing}
+
+def load_budgets(budget_file):
+    """
+    Load budgets: a "default" entry plus glob patterns for specific pages.
+    Each entry maps 'total' and/or a category name to a size ('500KB').
+    Later, more specific patterns override earlier ones key by key
+    """
+    with open(budget_file, 'r') as f:
+        config = json.load(f)
+    default = {key: parse_size(value) for key, value in config.get('default', {}).items()}
+    patterns = [
+        (pattern, {key: parse_size(value) for key, value in limits.items()})
+        for pattern, limits in config.get('pages', {}).items()
+    ]
+    return default, patterns
+
+def budget_for(relative_page, default, patterns):
+    """Effective budget for one page"""
+    budget = dict(default)
+    for pattern, limits in patterns:
+        if fnmatch.fnmatch(relative_page, pattern):
+            budget.update(limits)
+    return budget
+
+def iter_pages(root: Path, page_dirs):
+    """All HTML entry points under the given directories"""
+    for page_dir in page_dirs:
+        for page_path in sorted((root / page_dir).rglob('*.html')):
+            if page_path.name not in SKIP_PAGES:
+                yield page_path
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Report the transfer size of every page and enforce page-weight budgets"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--budgets",
+        default=str(DEFAULT_BUDGET_FILE),
+        help="Budget file (default: scripts/page_budgets.json)"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of heaviest pages to list (default: 20, 0 for all)"
+    )
+    parser.add_argument(
+        "--page",
+        help="Show the resource breakdown of one page (e.g. character/heiress.html)"
+    )
+    parser.add_argument(
+        "--json",
+        help="Also write the full report to this JSON file"
+    )
+
+    args = parser.parse_args()
+    root = Path(args.root).resolve()
+    sizes = SizeCache()
+
+    if args.page:
+        report = analyse_page(root / args.page, root, sizes)
+        print(f"\n📄 {args.page}")
+        for kind, path, size in sorted(report['resources'], key=lambda r: -r[2]):
+            print(f"   {kind:<7} {format_size(size):>10}  {path.relative_to(root)}")
+        print(f"   {'total':<7} {format_size(report['totals']['total']):>10}")
+        for reference in report['missing']:
+            print(f"   ⚠️  missing: {reference}")
+        return
+
+    default, patterns = load_budgets(args.budgets)
+
+    results = []
+    for page_path in iter_pages(root, PAGE_DIRS):
+        relative = page_path.relative_to(root).as_posix()
+        report = analyse_page(page_path, root, sizes)
+        budget = budget_for(relative, default, patterns)
+        over = [
+            (key, report['totals'][key], limit)
+            for key, limit in budget.items()
+            if report['totals'].get(key, 0) > limit
+        ]
+        results.append((relative, report, over))
+
+    results.sort(key=lambda r: -r[1]['totals']['total'])
+
+    print("="*90)
+    print("⚖️  Page Weight Report (transfer size: text gzipped, images as-is)")
+    print("="*90)
+    print(f"{'page':<48}{'html':>9}{'js+css':>9}{'json':>9}{'images':>9}{'total':>10}")
+    shown = results if args.top == 0 else results[:args.top]
+    for relative, report, over in shown:
+        totals = report['totals']
+        flag = ' ❌' if over else ''
+        print(f"{relative[:47]:<48}{format_size(totals['html']):>9}"
+              f"{format_size(totals['script'] + totals['style']):>9}"
+              f"{format_size(totals['json']):>9}{format_size(totals['image']):>9}"
+              f"{format_size(totals['total']):>10}{flag}")
+    if len(shown) < len(results):
+        print(f"... {len(results) - len(shown)} lighter pages not shown (--top 0 for all)")
+
+    missing_total = sum(len(report['missing']) for _, report, _ in results)
+    violations = [(relative, over) for relative, _, over in results if over]
+
+    print("\n" + "="*90)
+    print(f"📊 Pages analysed: {len(results)}")
+    if results:
+        grand_total = sum(report['totals']['total'] for _, report, _ in results)
+        print(f"   Average page weight: {format_size(grand_total // len(results))}")
+    if missing_total:
+        print(f"   ⚠️  {missing_total} referenced files are missing:")
+        for relative, report, _ in results:
+            for reference in report['missing']:
+                print(f"      {relative} -> {reference}")
+    if violations:
+        print(f"\n❌ {len(violations)} pages over budget:")
+        for relative, over in violations:
+            for key, actual, limit in over:
+                print(f"   {relative:<48} {key:<7} {format_size(actual):>10} > {format_size(limit)}")
+    else:
+        print("✅ All pages within budget")
+    print("="*90)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                relative: {
+                    'totals': report['totals'],
+                    'missing': report['missing'],
+                    'over_budget': [{'category': key, 'bytes': actual, 'budget': limit} for key, actual, limit in over],
+                }
+                for relative, report, over in results
+            }, f, indent=2)
+
+    sys.exit(1 if violations else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Streaming bitmap PDF writer for the print generators
+PIL's save_all keeps every page image in memory until the PDF is written;
+at 300 DPI a letter page is 2550 x 3300 RGB (25 MB), so a deck of cards
+needs hundreds of megabytes. StreamingPdf instead JPEG-encodes each page
+as soon as it is finished and writes it straight to the file, so only
+the page being drawn is ever held in memory.
+"""
+
+import io
+
+# JPEG quality for page images (PIL's own PDF writer uses 75, too soft for
+# small text and QR modules at print resolution)
+JPEG_QUALITY = 95
+
+class StreamingPdf:
+    """A PDF written one bitmap page at a time"""
+
+    def __init__(self, output_file, dpi, quality=JPEG_QUALITY):
+        self.output_file = output_file
+        self.dpi = dpi
+        self.quality = quality
+        self.file = open(output_file, 'wb')
+        self.offsets = {}
+        self.page_ids = []
+        # Page images written so far, by key, for pages that repeat
+        self.shared_images = {}
+        # Objects 1 and 2 are the catalog and page tree, written on close
+        self.next_id = 3
+        self.file.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def page_count(self):
+        return len(self.page_ids)
+
+    def _new_id(self):
+        obj_id = self.next_id
+        self.next_id += 1
+        return obj_id
+
+    def _write_object(self, obj_id, body, stream=None):
+        self.offsets[obj_id] = self.file.tell()
+        self.file.write(f"{obj_id} 0 obj\n".encode('ascii'))
+        self.file.write(body.encode('ascii'))
+        if stream is not None:
+            self.file.write(b'\nstream\n')
+            self.file.write(stream)
+            self.file.write(b'\nendstream')
+        self.file.write(b'\nendobj\n')
+
+    def add_page(self, image, key=None):
+        """
+        Encode a PIL image as the next page (its size at dpi sets the page
+        size); pages added with the same key share one stored image
+        """
+        width_pt = image.width * 72 / self.dpi
+        height_pt = image.height * 72 / self.dpi
+
+        image_id = self.shared_images.get(key) if key is not None else None
+        if image_id is None:
+            image_id = self._write_image(image)
+            if key is not None:
+                self.shared_images[key] = image_id
+
+        content = f"q {width_pt:.2f} 0 0 {height_pt:.2f} 0 0 cm /Im0 Do Q".encode('ascii')
+        content_id = self._new_id()
+        self._write_object(content_id, f"<< /Length {len(content)} >>", content)
+
+        page_id = self._new_id()
+        self._write_object(page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width_pt:.2f} {height_pt:.2f}] "
+            f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> /Contents {content_id} 0 R >>"
+        ))
+        self.page_ids.append(page_id)
+
+    def _write_image(self, image):
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=self.quality, dpi=(self.dpi, self.dpi))
+        data = buffer.getvalue()
+        color_space = '/DeviceGray' if image.mode == 'L' else '/DeviceRGB'
+
+        image_id = self._new_id()
+        self._write_object(image_id, (
+            f"<< /Type /XObject /Subtype /Image /Width {image.width} /Height {image.height} "
+            f"/ColorSpace {color_space} /BitsPerComponent 8 /Filter /DCTDecode /Length {len(data)} >>"
+        ), data)
+        return image_id
+
+    def close(self):
+        """Write the page tree, cross-reference table and trailer"""
+        if self.file.closed:
+            return
+        kids = ' '.join(f"{page_id} 0 R" for page_id in self.page_ids)
+        self._write_object(1, "<< /Type /Catalog /Pages 2 0 R >>")
+        self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>")
+
+        xref_offset = self.file.tell()
+        self.file.write(f"xref\n0 {self.next_id}\n".encode('ascii'))
+        self.file.write(b'0000000000 65535 f \n')
+        for obj_id in range(1, self.next_id):
+            self.file.write(f"{self.offsets[obj_id]:010d} 00000 n \n".encode('ascii'))
+        self.file.write((
+            f"trailer\n<< /Size {self.next_id} /Root 1 0 R >>\n"
+            f"startxref\n{xref_offset}\n%%EOF\n"
+        ).encode('ascii'))
+        self.file.close()
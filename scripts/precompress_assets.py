@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Precompress text assets for the Murder Mystery site
+Writes .gz (and .br when the brotli module is installed) siblings next to
+every HTML, CSS, JS and JSON file so a local server can send them as-is
+"""
+
+import argparse
+import gzip
+import os
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# File types worth compressing (images are already compressed)
+TEXT_EXTENSIONS = {'.html', '.css', '.js', '.json', '.txt', '.svg'}
+
+# Directories that are never served to players
+SKIP_DIRS = {'.git', 'scripts', 'to_print', '__pycache__', 'node_modules'}
+
+# Files smaller than this gain nothing from compression
+MIN_SIZE = 256
+
+def iter_text_assets(root="."):
+    """Yield every compressible file under root"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            if path.suffix.lower() in TEXT_EXTENSIONS:
+                yield path
+
+def is_stale(source: Path, target: Path):
+    """True if target is missing or older than source"""
+    return not target.exists() or target.stat().st_mtime < source.stat().st_mtime
+
+def write_variant(source: Path, suffix: str, data: bytes):
+    """
+    Write a compressed sibling for source (e.g. story.html.gz)
+    Removes any existing sibling if compression does not make the file smaller
+
+    Returns:
+        Size of the written variant, or None if it was not worth keeping
+    """
+    target = source.with_name(source.name + suffix)
+    if len(data) >= source.stat().st_size:
+        if target.exists():
+            target.unlink()
+        return None
+    target.write_bytes(data)
+    return len(data)
+
+def compress_file(path: Path, force: bool = False):
+    """
+    Compress one file with gzip and brotli
+
+    Returns:
+        (original size, gzip size or None, brotli size or None)
+    """
+    raw = path.read_bytes()
+    gz_target = path.with_name(path.name + '.gz')
+    br_target = path.with_name(path.name + '.br')
+
+    gz_size = None
+    if force or is_stale(path, gz_target):
+        # mtime=0 keeps output byte-identical between builds
+        gz_size = write_variant(path, '.gz', gzip.compress(raw, compresslevel=9, mtime=0))
+    elif gz_target.exists():
+        gz_size = gz_target.stat().st_size
+
+    br_size = None
+    if brotli is not None:
+        if force or is_stale(path, br_target):
+            br_size = write_variant(path, '.br', brotli.compress(raw, quality=11))
+        elif br_target.exists():
+            br_size = br_target.stat().st_size
+
+    return len(raw), gz_size, br_size
+
+def clean(root="."):
+    """Remove all precompressed siblings"""
+    removed = 0
+    for path in iter_text_assets(root):
+        for suffix in ('.gz', '.br'):
+            target = path.with_name(path.name + suffix)
+            if target.exists():
+                target.unlink()
+                removed += 1
+    return removed
+
+def format_size(num_bytes):
+    """Human-readable byte count"""
+    if num_bytes >= 1024 * 1024:
+        return f"{num_bytes / (1024 * 1024):.1f} MB"
+    if num_bytes >= 1024:
+        return f"{num_bytes / 1024:.1f} KB"
+    return f"{num_bytes} B"
+
+def precompress_site(root=".", force=False, verbose=False):
+    """Compress all text assets under root and print a summary"""
+    print("="*70)
+    print("🗜️  Precompressing text assets")
+    print(f"   gzip: yes   brotli: {'yes' if brotli else 'no (pip install brotli)'}")
+    print("="*70 + "\n")
+
+    total_raw = total_gz = total_br = 0
+    count = 0
+
+    for path in iter_text_assets(root):
+        if path.stat().st_size < MIN_SIZE:
+            continue
+        raw_size, gz_size, br_size = compress_file(path, force=force)
+        count += 1
+        total_raw += raw_size
+        total_gz += gz_size or raw_size
+        total_br += br_size or gz_size or raw_size
+        if verbose:
+            br_text = format_size(br_size) if br_size else '-'
+            gz_text = format_size(gz_size) if gz_size else '-'
+            print(f"  {str(path):<55} {format_size(raw_size):>9} gz {gz_text:>9} br {br_text:>9}")
+
+    print("\n" + "="*70)
+    print(f"✅ Compressed {count} files")
+    print(f"   Original: {format_size(total_raw)}")
+    if total_raw:
+        print(f"   gzip:     {format_size(total_gz)} ({total_gz / total_raw * 100:.0f}%)")
+        if brotli is not None:
+            print(f"   brotli:   {format_size(total_br)} ({total_br / total_raw * 100:.0f}%)")
+    print("="*70)
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Write .gz/.br siblings for all text assets of the site"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Recompress even if the compressed files are up to date"
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Remove all .gz/.br siblings instead of writing them"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print per-file sizes"
+    )
+
+    args = parser.parse_args()
+
+    if args.clean:
+        removed = clean(args.root)
+        print(f"🧹 Removed {removed} compressed files")
+        return
+
+    precompress_site(args.root, force=args.force, verbose=args.verbose)
+
+if __name__ == "__main__":
+    main()
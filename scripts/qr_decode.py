@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+QR decoding for the QR audit tools
+Uses pyzbar (pip install pyzbar; needs the zbar library) or OpenCV
+(pip install opencv-python-headless), whichever is installed.
+Without either, callers fall back to qr_codes/manifest.json
+"""
+
+try:
+    from pyzbar.pyzbar import decode as zbar_decode
+except ImportError:
+    zbar_decode = None
+
+try:
+    import cv2
+    import numpy as np
+except ImportError:
+    cv2 = None
+
+def decoder_name():
+    """Name of the decoder in use, or None if none is installed"""
+    if zbar_decode is not None:
+        return 'pyzbar'
+    if cv2 is not None:
+        return 'opencv'
+    return None
+
+def decode_image(image):
+    """
+    Decode every QR code in a PIL image
+
+    Returns:
+        list of payload strings (empty if nothing decodes)
+    """
+    gray = image.convert('L')
+    if zbar_decode is not None:
+        return [symbol.data.decode('utf-8', errors='replace') for symbol in zbar_decode(gray)
+                if symbol.type == 'QRCODE']
+    if cv2 is not None:
+        detector = cv2.QRCodeDetector()
+        found, payloads, _, _ = detector.detectAndDecodeMulti(np.array(gray))
+        return [payload for payload in payloads if payload] if found else []
+    raise RuntimeError("No QR decoder installed (pip install pyzbar or opencv-python-headless)")
+
+def decode_file(path):
+    """Decode every QR code in an image file"""
+    from PIL import Image
+    with Image.open(path) as image:
+        return decode_image(image)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+QR Code Manifest for Murder Mystery Game
+Keeps qr_codes/manifest.json: which page every QR code PNG points to.
+generate_qr_codes.py records the codes it writes; running this script
+rebuilds the manifest from the PNG filenames already in qr_codes/
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+# Base URL for the hosted game (keep in sync with generate_qr_codes.py)
+BASE_URL = "https://filatova-elena.github.io/murder_mystery"
+
+MANIFEST_FILE = "manifest.json"
+
+# QR filename prefix -> site directory, as written by the QR generator scripts
+PREFIX_DIRS = {
+    'artifact_': 'clue/artifacts',
+    'botanical_': 'clue/botanicals',
+    'document_': 'clue/documents',
+    'character_': 'character',
+    'vision_': 'clue/vision',
+}
+
+# Codes written by one-off scripts that do not follow the prefix convention
+SPECIAL_PATHS = {
+    'ghost_alice': 'character/ghost_alice.html',
+    'ghost_cordelia': 'character/ghost_cordelia.html',
+    'ghost_sebastian': 'character/ghost_sebastian.html',
+    'townperson_detective': 'character/townperson_detective.html',
+    'townperson_journalist': 'character/townperson_journalist.html',
+    'townperson_animalexpert': 'character/townperson_animalexpert.html',
+    'portrait_margaret_montrose': 'clue/artifacts/portrait-margaret-montrose.html',
+    'portrait_young_cordelia': 'clue/artifacts/portrait-young-cordelia.html',
+    'sebastian_elixir_formula': 'clue/documents/sebastian_elixir_formula.html',
+}
+
+def infer_page_path(name: str):
+    """
+    Guess the site-relative page for a QR code from its filename stem
+
+    Returns:
+        e.g. 'clue/botanicals/foxglove.html', or None if unknown
+    """
+    if name in SPECIAL_PATHS:
+        return SPECIAL_PATHS[name]
+    for prefix, directory in PREFIX_DIRS.items():
+        if name.startswith(prefix):
+            return f"{directory}/{name[len(prefix):]}.html"
+    if name.startswith('journal_'):
+        # journal_<author>_<entry> -> clue/journals/<author>/<entry>.html
+        author, _, entry = name[len('journal_'):].partition('_')
+        if entry:
+            return f"clue/journals/{author}/{entry}.html"
+    return None
+
+def url_to_page_path(url: str, base_url: str = BASE_URL):
+    """Strip the base URL from a QR payload; None if it points elsewhere"""
+    base = base_url.rstrip('/') + '/'
+    if url.startswith(base):
+        return url[len(base):]
+    return None
+
+def load_manifest(qr_dir="qr_codes"):
+    """
+    Load qr_codes/manifest.json
+
+    Returns:
+        dict with 'base_url' and 'codes' ({name: {'path', 'url'}});
+        empty codes if no manifest has been written yet
+    """
+    manifest_path = Path(qr_dir) / MANIFEST_FILE
+    if manifest_path.exists():
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+    return {'base_url': BASE_URL, 'codes': {}}
+
+def save_manifest(manifest, qr_dir="qr_codes"):
+    """Write qr_codes/manifest.json with codes sorted by name"""
+    manifest_path = Path(qr_dir) / MANIFEST_FILE
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = dict(manifest)
+    manifest['codes'] = dict(sorted(manifest['codes'].items()))
+    # Written to a temporary file first so a crash never leaves half a manifest
+    temp_path = manifest_path.with_name(MANIFEST_FILE + '.tmp')
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    os.replace(temp_path, manifest_path)
+    return manifest_path
+
+def add_code(manifest, name: str, url: str, base_url: str = BASE_URL, path=None):
+    """
+    Add or update one code in a loaded manifest
+    path is the page the code opens, when the URL is a short link to it
+    """
+    manifest['base_url'] = base_url
+    manifest['codes'][name] = {
+        'path': path or url_to_page_path(url, base_url),
+        'url': url,
+    }
+
+def record_code(name: str, url: str, base_url: str = BASE_URL, qr_dir="qr_codes", path=None):
+    """
+    Add or update one code in the manifest file, for scripts that write a
+    single code; batch generators use add_code and save_manifest once
+    """
+    manifest = load_manifest(qr_dir)
+    add_code(manifest, name, url, base_url, path)
+    save_manifest(manifest, qr_dir)
+
+def build_manifest(qr_dir="qr_codes", base_url=BASE_URL):
+    """
+    Rebuild the manifest from the PNG filenames in qr_dir
+
+    Returns:
+        (manifest dict, list of PNG stems whose target could not be inferred)
+    """
+    codes = {}
+    unknown = []
+    for png in sorted(Path(qr_dir).glob('*.png')):
+        page_path = infer_page_path(png.stem)
+        if page_path is None:
+            unknown.append(png.stem)
+            continue
+        codes[png.stem] = {
+            'path': page_path,
+            'url': f"{base_url.rstrip('/')}/{page_path}",
+        }
+    return {'base_url': base_url, 'codes': codes}, unknown
+
+def iter_targets(qr_dir="qr_codes"):
+    """
+    Yield (name, page path) for every code in the manifest, falling back to
+    filename inference when no manifest exists
+    """
+    manifest = load_manifest(qr_dir)
+    if not manifest['codes']:
+        manifest, _ = build_manifest(qr_dir, manifest['base_url'])
+    for name, code in manifest['codes'].items():
+        yield name, code['path']
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Rebuild qr_codes/manifest.json from the QR code PNG filenames"
+    )
+    parser.add_argument(
+        "--qr-dir",
+        default="qr_codes",
+        help="Directory containing QR code PNG files (default: qr_codes)"
+    )
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help=f"Base URL the codes were generated with (default: {BASE_URL})"
+    )
+
+    args = parser.parse_args()
+
+    manifest, unknown = build_manifest(args.qr_dir, args.base_url)
+    manifest_path = save_manifest(manifest, args.qr_dir)
+
+    print(f"✅ Wrote {manifest_path} ({len(manifest['codes'])} codes)")
+    for name in unknown:
+        print(f"⚠️  Could not infer target for {name}.png")
+
+if __name__ == "__main__":
+    main()
@@ -70,7 +70,8 @@ def create_qr_code(url, filename, output_dir="qr_codes"):
     
     # Save the image
     output_path = Path(output_dir) / f"{filename}.png"
-    img.save(output_path)
+    # 1-bit PNG: the code and its label are pure black and white
+    img.convert('1', dither=Image.Dither.NONE).save(output_path, optimize=True)
     print(f"✓ Generated: {filename}.png -> {url}")
     return output_path
 
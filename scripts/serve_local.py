@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Local game server for self-hosted Murder Mystery events
+Stand-in for GitHub Pages when running on a laptop hotspot:
+- asyncio, so a burst of phones scanning at once does not queue up
+- mounts the tree under the same path as BASE_URL (/murder_mystery/...)
+- HTTP/1.1 keep-alive, Range requests, ETag/If-Modified-Since
+- in-memory file cache, plus the .br/.gz siblings from precompress_assets.py
+- append-only scan log (one JSON line per page view)
+"""
+
+import argparse
+import asyncio
+import email.utils
+import json
+import mimetypes
+import time
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+# Base URL for the hosted game (keep in sync with generate_qr_codes.py)
+BASE_URL = "https://filatova-elena.github.io/murder_mystery"
+
+# Encodings we can serve from disk, in order of preference
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+# Cache limits
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_MAX_FILE_BYTES = 16 * 1024 * 1024
+
+# Connection limits
+KEEP_ALIVE_TIMEOUT = 15
+HEADER_TIMEOUT = 10
+MAX_HEADER_LINES = 100
+# Larger request bodies (the site takes none) close the connection instead
+MAX_BODY_BYTES = 64 * 1024
+
+STATUS_TEXT = {
+    200: 'OK',
+    206: 'Partial Content',
+    301: 'Moved Permanently',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    416: 'Range Not Satisfiable',
+}
+
+def parse_accept_encoding(header):
+    """
+    Parse an Accept-Encoding header into the set of acceptable codings
+    Codings with q=0 are treated as refused
+    """
+    accepted = set()
+    for part in (header or '').split(','):
+        fields = part.strip().split(';')
+        coding = fields[0].strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in fields[1:]:
+            name, _, value = param.strip().partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding)
+    return accepted
+
+def parse_range(header, size):
+    """
+    Parse a single-range "bytes=" header
+
+    Returns:
+        (start, end) inclusive, None if the header should be ignored,
+        or False if the range cannot be satisfied
+    """
+    if not header or not header.startswith('bytes='):
+        return None
+    spec = header[len('bytes='):].strip()
+    if ',' in spec:
+        # Multipart ranges are not worth it for this site; send the whole file
+        return None
+    first, _, last = spec.partition('-')
+    try:
+        if first == '':
+            length = int(last)
+            if length <= 0:
+                return False
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+class CachedFile:
+    """One file held in memory, with its precompressed variants"""
+
+    def __init__(self, path: Path, stat):
+        self.path = path
+        self.mtime = stat.st_mtime
+        self.size = stat.st_size
+        self.body = path.read_bytes()
+        self.variants = {}
+        for coding, suffix in ENCODINGS:
+            variant = path.with_name(path.name + suffix)
+            if variant.is_file() and variant.stat().st_mtime >= self.mtime:
+                self.variants[coding] = variant.read_bytes()
+        self.content_type = guess_type(path)
+        self.etag = f'"{int(self.mtime)}-{self.size}"'
+        self.last_modified = email.utils.formatdate(self.mtime, usegmt=True)
+
+    @property
+    def footprint(self):
+        return len(self.body) + sum(len(data) for data in self.variants.values())
+
+async def read_headers(reader):
+    """Read header lines up to the blank line into a lowercase-keyed dict"""
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return headers
+
+async def discard_body(reader, headers):
+    """
+    Read and drop a request body so it is not parsed as the next request
+
+    Returns:
+        False if the body cannot be skipped (chunked, malformed or too
+        large) and the connection must be closed
+    """
+    if 'transfer-encoding' in headers:
+        return False
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        return False
+    if length < 0 or length > MAX_BODY_BYTES:
+        return False
+    if length:
+        await asyncio.wait_for(reader.readexactly(length), HEADER_TIMEOUT)
+    return True
+
+class FileCache:
+    """LRU cache of CachedFile objects, revalidated by mtime on each hit"""
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, path: Path):
+        stat = path.stat()
+        entry = self.entries.get(path)
+        if entry is not None and entry.mtime == stat.st_mtime and entry.size == stat.st_size:
+            self.entries.move_to_end(path)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        if entry is not None:
+            self.evict(path)
+        # Reading the file must not stall other connections
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(None, CachedFile, path, stat)
+        if stat.st_size <= CACHE_MAX_FILE_BYTES:
+            self.entries[path] = entry
+            self.total_bytes += entry.footprint
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                self.evict(next(iter(self.entries)))
+        return entry
+
+    def evict(self, path):
+        entry = self.entries.pop(path)
+        self.total_bytes -= entry.footprint
+
+class ScanLog:
+    """Append-only JSON-lines log of page views"""
+
+    def __init__(self, log_path):
+        self.log_path = Path(log_path) if log_path else None
+        self.handle = None
+        if self.log_path:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self.handle = open(self.log_path, 'a', encoding='utf-8', buffering=1)
+
+    def record(self, client, path, status, user_agent):
+        if self.handle is None:
+            return
+        entry = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime()),
+            'client': client,
+            'path': path,
+            'status': status,
+            'user_agent': user_agent,
+        }
+        self.handle.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def close(self):
+        if self.handle is not None:
+            self.handle.close()
+
+def guess_type(path: Path):
+    """Content-Type for a file, with charset for text"""
+    content_type = mimetypes.guess_type(str(path))[0] or 'application/octet-stream'
+    if content_type.startswith('text/') or content_type in ('application/json', 'application/javascript'):
+        content_type += '; charset=utf-8'
+    return content_type
+
+def site_prefix(base_url):
+    """Path component of BASE_URL, e.g. '/murder_mystery'"""
+    return urlsplit(base_url).path.rstrip('/')
+
+class GameServer:
+    """Serves the repository tree the way GitHub Pages does"""
+
+    def __init__(self, root, base_url=BASE_URL, log_path=None, verbose=False):
+        self.root = Path(root).resolve()
+        self.prefix = site_prefix(base_url)
+        self.cache = FileCache()
+        self.scan_log = ScanLog(log_path)
+        self.verbose = verbose
+        self.requests_served = 0
+
+    def resolve(self, url_path):
+        """
+        Map a request path to a file under root
+
+        Returns:
+            (Path or None, redirect location or None)
+        """
+        path = unquote(url_path)
+        if self.prefix:
+            if path == self.prefix:
+                return None, self.prefix + '/'
+            if path.startswith(self.prefix + '/'):
+                path = path[len(self.prefix):]
+        relative = path.lstrip('/')
+        candidate = (self.root / relative).resolve()
+        if candidate != self.root and self.root not in candidate.parents:
+            return None, None
+        if candidate.is_dir():
+            if not url_path.endswith('/'):
+                return None, url_path + '/'
+            candidate = candidate / 'index.html'
+        if not candidate.is_file():
+            return None, None
+        return candidate, None
+
+    async def handle_connection(self, reader, writer):
+        peer = writer.get_extra_info('peername')
+        client = peer[0] if peer else '-'
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+
+                try:
+                    headers = await asyncio.wait_for(read_headers(reader), HEADER_TIMEOUT)
+                    if not await discard_body(reader, headers):
+                        headers['connection'] = 'close'
+                except asyncio.TimeoutError:
+                    break
+
+                keep_alive = await self.handle_request(request_line, headers, writer, client)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def handle_request(self, request_line, headers, writer, client):
+        """Handle one request; returns True if the connection stays open"""
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            self.send(writer, 400, {}, b'', 'GET', keep_alive=False)
+            return False
+
+        keep_alive = version == 'HTTP/1.1'
+        connection = headers.get('connection', '').lower()
+        if connection == 'close':
+            keep_alive = False
+        elif connection == 'keep-alive':
+            keep_alive = True
+
+        url_path = urlsplit(target).path
+        self.requests_served += 1
+
+        if method not in ('GET', 'HEAD'):
+            self.send(writer, 405, {'Allow': 'GET, HEAD'}, b'', method, keep_alive)
+            return keep_alive
+
+        path, redirect = self.resolve(url_path)
+        if redirect:
+            self.send(writer, 301, {'Location': redirect}, b'', method, keep_alive)
+            return keep_alive
+        if path is None:
+            self.send(writer, 404, {'Content-Type': 'text/plain; charset=utf-8'},
+                      b'404 Not Found\n', method, keep_alive)
+            self.log(client, url_path, 404, headers)
+            return keep_alive
+
+        entry = await self.cache.get(path)
+        response_headers = {
+            'Content-Type': entry.content_type,
+            'Last-Modified': entry.last_modified,
+            'ETag': entry.etag,
+            'Accept-Ranges': 'bytes',
+            'Vary': 'Accept-Encoding',
+            'Cache-Control': 'no-cache',
+        }
+
+        if headers.get('if-none-match') == entry.etag or \
+                headers.get('if-modified-since') == entry.last_modified:
+            self.send(writer, 304, response_headers, b'', method, keep_alive)
+            self.log(client, url_path, 304, headers)
+            return keep_alive
+
+        byte_range = parse_range(headers.get('range'), entry.size)
+        if byte_range is False:
+            response_headers['Content-Range'] = f'bytes */{entry.size}'
+            self.send(writer, 416, response_headers, b'', method, keep_alive)
+            return keep_alive
+        if byte_range is not None:
+            start, end = byte_range
+            response_headers['Content-Range'] = f'bytes {start}-{end}/{entry.size}'
+            self.send(writer, 206, response_headers, entry.body[start:end + 1], method, keep_alive)
+            self.log(client, url_path, 206, headers)
+            return keep_alive
+
+        body = entry.body
+        accepted = parse_accept_encoding(headers.get('accept-encoding'))
+        for coding, _ in ENCODINGS:
+            if coding in entry.variants and (coding in accepted or '*' in accepted):
+                body = entry.variants[coding]
+                response_headers['Content-Encoding'] = coding
+                break
+
+        self.send(writer, 200, response_headers, body, method, keep_alive)
+        self.log(client, url_path, 200, headers)
+        return keep_alive
+
+    def send(self, writer, status, headers, body, method, keep_alive):
+        lines = [f'HTTP/1.1 {status} {STATUS_TEXT[status]}']
+        headers = dict(headers)
+        headers['Content-Length'] = str(len(body))
+        headers['Date'] = email.utils.formatdate(usegmt=True)
+        headers['Server'] = 'MurderMystery'
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        if keep_alive:
+            headers['Keep-Alive'] = f'timeout={KEEP_ALIVE_TIMEOUT}'
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD' and status not in (204, 304):
+            writer.write(body)
+
+    def log(self, client, url_path, status, headers):
+        """Record page views (HTML only) in the scan log"""
+        if url_path.endswith('.html') or url_path.endswith('/'):
+            self.scan_log.record(client, url_path, status, headers.get('user-agent', ''))
+            if self.verbose:
+                print(f"📱 {client:<15} {status} {url_path}")
+
+async def run_server(server, bind, port):
+    tcp_server = await asyncio.start_server(server.handle_connection, bind, port, backlog=256)
+    async with tcp_server:
+        await tcp_server.serve_forever()
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Serve the Murder Mystery site locally (asyncio, keep-alive, scan log)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to listen on (default: 8000)"
+    )
+    parser.add_argument(
+        "--bind",
+        default="0.0.0.0",
+        help="Address to bind (default: 0.0.0.0, reachable from phones on the hotspot)"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--base-url",
+        default=BASE_URL,
+        help=f"Base URL whose path the site is mounted under (default: {BASE_URL})"
+    )
+    parser.add_argument(
+        "--scan-log",
+        default="logs/scans.jsonl",
+        help="Append-only scan log, one JSON line per page view (default: logs/scans.jsonl, '' to disable)"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print every page view"
+    )
+
+    args = parser.parse_args()
+
+    mimetypes.add_type('application/json', '.json')
+    mimetypes.add_type('text/javascript', '.js')
+    server = GameServer(args.root, args.base_url, args.scan_log or None, args.verbose)
+
+    print("="*70)
+    print("🕯️  Murder Mystery local game server")
+    print(f"   Serving {server.root}")
+    print(f"   http://{args.bind}:{args.port}{server.prefix}/")
+    if args.scan_log:
+        print(f"   Scan log: {args.scan_log}")
+    print("   Run scripts/precompress_assets.py first to serve .br/.gz files")
+    print("="*70)
+
+    try:
+        asyncio.run(run_server(server, args.bind, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+        print(f"   Requests served: {server.requests_served}")
+        print(f"   Cache hits/misses: {server.cache.hits}/{server.cache.misses}")
+    finally:
+        server.scan_log.close()
+
+if __name__ == "__main__":
+    main()
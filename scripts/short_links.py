@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Short QR Links for Murder Mystery Game
+QR codes encode a short redirect URL instead of the full page URL:
+
+    .../murder_mystery/clue/documents/shipping_manifests_romano.html
+    .../murder_mystery/q/h.html  (redirects to the page)
+
+A shorter payload fits a smaller QR version, leaving room for a higher
+error-correction level, so printed codes scan faster and more reliably.
+The id -> page mapping lives in data/short_links.json and the static
+redirect stubs in q/. Ids are never reused or reassigned: codes that are
+already printed keep working.
+Run this script to give every page in qr_codes/manifest.json an id and
+rewrite the stubs; generate_qr_codes.py adds ids as it writes codes.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from qr_manifest import iter_targets
+
+LINKS_FILE = 'data/short_links.json'
+STUB_DIR = 'q'
+
+ALPHABET = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+STUB_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="robots" content="noindex">
+    <title>Murder Mystery</title>
+    <script>location.replace('{target}' + location.hash);</script>
+    <meta http-equiv="refresh" content="0; url={target}">
+</head>
+<body>
+    <a href="{target}">Continue</a>
+</body>
+</html>
+"""
+
+def encode_id(number):
+    """Base-36 id: 0 -> '0', 35 -> 'z', 36 -> '10'"""
+    digits = ''
+    while True:
+        number, digit = divmod(number, len(ALPHABET))
+        digits = ALPHABET[digit] + digits
+        if number == 0:
+            return digits
+
+def load_links(root: Path):
+    """The id -> page path mapping (empty if none has been written yet)"""
+    path = root / LINKS_FILE
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['links']
+
+def save_links(root: Path, links):
+    path = root / LINKS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ordered = dict(sorted(links.items(), key=lambda item: int(item[0], 36)))
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'links': ordered}, f, indent=2)
+        f.write('\n')
+
+def allocate(links, page_path):
+    """
+    The id of a page, adding the next free id if it has none
+
+    Returns:
+        (id, True if it was added)
+    """
+    for link_id, target in links.items():
+        if target == page_path:
+            return link_id, False
+    number = max((int(link_id, 36) for link_id in links), default=-1) + 1
+    link_id = encode_id(number)
+    links[link_id] = page_path
+    return link_id, True
+
+def stub_html(page_path):
+    """Redirect stub for q/<id>.html (relative, so it works under any base URL)"""
+    return STUB_TEMPLATE.format(target='../' + page_path)
+
+def write_stub(root: Path, link_id, page_path, check=False):
+    """Write q/<id>.html; returns True if it was (or with check=True would be) changed"""
+    stub = root / STUB_DIR / f"{link_id}.html"
+    text = stub_html(page_path)
+    if stub.exists() and stub.read_text(encoding='utf-8') == text:
+        return False
+    if not check:
+        stub.parent.mkdir(parents=True, exist_ok=True)
+        stub.write_text(text, encoding='utf-8')
+    return True
+
+def short_link(root: Path, page_path):
+    """
+    The short id for a page, allocating it and writing its stub if needed
+    (for scripts that write a single code; generate_qr_codes.py allocates
+    a whole run in memory and saves the table once)
+    """
+    links = load_links(root)
+    link_id, added = allocate(links, page_path)
+    if added:
+        save_links(root, links)
+    write_stub(root, link_id, page_path)
+    return link_id
+
+def short_url(base_url, link_id):
+    return f"{base_url.rstrip('/')}/{STUB_DIR}/{link_id}.html"
+
+def resolve_path(root: Path, page_path):
+    """Follow a short link: 'q/h.html' -> its page; other paths unchanged; None for an unknown id"""
+    if not page_path.startswith(STUB_DIR + '/'):
+        return page_path
+    return load_links(root).get(Path(page_path).stem)
+
+def build_stubs(root: Path, qr_dir="qr_codes", check=False):
+    """
+    Give every existing page in the QR manifest an id and rewrite all stubs
+
+    Returns:
+        (links, files that were - or with check=True would be - changed)
+    """
+    links = load_links(root)
+    changed = []
+    added = False
+    for _, page_path in iter_targets(str(root / qr_dir)):
+        if page_path and not page_path.startswith(STUB_DIR + '/') and (root / page_path).is_file():
+            added = allocate(links, page_path)[1] or added
+    if added:
+        changed.append(LINKS_FILE)
+        if not check:
+            save_links(root, links)
+
+    for link_id, page_path in links.items():
+        if write_stub(root, link_id, page_path, check):
+            changed.append(f"{STUB_DIR}/{link_id}.html")
+
+    # Stubs whose id is no longer in the mapping
+    stub_dir = root / STUB_DIR
+    if stub_dir.exists():
+        for stale in sorted(stub_dir.glob('*.html')):
+            if stale.stem not in links:
+                changed.append(stale.relative_to(root).as_posix())
+                if not check:
+                    stale.unlink()
+    return links, changed
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Assign short QR links and write the q/<id>.html redirect stubs"
+    )
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="Site root directory (default: current directory)"
+    )
+    parser.add_argument(
+        "--qr-dir",
+        default="qr_codes",
+        help="QR code directory with manifest.json (default: qr_codes)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check that the links and stubs are up to date (exit 1 if not)"
+    )
+
+    args = parser.parse_args()
+    root = Path(args.root).resolve()
+
+    links, changed = build_stubs(root, args.qr_dir, check=args.check)
+
+    print("="*60)
+    print("🔗 Short QR links")
+    print("="*60)
+    print(f"📦 Links: {len(links)}")
+    if args.check and changed:
+        print(f"\n❌ {len(changed)} files out of date (run scripts/short_links.py):")
+        for relative in changed:
+            print(f"   {relative}")
+    elif changed:
+        print(f"✓ {len(changed)} files written or removed")
+    else:
+        print("✅ Up to date")
+    print("="*60)
+
+    sys.exit(1 if args.check and changed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Vector PDF backend for the card generators
+PixelCanvas takes the same drawing calls as PIL's ImageDraw (rectangle,
+line, ellipse, text, textbbox) in the generators' pixel coordinates and
+emits them as PDF operators through reportlab, so a card layout written
+for a 150 DPI bitmap prints with sharp text and lines at any resolution.
+Each distinct image is stored once per PDF (ImageRegistry) however many
+cards, pages or copies show it, and is drawn at full resolution.
+Needs reportlab (pip install reportlab); without it, vector_available()
+is False and the generators fall back to their bitmap output.
+RasterCanvas/RasterDocument take the same calls and draw a bitmap at a
+print resolution (300 DPI) instead, streaming each finished page to the
+PDF so only one page is held in memory.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+from pdf_stream import StreamingPdf
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen import canvas
+except ImportError:
+    canvas = None
+
+# Used when none of a generator's font files exist (built into every PDF reader)
+FALLBACK_FONT = 'Times-Roman'
+
+_registered_fonts = {}
+
+def vector_available():
+    return canvas is not None
+
+class VectorFont:
+    """A PDF font at a pixel size (the vector stand-in for ImageFont)"""
+
+    def __init__(self, name, size_px):
+        self.name = name
+        self.size_px = size_px
+
+def register_font(paths):
+    """
+    Register the first existing TrueType file with reportlab
+
+    Returns:
+        the reportlab font name, or FALLBACK_FONT
+    """
+    for path in paths:
+        if path in _registered_fonts:
+            return _registered_fonts[path]
+        if not Path(path).exists():
+            continue
+        name = Path(path).stem.replace(' ', '')
+        try:
+            if path.endswith('.ttc'):
+                pdfmetrics.registerFont(TTFont(name, path, subfontIndex=0))
+            else:
+                pdfmetrics.registerFont(TTFont(name, path))
+        except Exception:
+            continue
+        _registered_fonts[path] = name
+        return name
+    return FALLBACK_FONT
+
+def to_color(value):
+    """PIL colour ('#1a1a1a', 'black', (r, g, b)) -> reportlab colour"""
+    if isinstance(value, tuple):
+        return colors.Color(*(channel / 255 for channel in value[:3]))
+    return colors.toColor(value)
+
+def fit_size(size, max_size):
+    """The size Image.thumbnail would give: fit inside max_size, never enlarge"""
+    width, height = size
+    scale = min(max_size[0] / width, max_size[1] / height, 1)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+def resampleable(image):
+    """
+    PIL resizes palette and 1-bit images with nearest neighbour only, so
+    convert those (see optimize_images.py) before scaling them
+    """
+    if image.mode in ('1', 'P'):
+        return image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+    return image
+
+def paste_fitted(target, image, box):
+    """
+    Draw a PIL image into box (x, y, width, height) on a PIL image or a
+    PixelCanvas; the vector canvas keeps the image's full resolution
+    """
+    x, y, width, height = box
+    if isinstance(target, (PixelCanvas, RasterCanvas)):
+        target.draw_image(image, box)
+    else:
+        target.paste(resampleable(image).resize((width, height), Image.Resampling.LANCZOS), (x, y))
+
+class ImageRegistry:
+    """
+    Each distinct image is written to the PDF once, as a form XObject, and
+    every placement refers to it: a QR code or portrait that appears on
+    every copy of a deck costs one embedded image, and is decoded and
+    compressed once
+    """
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+        self.forms = {}
+        self._keep = []
+
+    def form_for(self, image, key=None):
+        """
+        The form name for an image file path or PIL image; images are
+        identified by key, else by file name, else by object
+        """
+        if key is None:
+            key = image if isinstance(image, str) else getattr(image, 'filename', None) or id(image)
+        name = self.forms.get(key)
+        if name is None:
+            name = f"Image{len(self.forms)}"
+            if isinstance(image, str):
+                source = image
+            else:
+                source = getattr(image, 'filename', None) or ImageReader(image)
+                # id() keys are only unique while the image is alive
+                self._keep.append(image)
+            # Drawn into a 1x1 box and scaled to each placement
+            self.pdf.beginForm(name, 0, 0, 1, 1)
+            self.pdf.drawImage(source, 0, 0, 1, 1, mask='auto')
+            self.pdf.endForm()
+            self.forms[key] = name
+        return name
+
+    def place(self, image, left, bottom, width, height, key=None):
+        """Draw an image at a position and size in points"""
+        name = self.form_for(image, key)
+        self.pdf.saveState()
+        self.pdf.translate(left, bottom)
+        self.pdf.scale(width, height)
+        self.pdf.doForm(name)
+        self.pdf.restoreState()
+
+class PixelCanvas:
+    """An ImageDraw-compatible view of one PDF page, in pixel coordinates"""
+
+    def __init__(self, pdf, page_height_px, dpi, origin=(0, 0), images=None):
+        self.pdf = pdf
+        self.page_height_px = page_height_px
+        self.dpi = dpi
+        self.origin = origin
+        self.images = images or ImageRegistry(pdf)
+
+    def offset(self, x, y):
+        """A view of the same page with (x, y) as its origin (for drawing a card in place)"""
+        return PixelCanvas(self.pdf, self.page_height_px, self.dpi,
+                           (self.origin[0] + x, self.origin[1] + y), self.images)
+
+    def pt(self, px):
+        return px * 72 / self.dpi
+
+    def point(self, x, y):
+        """Pixel position (y down) -> PDF position in points (y up)"""
+        return self.pt(self.origin[0] + x), self.pt(self.page_height_px - self.origin[1] - y)
+
+    def font(self, paths, size_px):
+        """The vector font for ImageFont.truetype(paths[0], size_px) and its fallbacks"""
+        return VectorFont(register_font(paths), size_px)
+
+    def _stroke(self, outline, width):
+        self.pdf.setStrokeColor(to_color(outline))
+        self.pdf.setLineWidth(self.pt(width))
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        (x0, y0), (x1, y1) = self._box(xy)
+        if fill is not None:
+            self.pdf.setFillColor(to_color(fill))
+            left, bottom = self.point(x0, y1)
+            self.pdf.rect(left, bottom, self.pt(x1 - x0), self.pt(y1 - y0), stroke=0, fill=1)
+        if outline is not None:
+            # PIL draws the outline inside the box
+            inset = width / 2
+            self._stroke(outline, width)
+            left, bottom = self.point(x0 + inset, y1 - inset)
+            self.pdf.rect(left, bottom, self.pt(x1 - x0 - width), self.pt(y1 - y0 - width), stroke=1, fill=0)
+
+    def line(self, xy, fill='black', width=1):
+        points = [self.point(x, y) for x, y in self._points(xy)]
+        self._stroke(fill, width)
+        self.pdf.lines([(a[0], a[1], b[0], b[1]) for a, b in zip(points, points[1:])])
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        (x0, y0), (x1, y1) = self._box(xy)
+        left, bottom = self.point(x0, y1)
+        right, top = self.point(x1, y0)
+        if outline is not None:
+            self._stroke(outline, width)
+        if fill is not None:
+            self.pdf.setFillColor(to_color(fill))
+        self.pdf.ellipse(left, bottom, right, top, stroke=int(outline is not None), fill=int(fill is not None))
+
+    def textbbox(self, xy, text, font):
+        x, y = xy
+        size_pt = self.pt(font.size_px)
+        width = pdfmetrics.stringWidth(text, font.name, size_pt)
+        ascent, descent = pdfmetrics.getAscentDescent(font.name, size_pt)
+        return x, y, x + width * self.dpi / 72, y + (ascent - descent) * self.dpi / 72
+
+    def text(self, xy, text, fill='black', font=None, anchor=None):
+        x, y = xy
+        size_pt = self.pt(font.size_px)
+        ascent = pdfmetrics.getAscent(font.name, size_pt)
+        if anchor == 'mm':
+            # Centred on (x, y), as PIL's anchor="mm"
+            x0, y0, x1, y1 = self.textbbox((0, 0), text, font)
+            x -= (x1 - x0) / 2
+            y -= (y1 - y0) / 2
+        self.pdf.setFillColor(to_color(fill))
+        self.pdf.setFont(font.name, size_pt)
+        # PIL places the top of the text at y; PDF text sits on its baseline
+        left, baseline = self.point(x, y)
+        self.pdf.drawString(left, baseline - ascent, text)
+
+    def draw_image(self, image, box, key=None):
+        """Draw an image file or PIL image scaled into box (x, y, width, height)"""
+        x, y, width, height = box
+        left, bottom = self.point(x, y + height)
+        self.images.place(image, left, bottom, self.pt(width), self.pt(height), key)
+
+    @staticmethod
+    def _points(xy):
+        xy = list(xy)
+        if xy and not isinstance(xy[0], (tuple, list)):
+            return list(zip(xy[0::2], xy[1::2]))
+        return [tuple(point) for point in xy]
+
+    def _box(self, xy):
+        (x0, y0), (x1, y1) = self._points(xy)
+        return (min(x0, x1), min(y0, y1)), (max(x0, x1), max(y0, y1))
+
+class VectorDocument:
+    """A multi-page vector PDF laid out in pixel coordinates at a given DPI"""
+
+    def __init__(self, output_file, page_size_px, dpi, background=None):
+        self.page_width_px, self.page_height_px = page_size_px
+        self.dpi = dpi
+        self.background = background
+        self.pdf = canvas.Canvas(str(output_file), pagesize=(
+            self.page_width_px * 72 / dpi, self.page_height_px * 72 / dpi
+        ))
+        self.images = ImageRegistry(self.pdf)
+        self.shared = set()
+        self.page_count = 0
+
+    def new_page(self):
+        """Start a page and return its PixelCanvas"""
+        if self.page_count:
+            self.pdf.showPage()
+        self.page_count += 1
+        page = PixelCanvas(self.pdf, self.page_height_px, self.dpi, images=self.images)
+        if self.background is not None:
+            page.rectangle([0, 0, self.page_width_px, self.page_height_px], fill=self.background)
+        return page
+
+    def shared_page(self, name, draw_page):
+        """
+        Add a page that repeats through the document (e.g. card backs):
+        draw_page(canvas) runs the first time only, into a form the page
+        and every later one with the same name refer to
+
+        Returns:
+            the page's PixelCanvas
+        """
+        if name not in self.shared:
+            self.pdf.beginForm(name, 0, 0, self.page_width_px * 72 / self.dpi, self.page_height_px * 72 / self.dpi)
+            draw_page(PixelCanvas(self.pdf, self.page_height_px, self.dpi, images=self.images))
+            self.pdf.endForm()
+            self.shared.add(name)
+        page = self.new_page()
+        self.pdf.doForm(name)
+        return page
+
+    def save(self):
+        self.pdf.save()
+
+@lru_cache(maxsize=None)
+def raster_font(paths, size_px):
+    """PIL font for the first loadable file in paths, else the default font"""
+    for path in paths:
+        try:
+            return ImageFont.truetype(path, size_px)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size_px)
+    except TypeError:
+        # Pillow < 10.1 has a single fixed-size default font
+        return ImageFont.load_default()
+
+class RasterCanvas:
+    """
+    A PixelCanvas stand-in that draws on a PIL image at scale times the
+    layout's pixel grid (e.g. a 72 DPI layout on a 300 DPI bitmap)
+    """
+
+    def __init__(self, image, scale, origin=(0, 0), draw=None):
+        self.image = image
+        self.scale = scale
+        self.origin = origin
+        self.draw = draw or ImageDraw.Draw(image)
+
+    def offset(self, x, y):
+        """A view of the same page with (x, y) as its origin (for drawing a card in place)"""
+        return RasterCanvas(self.image, self.scale,
+                            (self.origin[0] + x, self.origin[1] + y), self.draw)
+
+    def px(self, value):
+        return max(1, round(value * self.scale))
+
+    def point(self, x, y):
+        """Layout position -> bitmap position"""
+        return round((self.origin[0] + x) * self.scale), round((self.origin[1] + y) * self.scale)
+
+    def font(self, paths, size_px):
+        """The font for ImageFont.truetype(paths[0], size_px) at print resolution"""
+        return raster_font(tuple(paths), self.px(size_px))
+
+    def _scaled(self, xy):
+        return [self.point(x, y) for x, y in PixelCanvas._points(xy)]
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        self.draw.rectangle(self._scaled(xy), fill=fill, outline=outline, width=self.px(width))
+
+    def line(self, xy, fill='black', width=1):
+        self.draw.line(self._scaled(xy), fill=fill, width=self.px(width))
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        self.draw.ellipse(self._scaled(xy), fill=fill, outline=outline, width=self.px(width))
+
+    def textbbox(self, xy, text, font):
+        x, y = xy
+        left, top, right, bottom = self.draw.textbbox((0, 0), text, font=font)
+        return (x + left / self.scale, y + top / self.scale,
+                x + right / self.scale, y + bottom / self.scale)
+
+    def text(self, xy, text, fill='black', font=None, anchor=None):
+        self.draw.text(self.point(*xy), text, fill=fill, font=font, anchor=anchor)
+
+    def draw_image(self, image, box, key=None):
+        """Draw a PIL image resampled straight to its print-resolution box"""
+        x, y, width, height = box
+        left, top = self.point(x, y)
+        right, bottom = self.point(x + width, y + height)
+        self.image.paste(resampleable(image).resize((right - left, bottom - top), Image.Resampling.LANCZOS),
+                         (left, top))
+
+class RasterDocument:
+    """
+    VectorDocument's interface for bitmap output at print_dpi: each page
+    is written to the PDF when the next one starts (or on save) and its
+    bitmap released, so memory holds one page however long the document
+    """
+
+    def __init__(self, output_file, page_size_px, dpi, print_dpi=300, background=None):
+        self.scale = print_dpi / dpi
+        self.page_size = (round(page_size_px[0] * self.scale), round(page_size_px[1] * self.scale))
+        self.background = background or 'white'
+        self.stream = StreamingPdf(output_file, print_dpi)
+        self.current = None
+        self.shared = {}
+
+    @property
+    def page_count(self):
+        return self.stream.page_count + (self.current is not None)
+
+    def _flush(self):
+        if self.current is not None:
+            self.stream.add_page(self.current.image)
+            # Pages may still be referenced by the caller; drop the bitmap
+            self.current.image = self.current.draw = None
+            self.current = None
+
+    def new_page(self):
+        """Start a page and return its RasterCanvas"""
+        self._flush()
+        self.current = RasterCanvas(Image.new('RGB', self.page_size, color=self.background), self.scale)
+        return self.current
+
+    def shared_page(self, name, draw_page):
+        """
+        Add a page that repeats through the document (e.g. card backs):
+        draw_page(canvas) runs the first time only, and every page with the
+        same name shares one stored image in the PDF
+
+        Returns:
+            the page's RasterCanvas (complete; drawing on it has no effect)
+        """
+        self._flush()
+        if name not in self.shared:
+            page = RasterCanvas(Image.new('RGB', self.page_size, color=self.background), self.scale)
+            draw_page(page)
+            self.shared[name] = page
+        self.stream.add_page(self.shared[name].image, key=name)
+        return self.shared[name]
+
+    def save(self):
+        self._flush()
+        self.stream.close()
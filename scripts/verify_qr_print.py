@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+QR Print Verification for Murder Mystery Game
+Composes the same sheets as generate_qr_pdf.py, cuts out each cell and
+simulates printing it at increasing degradation levels:
+- contrast loss (grey blacks, off-white card stock)
+- blur (ink spread, a phone camera slightly out of focus)
+- noise (paper texture, camera sensor), from a seeded generator so the
+  margins are the same on every run and in every worker process
+Each cell is decoded at every level; a code's scan margin is the highest
+level it still decodes to its manifest URL at. Codes below --min-margin
+are flagged so they can be fixed before printing.
+Requires Pillow and a QR decoder (see qr_decode.py).
+Exits with status 1 if any code is below the minimum margin.
+"""
+
+import argparse
+import json
+import random
+import sys
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageEnhance, ImageFilter
+
+from generate_qr_pdf import compose_pages, sheet_layout
+from qr_decode import decode_image, decoder_name
+from qr_manifest import load_manifest
+
+MAX_LEVEL = 10
+
+# Degradation added per level, at the sheet's 150 DPI
+CONTRAST_LOSS_PER_LEVEL = 0.06
+BLUR_RADIUS_PER_LEVEL = 0.35
+NOISE_SIGMA_PER_LEVEL = 5
+NOISE_SEED = 0
+
+# The noise field is drawn once at this sigma and scaled to each level
+BASE_NOISE_SIGMA = 25
+
+@lru_cache(maxsize=8)
+def noise_field(size, seed):
+    """Gaussian noise centred on 128 at BASE_NOISE_SIGMA, the same for a given size and seed"""
+    rng = random.Random(f"{seed}:{size[0]}x{size[1]}")
+    values = (round(rng.gauss(128, BASE_NOISE_SIGMA)) for _ in range(size[0] * size[1]))
+    return Image.frombytes('L', size, bytes(min(255, max(0, value)) for value in values))
+
+def degrade(image, level, seed=NOISE_SEED):
+    """Simulate printing and scanning a greyscale image at a degradation level"""
+    if level == 0:
+        return image
+    image = ImageEnhance.Contrast(image).enhance(1 - CONTRAST_LOSS_PER_LEVEL * level)
+    image = image.filter(ImageFilter.GaussianBlur(BLUR_RADIUS_PER_LEVEL * level))
+    scale = NOISE_SIGMA_PER_LEVEL * level / BASE_NOISE_SIGMA
+    noise = noise_field(image.size, seed).point(lambda value: round(128 + (value - 128) * scale))
+    # The noise is centred on 128: image + noise - 128, clipped
+    return ImageChops.add(image, noise, 1.0, -128)
+
+def scan_margin(cell):
+    """
+    Decode one cell at increasing degradation (runs in a worker process)
+
+    Args:
+        cell: (code name, cell image, expected URL or None, max level, noise seed)
+
+    Returns:
+        (code name, margin, payload at level 0): margin is -1 if the code
+        does not decode even undegraded
+    """
+    name, image, expected, max_level, seed = cell
+    image = image.convert('L')
+    payload = None
+    margin = -1
+    for level in range(max_level + 1):
+        payloads = decode_image(degrade(image, level, seed))
+        if level == 0:
+            payload = payloads[0] if payloads else None
+        if not payloads or (expected and expected not in payloads):
+            break
+        margin = level
+    return name, margin, payload
+
+def iter_cells(qr_files, manifest, max_level, seed=NOISE_SEED):
+    """Every composed cell, in sheet order"""
+    for page_img, cells in compose_pages(qr_files, sheet_layout()):
+        for name, box in cells:
+            yield name, page_img.crop(box), manifest.get(name, {}).get('url'), max_level, seed
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description="Check that printed QR sheets still scan under simulated print degradation"
+    )
+    parser.add_argument(
+        "--qr-dir",
+        default="qr_codes",
+        help="Directory containing QR code PNG files (default: qr_codes)"
+    )
+    parser.add_argument(
+        "--min-margin",
+        type=int,
+        default=4,
+        help=f"Lowest acceptable scan margin, 0-{MAX_LEVEL} (default: 4)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=NOISE_SEED,
+        help=f"Seed for the simulated noise; margins are reproducible for a given seed (default: {NOISE_SEED})"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for decoding (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--json",
+        help="Also write the per-code margins to this JSON file"
+    )
+
+    args = parser.parse_args()
+
+    decoder = decoder_name()
+    if decoder is None:
+        print("❌ No QR decoder installed (pip install pyzbar or opencv-python-headless)")
+        sys.exit(1)
+
+    qr_files = sorted(f for f in Path(args.qr_dir).glob("*.png") if f.is_file())
+    if not qr_files:
+        print(f"❌ Error: No QR codes found in {args.qr_dir}")
+        sys.exit(1)
+    manifest = load_manifest(args.qr_dir)['codes']
+
+    print("="*60)
+    print("🖨️  QR Print Verification")
+    print("="*60)
+    print(f"🔍 Decoder: {decoder}")
+    print(f"📦 Codes: {len(qr_files)}")
+    print(f"📉 Levels: 0-{MAX_LEVEL} (minimum margin {args.min_margin}, noise seed {args.seed})\n")
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        results = list(executor.map(scan_margin, iter_cells(qr_files, manifest, MAX_LEVEL, args.seed), chunksize=2))
+
+    failing = [(name, margin, payload) for name, margin, payload in results if margin < args.min_margin]
+    for name, margin, payload in sorted(results, key=lambda result: (result[1], result[0])):
+        if margin < 0:
+            print(f"   ❌ {name}: does not decode on the sheet")
+        elif margin < args.min_margin:
+            print(f"   ❌ {name}: margin {margin}")
+        elif margin == MAX_LEVEL:
+            continue
+        else:
+            print(f"   ✓ {name}: margin {margin}")
+
+    print("\n" + "="*60)
+    if failing:
+        print(f"❌ {len(failing)} of {len(results)} codes below margin {args.min_margin}")
+    else:
+        print(f"✅ All {len(results)} codes scan at margin {args.min_margin} or better")
+    print("="*60)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump([{'code': name, 'margin': margin, 'payload': payload}
+                       for name, margin, payload in results], f, indent=2)
+
+    sys.exit(1 if failing else 0)
+
+if __name__ == "__main__":
+    main()